@@ -1,3 +1,5 @@
 from .candle import Candle
+from .rollup import CandleRollup
+from .write_behind import CandleWriteBehind
 
-__all__ = ['Candle']
+__all__ = ['Candle', 'CandleRollup', 'CandleWriteBehind']
@@ -1,9 +1,16 @@
 import time
+from dataclasses import replace
+from typing import Iterator
+import numpy as np
 import pandas as pd
 from ..stock_address import StockAddress
 from ..price import Price
 from .env import EnvManageWorker
 from .storage import StorageDirector
+from .column_cache import ColumnCache
+from .load_cache import LoadCache
+from .column_buffer import ColumnBuffer
+from . import resample as resampler
 from simple_logger import init_logging, func_logging
 import warnings
 
@@ -15,6 +22,8 @@ class Candle:
 
     _env_manager: EnvManageWorker = None
     _storage: StorageDirector = None
+    _column_cache: ColumnCache = None
+    _load_cache: LoadCache = None
 
     @init_logging
     def __init__(self, address: StockAddress, candle_df: pd.DataFrame = None):
@@ -24,6 +33,8 @@ class Candle:
             candle_df: 캔들 데이터 DataFrame
         """
         self.address = address
+        self._columns = None
+        self._buffer = None
         self.candle_df = self._normalize_timestamp(candle_df) if candle_df is not None else None
         self.is_new = True
         self.is_partial = False
@@ -36,6 +47,70 @@ class Candle:
         if Candle._storage is None:
             env_config = Candle._env_manager()
             Candle._storage = StorageDirector(env_config)
+            Candle._column_cache = ColumnCache(env_config['cache_dir'])
+
+    @property
+    def candle_df(self) -> pd.DataFrame:
+        """
+        캔들 DataFrame
+
+        메모리 맵 Candle은 처음 접근할 때 복사본을 만들고,
+        update()로 추가 버퍼를 쓰는 Candle은 버퍼를 공유하는 뷰를 반환한다.
+        (이후 같은 timestamp 덮어쓰기는 버퍼를 복사한 뒤 수행하므로 이미 받은 DataFrame은 바뀌지 않음)
+        """
+        if self._candle_df is None and self._columns is not None:
+            if self._buffer is not None:
+                self._candle_df = self._buffer.to_frame()
+            else:
+                self._candle_df = pd.DataFrame({name: np.array(values) for name, values in self._columns.items()})
+        return self._candle_df
+
+    @candle_df.setter
+    def candle_df(self, df: pd.DataFrame) -> None:
+        # DataFrame이 교체되면 메모리 맵 컬럼/추가 버퍼는 더 이상 유효하지 않음
+        self._candle_df = df
+        self._columns = None
+        self._buffer = None
+
+    def _column(self, name: str) -> np.ndarray | None:
+        if self._columns is not None:
+            return self._columns[name]
+        if self._candle_df is None:
+            return None
+        if self._candle_df.empty and name not in self._candle_df.columns:
+            # 컬럼 없는 빈 DataFrame(pd.DataFrame())은 데이터 없음으로 취급
+            return None
+        return self._candle_df[name].to_numpy()
+
+    @property
+    def timestamp(self) -> np.ndarray | None:
+        """timestamp 컬럼 NumPy 배열 (메모리 맵 Candle은 읽기 전용 zero-copy 뷰)"""
+        return self._column('timestamp')
+
+    @property
+    def open(self) -> np.ndarray | None:
+        """open 컬럼 NumPy 배열"""
+        return self._column('open')
+
+    @property
+    def high(self) -> np.ndarray | None:
+        """high 컬럼 NumPy 배열"""
+        return self._column('high')
+
+    @property
+    def low(self) -> np.ndarray | None:
+        """low 컬럼 NumPy 배열"""
+        return self._column('low')
+
+    @property
+    def close(self) -> np.ndarray | None:
+        """close 컬럼 NumPy 배열"""
+        return self._column('close')
+
+    @property
+    def volume(self) -> np.ndarray | None:
+        """volume 컬럼 NumPy 배열"""
+        return self._column('volume')
 
     @staticmethod
     @func_logging(log_params=True)
@@ -54,10 +129,187 @@ class Candle:
         # 임시 인스턴스를 만들어 _storage 초기화 보장
         temp = Candle(address)
 
-        # 데이터 로드
-        load_worker = Candle._storage.get_load_worker()
-        df = load_worker(address, start_ts, end_ts)
+        # 데이터 로드 (load 캐시가 켜져 있으면 먼저 조회)
+        cache = Candle._load_cache
+        df = cache.get(address, start_ts, end_ts) if cache is not None else None
+        if df is None:
+            # 로드 도중 저장으로 무효화되면 오래된 결과를 캐시에 넣지 않도록 로드 전 세대 번호 기록
+            generation = cache.generation(address) if cache is not None else None
+            load_worker = Candle._storage.get_load_worker()
+            df = load_worker(address, start_ts, end_ts)
+            if cache is not None:
+                cache.put(address, start_ts, end_ts, df, generation)
+
+        return Candle._from_storage(address, df, start_ts)
+
+    @staticmethod
+    @func_logging(log_params=True)
+    def iter_chunks(address: StockAddress, start_ts: int = None, end_ts: int = None,
+                    chunk_rows: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        저장된 캔들 이력을 chunk_rows 행 이하 DataFrame으로 나눠 timestamp 순으로 반환
+
+        전체 이력을 한 번에 올리지 않으므로 수 년치 1s/1m 데이터를 일정한 메모리로 순회할 수 있다.
+        Parquet은 파티션/row group 단위로, MySQL은 서버 측 커서로 읽는다. load 캐시는 사용하지 않는다.
+
+        Args:
+            address: StockAddress 객체
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+            chunk_rows: chunk 당 최대 행 수 (기본 100,000)
+
+        Returns:
+            timestamp, high, low, open, close, volume 컬럼을 가진 DataFrame iterator
+
+        Raises:
+            ValueError: chunk_rows가 1 미만인 경우
+        """
+        # 임시 인스턴스를 만들어 _storage 초기화 보장
+        temp = Candle(address)
+
+        return Candle._storage.get_load_worker().iter_chunks(address, start_ts, end_ts, chunk_rows)
+
+    @staticmethod
+    def enable_load_cache(max_bytes: int = 512 * 1024 * 1024) -> LoadCache:
+        """
+        Candle.load/load_many 결과를 프로세스 내 LRU 캐시에 보관
+
+        save()/save_many()로 데이터가 바뀐 주소의 항목은 자동으로 제거된다.
+        다른 프로세스의 저장은 감지하지 못하므로 저장소를 공유하는 쓰기 프로세스가 있으면 주의.
+
+        Args:
+            max_bytes: 보관할 DataFrame 메모리 합계 상한 (기본 512MB)
+
+        Returns:
+            LoadCache 객체 (stats()로 hit/miss/eviction 조회)
+        """
+        Candle._load_cache = LoadCache(max_bytes)
+        return Candle._load_cache
+
+    @staticmethod
+    def disable_load_cache() -> None:
+        """load 캐시 끄기 (보관 항목 제거)"""
+        Candle._load_cache = None
+
+    @staticmethod
+    def load_cache_stats() -> dict | None:
+        """
+        load 캐시 상태 조회
+
+        Returns:
+            {"hits", "misses", "evictions", "entries", "bytes", "max_bytes"} (캐시가 꺼져 있으면 None)
+        """
+        if Candle._load_cache is None:
+            return None
+        return Candle._load_cache.stats()
+
+    @staticmethod
+    @func_logging(log_params=True)
+    def load_mapped(address: StockAddress) -> 'Candle':
+        """
+        로컬 컬럼 캐시를 메모리 맵으로 열어 전체 이력 로드
+
+        캐시가 없거나 저장소 버전(저장할 때마다 바뀌는 토큰)이 캐시를 만들 때와 다르면 저장소에서 읽어 캐시를 다시 만든다.
+        last_update_ts는 초 단위라 같은 초 안의 재저장을 구분하지 못하므로 저장소 버전을 함께 키로 사용한다.
+        반환된 Candle의 timestamp/open/high/low/close/volume은 복사 없는 읽기 전용 뷰이며,
+        같은 캐시를 여는 프로세스들은 페이지 캐시를 공유한다.
+
+        Args:
+            address: StockAddress 객체
+
+        Returns:
+            메모리 맵 컬럼을 가진 Candle 객체
+        """
+        # 임시 인스턴스를 만들어 _storage 초기화 보장
+        temp = Candle(address)
+
+        # 저장소 버전 + 마지막 업데이트 시각을 캐시 버전으로 사용
+        last_update_ts = Candle._storage.get_metadata_worker().get_last_update_ts(address)
+        version = f"{Candle._storage.get_load_worker().version(address)}@{last_update_ts}"
+
+        columns = Candle._column_cache.read(address, version)
+        if columns is None:
+            df = Candle._storage.get_load_worker()(address)
+            Candle._column_cache.write(address, df, version)
+            columns = Candle._column_cache.read(address, version)
+
+        candle = Candle(address)
+        candle._columns = columns
+        candle.is_new = False
+        candle.storage_last_ts = int(columns['timestamp'][-1]) if len(columns['timestamp']) else 0
+        return candle
+
+    @staticmethod
+    @func_logging(log_params=True)
+    def load_many(addresses: list[StockAddress], start_ts: int = None, end_ts: int = None) -> list['Candle']:
+        """
+        여러 주소의 캔들 데이터를 동시에 로드
+
+        Args:
+            addresses: StockAddress 리스트
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+
+        Returns:
+            addresses 순서와 같은 Candle 리스트
+        """
+        if not addresses:
+            return []
+
+        # 임시 인스턴스를 만들어 _storage 초기화 보장
+        temp = Candle(addresses[0])
+
+        cache = Candle._load_cache
+        if cache is None:
+            dfs = Candle._storage.load_many(addresses, start_ts, end_ts)
+        else:
+            # 캐시에 없는 주소만 저장소에서 일괄 로드
+            dfs = [cache.get(address, start_ts, end_ts) for address in addresses]
+            missing = [i for i, df in enumerate(dfs) if df is None]
+            generations = [cache.generation(addresses[i]) for i in missing]
+            loaded = Candle._storage.load_many([addresses[i] for i in missing], start_ts, end_ts)
+            for i, generation, df in zip(missing, generations, loaded):
+                cache.put(addresses[i], start_ts, end_ts, df, generation)
+                dfs[i] = df
+
+        return [Candle._from_storage(address, df, start_ts) for address, df in zip(addresses, dfs)]
+
+    @staticmethod
+    @func_logging
+    def save_many(candles: list['Candle']) -> None:
+        """
+        여러 Candle을 동시에 저장 (메타데이터는 한 번에 기록)
+
+        Args:
+            candles: Candle 리스트 (주소 중복 불가)
+        """
+        if not candles:
+            return
+
+        # 임시 인스턴스를 만들어 _storage 초기화 보장
+        temp = Candle(candles[0].address)
+
+        try:
+            Candle._storage.save_many(candles)
+        finally:
+            for candle in candles:
+                Candle._column_cache.invalidate(candle.address)
+                if Candle._load_cache is not None:
+                    Candle._load_cache.invalidate(candle.address)
 
+    @staticmethod
+    def _from_storage(address: StockAddress, df: pd.DataFrame, start_ts: int = None) -> 'Candle':
+        """
+        저장소에서 읽은 DataFrame으로 Candle 객체 생성
+
+        Args:
+            address: StockAddress 객체
+            df: 로드된 DataFrame
+            start_ts: 로드 시작 타임스탬프 (부분 로드 여부 판단)
+
+        Returns:
+            Candle 객체
+        """
         # Candle 객체 생성
         candle = Candle(address, df)
         candle.is_new = False
@@ -86,19 +338,31 @@ class Candle:
         save_worker = Candle._storage.get_save_worker()
         save_worker(self.address, self.candle_df, self.storage_last_ts)
 
+        # 빈 구간 인덱스 갱신 (저장 전 storage_last_ts 기준)
+        metadata_worker = Candle._storage.get_metadata_worker()
+        metadata_worker.update_gaps(self.address, self.timestamp, self.storage_last_ts)
+
         # 저장 후 상태 업데이트
         self.is_new = False
         self.storage_last_ts = int(self.candle_df['timestamp'].iloc[-1])
 
         # 메타데이터 업데이트 (현재 시간으로 저장)
-        metadata_worker = Candle._storage.get_metadata_worker()
         metadata_worker.set_last_update_ts(self.address, int(time.time()))
 
+        # 같은 초 안의 재저장은 버전으로 구분되지 않으므로 컬럼 캐시 명시적 무효화
+        Candle._column_cache.invalidate(self.address)
+        if Candle._load_cache is not None:
+            Candle._load_cache.invalidate(self.address)
+
     @func_logging
     def update(self, new_df: pd.DataFrame, save_immediately: bool = False) -> None:
         """
         온메모리 병합
 
+        새 데이터가 현재 마지막 timestamp 이상에서 시작하면 증가형 버퍼에 추가만 하고
+        (같은 timestamp는 마지막 행 덮어쓰기), 순서가 어긋난 경우에만 전체 병합/정렬을 수행한다.
+        저장된 구간 안쪽 행(빈 구간 채우기)이 병합되면 다음 save()는 그 지점부터 다시 기록한다.
+
         Args:
             new_df: 새로운 데이터 DataFrame
             save_immediately: True면 자동으로 save() 호출
@@ -108,16 +372,65 @@ class Candle:
 
         if self.candle_df is None or self.candle_df.empty:
             self.candle_df = new_df.copy()
-        else:
+        elif not self._append_in_order(new_df):
+            loaded_first_ts = int(self.timestamp.min())
+
             # timestamp 기준으로 병합 (중복 제거)
             combined = pd.concat([self.candle_df, new_df], ignore_index=True)
             combined = combined.drop_duplicates(subset=['timestamp'], keep='last')
             combined = combined.sort_values('timestamp').reset_index(drop=True)
             self.candle_df = combined
 
+            # 저장된 구간 안쪽(빈 구간 채우기 등)에 들어온 행도 다음 save()에서 기록되도록 storage_last_ts를 낮춘다.
+            # 부분 로드된 Candle은 로드 범위 앞쪽 저장 데이터를 갖고 있지 않으므로 로드 범위 안에서만 낮춘다.
+            new_first_ts = int(new_df['timestamp'].min())
+            if self.storage_last_ts is not None and new_first_ts < self.storage_last_ts:
+                if not self.is_partial or new_first_ts >= loaded_first_ts:
+                    self.storage_last_ts = new_first_ts
+
         if save_immediately:
             self.save()
 
+    def _append_in_order(self, new_df: pd.DataFrame) -> bool:
+        """
+        새 데이터가 현재 마지막 timestamp 이상에서 시작하면 추가 버퍼에 바로 붙이기
+
+        전체 concat/정렬 없이 새 행만 복사하며, 마지막 timestamp와 겹치면 마지막 행만 덮어쓴다.
+
+        Args:
+            new_df: 정규화된 새 DataFrame
+
+        Returns:
+            처리했으면 True, 순서가 맞지 않거나 컬럼 구성이 달라 일반 병합이 필요하면 False
+        """
+        if new_df is None or new_df.empty:
+            return False
+
+        current = self.candle_df
+        if list(new_df.columns) != list(current.columns):
+            return False
+
+        new_ts = new_df['timestamp'].to_numpy()
+        if not ColumnBuffer.is_sorted_unique(new_ts):
+            new_df = new_df.drop_duplicates(subset=['timestamp'], keep='last').sort_values('timestamp')
+            new_ts = new_df['timestamp'].to_numpy()
+
+        buffer = self._buffer
+        if buffer is None:
+            # 첫 추가 시 한 번만 기존 데이터를 버퍼로 복사 (정렬/중복 없음이 보장될 때만)
+            current_ts = current['timestamp'].to_numpy()
+            if new_ts[0] < current_ts[-1] or not ColumnBuffer.is_sorted_unique(current_ts):
+                return False
+            buffer = ColumnBuffer(current)
+
+        if not buffer.append(new_df):
+            return False
+
+        self._buffer = buffer
+        self._columns = buffer.columns()
+        self._candle_df = None
+        return True
+
     @staticmethod
     def _normalize_timestamp(df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -166,6 +479,29 @@ class Candle:
             return None
         return int(self.candle_df['timestamp'].iloc[-1])
 
+    @func_logging
+    def resample(self, timeframe: str) -> 'Candle':
+        """
+        상위 timeframe 캔들로 집계한 새 Candle 반환 (온메모리, 저장하지 않음)
+
+        버킷은 UTC 자정(주 단위는 월요일) 기준으로 정렬되며 open=first, high=max, low=min, close=last, volume=sum.
+        저장소에 파생 캔들을 유지하려면 CandleRollup을 사용한다.
+
+        Args:
+            timeframe: 파생 timeframe (기준 timeframe 간격의 배수, 예: '5m', '1h')
+
+        Returns:
+            timeframe만 바꾼 StockAddress를 가진 새 Candle (is_new=True)
+
+        Raises:
+            ValueError: 간격이 일정하지 않거나 기준 간격의 배수가 아닌 경우
+        """
+        target = replace(self.address, timeframe=timeframe)
+        step = target.timeframe_seconds()
+        resampler.check_steps(self.address.timeframe_seconds(), step)
+
+        return Candle(target, resampler.resample(self.candle_df, step))
+
     @func_logging
     def get_price_by_iloc(self, idx: int) -> Price:
         """
@@ -234,6 +570,69 @@ class Candle:
         metadata_worker = Candle._storage.get_metadata_worker()
         return metadata_worker.get_last_update_ts(address)
 
+    @staticmethod
+    @func_logging
+    def get_last_update_ts_many(addresses: list[StockAddress]) -> list[int | None]:
+        """
+        여러 주소의 마지막 업데이트 타임스탬프를 한 번에 조회 (데이터 로드 없이)
+
+        Args:
+            addresses: StockAddress 리스트
+
+        Returns:
+            addresses 순서와 같은 타임스탬프 리스트 (없으면 None)
+        """
+        if not addresses:
+            return []
+
+        # 임시 인스턴스를 만들어 _storage 초기화 보장
+        temp = Candle(addresses[0])
+
+        metadata_worker = Candle._storage.get_metadata_worker()
+        return metadata_worker.get_many(addresses)
+
+    @staticmethod
+    @func_logging
+    def get_storage_last_ts(address: StockAddress) -> int | None:
+        """
+        저장소에 기록된 마지막 캔들 타임스탬프 조회 (전체 로드 없이)
+
+        중단된 백필을 이어받을 때 시작점으로 사용한다.
+
+        Args:
+            address: StockAddress 객체
+
+        Returns:
+            마지막 캔들 타임스탬프 (데이터가 없으면 None)
+        """
+        # 임시 인스턴스를 만들어 _storage 초기화 보장
+        temp = Candle(address)
+
+        return Candle._storage.get_load_worker().last_timestamp(address)
+
+    @staticmethod
+    @func_logging
+    def get_gaps(address: StockAddress, start_ts: int = None, end_ts: int = None) -> list[tuple[int, int]]:
+        """
+        저장된 이력의 빈 구간 조회 (데이터 로드 없이)
+
+        저장 시 StockAddress.timeframe 간격보다 벌어진 곳을 기록해 둔 인덱스를 읽는다.
+        백필은 전체 범위 대신 이 구간만 다시 받으면 된다. 월 단위 등 간격이 일정하지 않은 timeframe은 기록하지 않는다.
+
+        Args:
+            address: StockAddress 객체
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+
+        Returns:
+            [(start_ts, end_ts), ...] 빠진 캔들 구간 (범위 경계로 잘림, 시간 순)
+        """
+        # 임시 인스턴스를 만들어 _storage 초기화 보장
+        temp = Candle(address)
+
+        metadata_worker = Candle._storage.get_metadata_worker()
+        return metadata_worker.get_gaps(address, start_ts, end_ts)
+
     @staticmethod
     @func_logging
     def get_time_since_last_update(address: StockAddress) -> int | None:
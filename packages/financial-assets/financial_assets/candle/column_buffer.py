@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+
+class ColumnBuffer:
+    """
+    timestamp 순으로 정렬된 캔들 컬럼을 담는 증가형 버퍼
+
+    용량을 두 배씩 늘리며 뒤에 추가하므로 한 건 추가 비용은 분할상환 O(1)이다.
+    to_frame()은 버퍼를 복사하지 않는 DataFrame 뷰를 반환하고, 그 뒤 마지막 행을
+    덮어써야 하면(같은 timestamp 갱신) 먼저 버퍼를 새 배열로 옮겨(copy-on-write)
+    이전에 받은 DataFrame은 바뀌지 않는다.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: timestamp 오름차순, 중복 없는 DataFrame
+        """
+        self.names = list(df.columns)
+        self._size = len(df)
+        capacity = max(self.INITIAL_CAPACITY, self._size * 2)
+
+        self._arrays = {}
+        for name in self.names:
+            values = df[name].to_numpy()
+            array = np.empty(capacity, dtype=values.dtype)
+            array[:self._size] = values
+            self._arrays[name] = array
+
+        # to_frame()으로 내보낸 DataFrame이 현재 배열을 공유하는지
+        self._exported = False
+
+    @staticmethod
+    def is_sorted_unique(timestamps: np.ndarray) -> bool:
+        """timestamp가 순증가(정렬 + 중복 없음)인지"""
+        return len(timestamps) < 2 or bool(np.all(timestamps[1:] > timestamps[:-1]))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def last_timestamp(self):
+        return self._arrays['timestamp'][self._size - 1] if self._size else None
+
+    def append(self, df: pd.DataFrame) -> bool:
+        """
+        마지막 timestamp 이상으로 시작하는 행을 뒤에 추가
+
+        첫 행의 timestamp가 마지막 timestamp와 같으면 마지막 행을 덮어쓴다.
+
+        Args:
+            df: 추가할 DataFrame (timestamp 오름차순, 중복 없음, 같은 컬럼 구성)
+
+        Returns:
+            추가했으면 True, 순서가 맞지 않아 추가할 수 없으면 False (일반 병합 필요)
+        """
+        if list(df.columns) != self.names:
+            return False
+        if df.empty:
+            return True
+
+        timestamps = df['timestamp'].to_numpy()
+        last = self.last_timestamp()
+        if last is not None and timestamps[0] < last:
+            return False
+
+        # 같은 timestamp면 마지막 행부터 덮어쓰기
+        start = self._size - 1 if last is not None and timestamps[0] == last else self._size
+        end = start + len(df)
+
+        capacity = len(self._arrays['timestamp'])
+        if end > capacity or (start < self._size and self._exported):
+            # 용량이 모자라거나 내보낸 DataFrame이 보는 행을 덮어써야 하면 새 배열로 옮긴다
+            while capacity < end:
+                capacity *= 2
+            self._reallocate(capacity)
+
+        for name in self.names:
+            values = df[name].to_numpy()
+            if not np.can_cast(values.dtype, self._arrays[name].dtype, casting='safe'):
+                # 값 손실 없이 담을 수 없으면(float64 -> float32 등) 버퍼를 넓은 dtype으로 재할당
+                self._arrays[name] = self._arrays[name].astype(np.result_type(values.dtype, self._arrays[name].dtype))
+            self._arrays[name][start:end] = values
+
+        self._size = end
+        return True
+
+    def _reallocate(self, capacity: int) -> None:
+        for name, array in self._arrays.items():
+            grown = np.empty(capacity, dtype=array.dtype)
+            grown[:self._size] = array[:self._size]
+            self._arrays[name] = grown
+        self._exported = False
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """컬럼별 유효 구간 뷰"""
+        return {name: self._arrays[name][:self._size] for name in self.names}
+
+    def to_frame(self) -> pd.DataFrame:
+        """버퍼를 공유하는 DataFrame 뷰 (이후 덮어쓰기는 copy-on-write로 이 DataFrame에 반영되지 않음)"""
+        self._exported = True
+        return pd.DataFrame(self.columns(), copy=False)
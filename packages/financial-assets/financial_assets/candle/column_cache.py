@@ -0,0 +1,130 @@
+import json
+import os
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from ..stock_address import StockAddress
+from simple_logger import init_logging, func_logging
+
+
+class ColumnCache:
+    """
+    메모리 맵 가능한 로컬 컬럼 캐시
+
+    주소별 디렉토리에 컬럼당 .npy 파일 하나를 두고 np.load(mmap_mode='r')로 연다.
+    여러 프로세스가 같은 캐시를 열면 OS 페이지 캐시를 공유하므로 이력 복사본을 각자 들고 있지 않는다.
+
+    레이아웃:
+        {cache_dir}/{address.to_filename()}/_meta.json
+        {cache_dir}/{address.to_filename()}/{column}.{version}.npy
+
+    새 버전은 다른 이름의 파일로 기록한 뒤 _meta.json을 원자적으로 교체한다.
+    이미 열린 메모리 맵은 이전 파일이 삭제되어도 유효하다 (POSIX).
+    """
+
+    COLUMNS = ('timestamp', 'high', 'low', 'open', 'close', 'volume')
+    DTYPES = {'timestamp': np.int64}
+    META_FILENAME = '_meta.json'
+
+    @init_logging
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir: 캐시 루트 디렉토리
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _dirpath(self, address: StockAddress) -> Path:
+        return self.cache_dir / address.to_filename()
+
+    def _read_meta(self, address: StockAddress) -> dict | None:
+        path = self._dirpath(address) / self.META_FILENAME
+        if not path.exists():
+            return None
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    @func_logging
+    def read(self, address: StockAddress, source_version: str | None = None) -> dict[str, np.ndarray] | None:
+        """
+        캐시된 컬럼을 읽기 전용 메모리 맵으로 열기
+
+        Args:
+            address: StockAddress 객체
+            source_version: 기대하는 원본 버전 (저장할 때마다 바뀌는 저장소 버전 토큰). 다르면 캐시 무효
+
+        Returns:
+            {컬럼명: np.memmap} (캐시가 없거나 오래되었으면 None)
+        """
+        meta = self._read_meta(address)
+        if meta is None or meta.get('source_version') != source_version:
+            return None
+
+        dirpath = self._dirpath(address)
+        try:
+            return {
+                column: np.load(dirpath / f"{column}.{meta['version']}.npy", mmap_mode='r')
+                for column in self.COLUMNS
+            }
+        except FileNotFoundError:
+            # 다른 프로세스가 교체 중인 경우
+            return None
+
+    @func_logging
+    def write(self, address: StockAddress, df: pd.DataFrame, source_version: str | None = None) -> None:
+        """
+        DataFrame을 컬럼별 .npy로 기록
+
+        Args:
+            address: StockAddress 객체
+            df: timestamp, high, low, open, close, volume 컬럼을 가진 DataFrame
+            source_version: 원본 버전 (저장할 때마다 바뀌는 저장소 버전 토큰)
+        """
+        dirpath = self._dirpath(address)
+        dirpath.mkdir(parents=True, exist_ok=True)
+
+        previous = self._read_meta(address)
+        version = (previous['version'] + 1) if previous else 0
+
+        for column in self.COLUMNS:
+            values = np.ascontiguousarray(df[column].to_numpy(dtype=self._dtype_of(column, df[column])))
+            # 같은 이름의 파일이 다른 프로세스에 매핑되어 있어도 덮어쓰지 않도록 새 inode로 교체
+            tmp = dirpath / f"{column}.{version}.npy.tmp"
+            with open(tmp, 'wb') as f:
+                np.save(f, values)
+            os.replace(tmp, dirpath / f"{column}.{version}.npy")
+
+        tmp = dirpath / f"{self.META_FILENAME}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump({'version': version, 'source_version': source_version, 'rows': len(df)}, f)
+        os.replace(tmp, dirpath / self.META_FILENAME)
+
+        # 이전 버전 파일 정리
+        if previous:
+            for column in self.COLUMNS:
+                (dirpath / f"{column}.{previous['version']}.npy").unlink(missing_ok=True)
+
+    def _dtype_of(self, column: str, series: pd.Series) -> np.dtype:
+        """저장 dtype: timestamp는 int64, float32 컬럼은 그대로, 나머지는 float64"""
+        if column in self.DTYPES:
+            return self.DTYPES[column]
+        if series.dtype == np.float32:
+            return np.float32
+        return np.float64
+
+    @func_logging
+    def invalidate(self, address: StockAddress) -> None:
+        """
+        주소의 캐시 무효화
+
+        Args:
+            address: StockAddress 객체
+        """
+        meta = self._read_meta(address)
+        if meta is None:
+            return
+
+        dirpath = self._dirpath(address)
+        (dirpath / self.META_FILENAME).unlink(missing_ok=True)
+        for column in self.COLUMNS:
+            (dirpath / f"{column}.{meta['version']}.npy").unlink(missing_ok=True)
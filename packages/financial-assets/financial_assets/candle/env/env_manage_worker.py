@@ -40,6 +40,9 @@ class EnvManageWorker:
         else:
             raise ValueError(f"Unsupported storage strategy: {strategy}")
 
+        config.update(self._load_dtype_config(env_path))
+        config.update(self._load_cache_config(env_path))
+
         return config
 
     @func_logging
@@ -52,6 +55,26 @@ class EnvManageWorker:
 
         return {'basepath': basepath}
 
+    @func_logging
+    def _load_dtype_config(self, env_path: str) -> dict:
+        """저장 dtype 프로파일 환경변수 로드 (float64, float32, scaled)"""
+        profile = os.getenv('FA_CANDLE_STORAGE_DTYPE_PROFILE')
+        if not profile:
+            profile = 'float64'
+            set_key(env_path, 'FA_CANDLE_STORAGE_DTYPE_PROFILE', profile)
+
+        return {'dtype_profile': profile}
+
+    @func_logging
+    def _load_cache_config(self, env_path: str) -> dict:
+        """로컬 컬럼 캐시(메모리 맵) 환경변수 로드"""
+        cache_dir = os.getenv('FA_CANDLE_CACHE_DIR')
+        if not cache_dir:
+            cache_dir = './data/fa_candles_cache/'
+            set_key(env_path, 'FA_CANDLE_CACHE_DIR', cache_dir)
+
+        return {'cache_dir': cache_dir}
+
     @func_logging
     def _load_mysql_config(self, env_path: str) -> dict:
         """MySQL 전략 환경변수 로드"""
@@ -63,7 +86,9 @@ class EnvManageWorker:
             'FA_CANDLE_STORAGE_MYSQL_PORT': '3306',
             'FA_CANDLE_STORAGE_MYSQL_DBNAME': 'fa$candles',
             'FA_CANDLE_STORAGE_MYSQL_USERNAME': 'root',
-            'FA_CANDLE_STORAGE_MYSQL_PASSWORD': ''
+            'FA_CANDLE_STORAGE_MYSQL_PASSWORD': '',
+            'FA_CANDLE_STORAGE_MYSQL_POOL_SIZE': '5',
+            'FA_CANDLE_STORAGE_MYSQL_MAX_OVERFLOW': '10'
         }
 
         for key, default_value in defaults.items():
@@ -72,11 +97,13 @@ class EnvManageWorker:
                 value = default_value
                 set_key(env_path, key, value)
 
-            # dict 키는 소문자로 (host, port, dbname, username, password)
+            # dict 키는 소문자로 (host, port, dbname, username, password, pool_size, max_overflow)
             config_key = key.replace('FA_CANDLE_STORAGE_MYSQL_', '').lower()
             config[config_key] = value
 
-        # PORT는 int로 변환
+        # PORT, 커넥션 풀 크기는 int로 변환
         config['port'] = int(config['port'])
+        config['pool_size'] = int(config['pool_size'])
+        config['max_overflow'] = int(config['max_overflow'])
 
         return config
@@ -0,0 +1,184 @@
+from collections import OrderedDict
+from threading import Lock
+import pandas as pd
+from ..stock_address import StockAddress
+from simple_logger import init_logging, func_logging
+
+
+class LoadCache:
+    """
+    Candle.load 결과를 (주소, 범위) 단위로 보관하는 프로세스 내 LRU 캐시
+
+    요청 범위가 캐시된 범위에 포함되면 슬라이싱해서 반환한다.
+    전체 DataFrame 메모리 사용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거한다.
+    저장으로 데이터가 바뀐 주소는 invalidate()로 모든 항목을 제거한다.
+
+    항목은 주소별로 색인하므로 조회는 해당 주소의 항목만 확인한다.
+    주소마다 세대 번호를 두고 invalidate()가 올리므로, 저장소 로드 전에 generation()으로 받아 둔 번호를
+    put()에 넘기면 로드 도중 무효화된 (오래된) 결과는 다시 들어가지 않는다.
+    """
+
+    @init_logging
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: 캐시에 보관할 DataFrame 메모리 합계 상한 (바이트)
+        """
+        self.max_bytes = max_bytes
+        # 전체 LRU 순서 {(address_key, start_ts, end_ts): (df, size)}
+        self._entries: OrderedDict = OrderedDict()
+        # 주소별 색인 {address_key: OrderedDict[(start_ts, end_ts), None]} (최근 사용 순)
+        self._by_address: dict[str, OrderedDict] = {}
+        # 주소별 세대 번호 (invalidate마다 증가)
+        self._generations: dict[str, int] = {}
+        self._bytes = 0
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _contains(cached: tuple, start_ts: int | None, end_ts: int | None) -> bool:
+        """캐시된 [start, end) 범위가 요청 범위를 포함하는지 (None은 무한대)"""
+        cached_start, cached_end = cached
+        if cached_start is not None and (start_ts is None or start_ts < cached_start):
+            return False
+        if cached_end is not None and (end_ts is None or end_ts > cached_end):
+            return False
+        return True
+
+    @func_logging
+    def get(self, address: StockAddress, start_ts: int = None, end_ts: int = None) -> pd.DataFrame | None:
+        """
+        캐시 조회
+
+        Args:
+            address: StockAddress 객체
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+
+        Returns:
+            요청 범위 DataFrame 복사본 (없으면 None)
+        """
+        address_key = address.to_filename()
+        with self._lock:
+            ranges = self._by_address.get(address_key, ())
+            for cached in reversed(ranges):
+                if not self._contains(cached, start_ts, end_ts):
+                    continue
+
+                key = (address_key, *cached)
+                df = self._entries[key][0]
+                self._entries.move_to_end(key)
+                ranges.move_to_end(cached)
+                self.hits += 1
+
+                # 캐시된 범위와 같으면 그대로, 아니면 정렬된 timestamp로 슬라이싱
+                if cached != (start_ts, end_ts) and not df.empty:
+                    timestamps = df['timestamp'].to_numpy()
+                    begin = 0 if start_ts is None else int(timestamps.searchsorted(start_ts, side='left'))
+                    end = len(df) if end_ts is None else int(timestamps.searchsorted(end_ts, side='left'))
+                    df = df.iloc[begin:end].reset_index(drop=True)
+
+                # 호출자가 DataFrame을 수정해도 캐시가 바뀌지 않도록 복사본 반환
+                return df.copy()
+
+            self.misses += 1
+            return None
+
+    def generation(self, address: StockAddress) -> int:
+        """
+        주소의 현재 세대 번호 (저장소에서 로드하기 전에 받아 put()에 넘긴다)
+
+        Args:
+            address: StockAddress 객체
+
+        Returns:
+            세대 번호
+        """
+        with self._lock:
+            return self._generations.get(address.to_filename(), 0)
+
+    @func_logging
+    def put(self, address: StockAddress, start_ts: int, end_ts: int, df: pd.DataFrame,
+            generation: int = None) -> None:
+        """
+        로드 결과 저장
+
+        Args:
+            address: StockAddress 객체
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+            df: 로드된 DataFrame
+            generation: 로드 전에 generation()으로 받은 세대 번호. 그 사이 무효화되었으면 저장하지 않음
+        """
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        address_key = address.to_filename()
+        key = (address_key, start_ts, end_ts)
+        with self._lock:
+            if generation is not None and generation != self._generations.get(address_key, 0):
+                return
+
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+
+            self._entries[key] = (df.copy(), size)
+            self._by_address.setdefault(address_key, OrderedDict())[(start_ts, end_ts)] = None
+            self._by_address[address_key].move_to_end((start_ts, end_ts))
+            self._bytes += size
+
+            # LRU 제거
+            while self._bytes > self.max_bytes:
+                evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+                self._unindex(evicted_key)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def _unindex(self, key: tuple) -> None:
+        """주소별 색인에서 항목 제거 (lock 안에서 호출)"""
+        ranges = self._by_address[key[0]]
+        del ranges[key[1:]]
+        if not ranges:
+            del self._by_address[key[0]]
+
+    @func_logging
+    def invalidate(self, address: StockAddress) -> None:
+        """
+        주소의 모든 캐시 항목 제거 후 세대 번호 증가
+
+        Args:
+            address: StockAddress 객체
+        """
+        address_key = address.to_filename()
+        with self._lock:
+            self._generations[address_key] = self._generations.get(address_key, 0) + 1
+            for cached in self._by_address.pop(address_key, ()):
+                self._bytes -= self._entries.pop((address_key, *cached))[1]
+
+    def clear(self) -> None:
+        """전체 캐시 비우기 (카운터 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._by_address.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """
+        캐시 상태
+
+        Returns:
+            {"hits", "misses", "evictions", "entries", "bytes", "max_bytes"}
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+
+COLUMNS = ['timestamp', 'high', 'low', 'open', 'close', 'volume']
+
+# 버킷 정렬 기준: UTC 자정. 주 단위는 1970-01-05(월요일) 기준 (1970-01-01은 목요일)
+WEEK_SECONDS = 604800
+WEEK_OFFSET = 4 * 86400
+
+
+def bucket_offset(step: int) -> int:
+    """
+    캔들 간격별 버킷 정렬 오프셋
+
+    Args:
+        step: 파생 캔들 간격 (초)
+
+    Returns:
+        버킷 시작 = (timestamp - offset) // step * step + offset 의 offset
+    """
+    return WEEK_OFFSET if step % WEEK_SECONDS == 0 else 0
+
+
+def bucket_start(timestamps, step: int):
+    """
+    timestamp가 속한 버킷의 시작 timestamp
+
+    Args:
+        timestamps: timestamp 배열 또는 정수 (초)
+        step: 파생 캔들 간격 (초)
+
+    Returns:
+        버킷 시작 timestamp (입력과 같은 형태)
+    """
+    offset = bucket_offset(step)
+    return (timestamps - offset) // step * step + offset
+
+
+def check_steps(base_step: int | None, target_step: int | None) -> None:
+    """
+    기준 간격에서 파생 간격을 만들 수 있는지 확인
+
+    Raises:
+        ValueError: 간격이 일정하지 않거나 파생 간격이 기준 간격의 배수가 아닌 경우
+    """
+    if base_step is None or target_step is None:
+        raise ValueError("Resampling requires fixed-interval timeframes")
+    if target_step < base_step or target_step % base_step != 0:
+        raise ValueError(f"Target step {target_step}s is not a multiple of base step {base_step}s")
+
+
+def resample(df: pd.DataFrame, step: int) -> pd.DataFrame:
+    """
+    캔들을 step 간격 버킷으로 집계 (open=first, high=max, low=min, close=last, volume=sum)
+
+    groupby 없이 버킷 경계 인덱스와 ufunc.reduceat으로 한 번에 계산한다.
+    high/low는 NaN을 건너뛰고(fmax/fmin), 컬럼 dtype(float32 등)은 유지한다.
+    캔들이 없는 버킷은 만들지 않으며, 마지막 버킷은 기준 캔들이 덜 모였어도 포함한다.
+
+    Args:
+        df: timestamp, high, low, open, close, volume 컬럼을 가진 DataFrame
+        step: 파생 캔들 간격 (초)
+
+    Returns:
+        버킷 시작 timestamp 순 DataFrame (COLUMNS 순서)
+    """
+    if df is None or df.empty:
+        return pd.DataFrame(columns=COLUMNS)
+
+    timestamps = df['timestamp'].to_numpy(dtype=np.int64)
+    if len(timestamps) > 1 and not np.all(timestamps[1:] > timestamps[:-1]):
+        df = df.drop_duplicates(subset=['timestamp'], keep='last').sort_values('timestamp')
+        timestamps = df['timestamp'].to_numpy(dtype=np.int64)
+
+    buckets = bucket_start(timestamps, step)
+    starts = np.flatnonzero(np.concatenate([[True], buckets[1:] != buckets[:-1]]))
+    lasts = np.concatenate([starts[1:], [len(buckets)]]) - 1
+
+    return pd.DataFrame({
+        'timestamp': buckets[starts],
+        'high': np.fmax.reduceat(df['high'].to_numpy(), starts),
+        'low': np.fmin.reduceat(df['low'].to_numpy(), starts),
+        'open': df['open'].to_numpy()[starts],
+        'close': df['close'].to_numpy()[lasts],
+        'volume': np.add.reduceat(df['volume'].to_numpy(), starts),
+    })
@@ -0,0 +1,123 @@
+from dataclasses import replace
+import pandas as pd
+from ..stock_address import StockAddress
+from .candle import Candle
+from . import resample as resampler
+from simple_logger import init_logging, func_logging
+
+
+class _RollupTarget:
+    """파생 timeframe 하나의 집계 상태 (chunk 경계에 걸친 마지막 버킷의 기준 캔들을 다음 chunk로 넘긴다)"""
+
+    def __init__(self, address: StockAddress, step: int, resume_ts: int | None, stored_last_ts: int | None):
+        self.address = address
+        self.step = step
+        self.resume_ts = resume_ts
+        self.stored_last_ts = stored_last_ts
+        self.carry = None
+        self.frames = []
+
+    def feed(self, chunk: pd.DataFrame) -> None:
+        if self.resume_ts is not None:
+            chunk = chunk[chunk['timestamp'] >= self.resume_ts]
+        if self.carry is not None:
+            chunk = pd.concat([self.carry, chunk], ignore_index=True)
+        if chunk.empty:
+            return
+
+        # 마지막 버킷은 다음 chunk에 이어질 수 있으므로 넘기고 나머지만 집계
+        timestamps = chunk['timestamp'].to_numpy()
+        cut = int(timestamps.searchsorted(resampler.bucket_start(int(timestamps[-1]), self.step), side='left'))
+        if cut > 0:
+            self.frames.append(resampler.resample(chunk.iloc[:cut], self.step))
+        self.carry = chunk.iloc[cut:].reset_index(drop=True)
+
+    def finish(self) -> pd.DataFrame:
+        if self.carry is not None and not self.carry.empty:
+            self.frames.append(resampler.resample(self.carry, self.step))
+        self.carry = None
+
+        frames = [df for df in self.frames if not df.empty]
+        self.frames = []
+        if not frames:
+            return pd.DataFrame(columns=resampler.COLUMNS)
+        return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+
+class CandleRollup:
+    """
+    기준 timeframe 캔들에서 상위 timeframe 캔들을 파생해 저장소에 materialize
+
+    파생 캔들은 timeframe만 바꾼 StockAddress로 기준 캔들과 같은 저장소에 저장된다.
+    refresh()는 파생 timeframe마다 저장된 마지막 버킷부터 다시 계산하므로,
+    기준 캔들이 추가될 때마다 호출해도 새로 들어온 구간만 읽고 쓴다.
+    """
+
+    @init_logging
+    def __init__(self, base: StockAddress, timeframes: list[str], chunk_rows: int = 100_000):
+        """
+        Args:
+            base: 기준 캔들 StockAddress
+            timeframes: 파생할 timeframe 목록 (예: ['5m', '1h', '1d'])
+            chunk_rows: 기준 캔들을 읽는 chunk 당 행 수
+
+        Raises:
+            ValueError: 간격이 일정하지 않거나 기준 간격의 배수가 아닌 timeframe이 있는 경우
+        """
+        self.base = base
+        self.chunk_rows = chunk_rows
+        self.targets = [replace(base, timeframe=timeframe) for timeframe in timeframes]
+
+        base_step = base.timeframe_seconds()
+        for target in self.targets:
+            resampler.check_steps(base_step, target.timeframe_seconds())
+
+    @func_logging
+    def refresh(self, start_ts: int = None) -> dict[str, int]:
+        """
+        파생 캔들을 기준 캔들에 맞춰 갱신
+
+        파생 timeframe마다 저장된 마지막 버킷(진행 중이었을 수 있음)부터 기준 캔들을 한 번만 순회하며 집계하고,
+        그 지점 이후를 새 결과로 교체 저장한다. 이미 파생된 구간 안쪽의 기준 캔들이 바뀐 경우(빈 구간 백필 등)는
+        start_ts를 지정하면 그 버킷부터 다시 계산한다.
+
+        Args:
+            start_ts: 이 타임스탬프가 속한 버킷부터 강제로 다시 계산 (None이면 저장된 마지막 버킷부터)
+
+        Returns:
+            {파생 address.to_filename(): 저장한 캔들 수}
+        """
+        states = []
+        for target in self.targets:
+            step = target.timeframe_seconds()
+            stored_last_ts = Candle.get_storage_last_ts(target)
+
+            resume_ts = stored_last_ts
+            if start_ts is not None:
+                forced = int(resampler.bucket_start(start_ts, step))
+                resume_ts = forced if resume_ts is None else min(resume_ts, forced)
+            states.append(_RollupTarget(target, step, resume_ts, stored_last_ts))
+
+        # 모든 파생 timeframe 중 가장 앞선 지점부터 기준 캔들을 한 번만 순회
+        resumes = [state.resume_ts for state in states]
+        scan_from = None if None in resumes else min(resumes)
+        for chunk in Candle.iter_chunks(self.base, start_ts=scan_from, chunk_rows=self.chunk_rows):
+            for state in states:
+                state.feed(chunk)
+
+        saved = {}
+        for state in states:
+            df = state.finish()
+            saved[state.address.to_filename()] = len(df)
+            if df.empty:
+                continue
+
+            # resume_ts 이상을 새 결과로 교체 (저장된 데이터가 없으면 초기 저장)
+            candle = Candle(state.address, df)
+            if state.stored_last_ts is not None:
+                candle.is_new = False
+                candle.is_partial = True
+                candle.storage_last_ts = int(df['timestamp'].iloc[0])
+            candle.save()
+
+        return saved
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+
+# 저장 dtype 프로파일
+#   float64: 가격/거래량 float64 (기본값, 이전 버전과 같은 형식)
+#   float32: 가격/거래량 float32 (로드 결과도 float32)
+#   scaled:  가격을 PRICE_SCALE배 정수(int32, 범위를 넘으면 int64)로 저장, 로드 시 float64로 복원
+PROFILES = ('float64', 'float32', 'scaled')
+DEFAULT_PROFILE = 'float64'
+
+PRICE_COLUMNS = ['high', 'low', 'open', 'close']
+
+# round(4) 전처리와 같은 정밀도
+PRICE_SCALE = 10_000
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def resolve_profile(config: dict) -> str:
+    """
+    config의 dtype_profile 확인
+
+    Args:
+        config: 환경변수 설정 dict (dtype_profile 선택)
+
+    Returns:
+        프로파일 이름
+
+    Raises:
+        ValueError: 지원하지 않는 프로파일인 경우
+    """
+    profile = config.get('dtype_profile') or DEFAULT_PROFILE
+    if profile not in PROFILES:
+        raise ValueError(f"Unsupported dtype profile: {profile}")
+    return profile
+
+
+def encode(df: pd.DataFrame, profile: str) -> tuple[pd.DataFrame, dict]:
+    """
+    프로파일에 맞게 가격/거래량 컬럼을 저장용 dtype으로 변환
+
+    Args:
+        df: round(4) 전처리된 DataFrame (수정하지 않음)
+        profile: 프로파일 이름
+
+    Returns:
+        (변환된 DataFrame, 파일 메타데이터에 함께 기록할 attrs)
+
+    Raises:
+        ValueError: scaled 프로파일에서 가격에 NaN이 있는 경우
+    """
+    if profile == 'float64':
+        return df, {}
+
+    df = df.copy()
+    if profile == 'float32':
+        for column in PRICE_COLUMNS + ['volume']:
+            df[column] = df[column].to_numpy(dtype=np.float32)
+        return df, {}
+
+    scaled = {}
+    for column in PRICE_COLUMNS:
+        values = df[column].to_numpy(dtype=np.float64)
+        if np.isnan(values).any():
+            raise ValueError(f"scaled dtype profile does not allow NaN prices: {column}")
+        scaled[column] = np.rint(values * PRICE_SCALE).astype(np.int64)
+
+    # 파일 단위로 int32에 들어가면 int32 사용
+    fits_int32 = all(len(v) == 0 or np.abs(v).max() <= _INT32_MAX for v in scaled.values())
+    for column, values in scaled.items():
+        df[column] = values.astype(np.int32) if fits_int32 else values
+
+    return df, {'price_scale': PRICE_SCALE}
+
+
+def decode(df: pd.DataFrame, attrs: dict) -> pd.DataFrame:
+    """
+    파일 메타데이터(attrs)에 따라 정수 가격을 float64로 복원
+
+    float32/float64로 저장된 컬럼은 그대로 둔다.
+
+    Args:
+        df: 로드된 DataFrame
+        attrs: 파일에 기록된 attrs
+
+    Returns:
+        가격이 float 컬럼인 DataFrame
+    """
+    scale = attrs.get('price_scale')
+    if not scale:
+        return df
+
+    for column in PRICE_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].to_numpy(dtype=np.float64) / scale
+    return df
@@ -0,0 +1,86 @@
+import numpy as np
+
+
+# 빈 구간은 [start_ts, end_ts) 튜플로 표현한다.
+#   start_ts: 빠진 첫 캔들의 timestamp (직전 캔들 + step)
+#   end_ts:   빠진 구간 다음에 존재하는 캔들의 timestamp
+# 첫 저장 캔들 이전과 마지막 저장 캔들 이후는 빈 구간으로 보지 않는다.
+
+
+def find_gaps(timestamps: np.ndarray, step: int) -> list[tuple[int, int]]:
+    """
+    정렬된 timestamp에서 step보다 큰 간격을 빈 구간으로 반환
+
+    Args:
+        timestamps: 오름차순 timestamp 배열 (초)
+        step: 캔들 간격 (초)
+
+    Returns:
+        [(start_ts, end_ts), ...] (시간 순)
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    if len(timestamps) < 2:
+        return []
+
+    idx = np.flatnonzero(np.diff(timestamps) > step)
+    return [(int(timestamps[i]) + step, int(timestamps[i + 1])) for i in idx]
+
+
+def gaps_for_save(timestamps: np.ndarray, step: int, storage_last_ts: int | None,
+                  stored_gaps: list[tuple[int, int]]) -> tuple[int | None, list[tuple[int, int]]]:
+    """
+    저장으로 바뀌는 구간의 빈 구간 계산
+
+    저장은 storage_last_ts 이상을 새 데이터로 교체하므로 end_ts가 storage_last_ts 이상인 기존 구간만 다시 계산한다.
+    직전 저장 캔들은 df에 storage_last_ts 미만 행이 있으면 그 마지막 행이고,
+    없으면 기존 인덱스로 추정한다 (storage_last_ts에서 끝나는 구간이 있으면 그 앞, 없으면 storage_last_ts - step).
+
+    Args:
+        timestamps: 저장하는 DataFrame의 오름차순 timestamp 배열
+        step: 캔들 간격 (초)
+        storage_last_ts: 저장 전 저장소의 마지막 타임스탬프 (초기 저장이면 None,
+            빈 주소를 load한 Candle이면 0. 0이면 저장이 전체를 교체하므로 초기 저장과 같게 처리)
+        stored_gaps: 저장소에 기록된 빈 구간 (storage_last_ts가 None/0이면 사용하지 않음)
+
+    Returns:
+        (from_ts, gaps): end_ts가 from_ts 이상인 기존 구간을 gaps로 교체 (from_ts가 None이면 전체 교체)
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    if len(timestamps) > 1 and not np.all(timestamps[1:] > timestamps[:-1]):
+        timestamps = np.unique(timestamps)
+
+    if not storage_last_ts:
+        return None, find_gaps(timestamps, step)
+
+    split = int(np.searchsorted(timestamps, storage_last_ts, side='left'))
+    if split > 0:
+        anchor = int(timestamps[split - 1])
+    else:
+        ending = [start for start, end in stored_gaps if end == storage_last_ts]
+        anchor = ending[0] - step if ending else storage_last_ts - step
+
+    added = timestamps[split:]
+    return storage_last_ts, find_gaps(np.concatenate([[anchor], added]), step)
+
+
+def clip_gaps(gaps: list[tuple[int, int]], start_ts: int = None, end_ts: int = None) -> list[tuple[int, int]]:
+    """
+    빈 구간을 [start_ts, end_ts) 범위로 자르기
+
+    Args:
+        gaps: 빈 구간 목록 (시간 순)
+        start_ts: 시작 타임스탬프 (이상)
+        end_ts: 종료 타임스탬프 (미만)
+
+    Returns:
+        범위와 겹치는 부분만 남긴 빈 구간 목록
+    """
+    clipped = []
+    for start, end in gaps:
+        if start_ts is not None:
+            start = max(start, start_ts)
+        if end_ts is not None:
+            end = min(end, end_ts)
+        if start < end:
+            clipped.append((start, end))
+    return clipped
@@ -1,3 +1,4 @@
+from typing import Iterator
 import pandas as pd
 from ....stock_address import StockAddress
 from .strategy.base import BaseLoadStrategy
@@ -29,3 +30,51 @@ class LoadWorker:
             로드된 DataFrame
         """
         return self.strategy.load(address, start_ts, end_ts)
+
+    @func_logging
+    def iter_chunks(self, address: StockAddress, start_ts: int = None, end_ts: int = None,
+                    chunk_rows: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        데이터를 chunk_rows 행 이하 DataFrame으로 나눠 timestamp 순으로 반환
+
+        Args:
+            address: StockAddress 객체
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+            chunk_rows: chunk 당 최대 행 수
+
+        Returns:
+            DataFrame iterator
+
+        Raises:
+            ValueError: chunk_rows가 1 미만인 경우
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be positive: {chunk_rows}")
+        return self.strategy.iter_chunks(address, start_ts, end_ts, chunk_rows)
+
+    @func_logging
+    def last_timestamp(self, address: StockAddress) -> int | None:
+        """
+        저장된 마지막 타임스탬프 조회
+
+        Args:
+            address: StockAddress 객체
+
+        Returns:
+            마지막 타임스탬프 (데이터가 없으면 None)
+        """
+        return self.strategy.last_timestamp(address)
+
+    @func_logging
+    def version(self, address: StockAddress) -> str | None:
+        """
+        저장된 데이터의 버전 토큰 조회 (저장할 때마다 바뀌는 값)
+
+        Args:
+            address: StockAddress 객체
+
+        Returns:
+            버전 문자열 (데이터가 없으면 None)
+        """
+        return self.strategy.version(address)
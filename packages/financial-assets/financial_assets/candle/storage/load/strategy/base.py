@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 import pandas as pd
 from .....stock_address import StockAddress
 
@@ -20,3 +21,58 @@ class BaseLoadStrategy(ABC):
             로드된 DataFrame
         """
         pass
+
+    def iter_chunks(self, address: StockAddress, start_ts: int = None, end_ts: int = None,
+                    chunk_rows: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        데이터를 chunk_rows 행 이하 DataFrame으로 나눠 timestamp 순으로 반환
+
+        기본 구현은 전체를 load한 뒤 나누므로 메모리를 줄이지 못한다.
+        백엔드별로 스트리밍이 가능하면 재정의한다.
+
+        Args:
+            address: StockAddress 객체
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+            chunk_rows: chunk 당 최대 행 수
+
+        Yields:
+            로드된 DataFrame 조각
+        """
+        df = self.load(address, start_ts, end_ts)
+        for begin in range(0, len(df), chunk_rows):
+            yield df.iloc[begin:begin + chunk_rows].reset_index(drop=True)
+
+    def last_timestamp(self, address: StockAddress) -> int | None:
+        """
+        저장된 마지막 타임스탬프 조회
+
+        기본 구현은 전체를 load하므로 백엔드별로 싸게 조회할 수 있으면 재정의한다.
+
+        Args:
+            address: StockAddress 객체
+
+        Returns:
+            마지막 타임스탬프 (데이터가 없으면 None)
+        """
+        df = self.load(address)
+        if df.empty:
+            return None
+        return int(df['timestamp'].max())
+
+    def version(self, address: StockAddress) -> str | None:
+        """
+        저장된 데이터의 버전 토큰 조회 (저장할 때마다 바뀌는 값, 캐시 무효화 기준)
+
+        기본 구현은 전체를 load해 행 수와 내용 해시로 만들므로 백엔드별로 싸게 조회할 수 있으면 재정의한다.
+
+        Args:
+            address: StockAddress 객체
+
+        Returns:
+            버전 문자열 (데이터가 없으면 None)
+        """
+        df = self.load(address)
+        if df.empty:
+            return None
+        return f"{len(df)}:{int(pd.util.hash_pandas_object(df, index=False).sum())}"
@@ -1,6 +1,10 @@
+from typing import Iterator
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
 from .....stock_address import StockAddress
+from ... import dtype_profile
+from ...mysql_engine import METADATA_TABLE, create_mysql_engine
 from .base import BaseLoadStrategy
 from simple_logger import init_logging, func_logging
 
@@ -9,17 +13,17 @@ class MySQLLoadStrategy(BaseLoadStrategy):
     """MySQL 데이터 로드 전략"""
 
     @init_logging
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, engine: Engine = None):
         """
         Args:
-            config: 환경변수 설정 dict (host, port, dbname, username, password 포함)
+            config: 환경변수 설정 dict (host, port, dbname, username, password 포함, dtype_profile 선택)
+            engine: 외부에서 주입할 SQLAlchemy engine (None이면 config로 생성)
         """
-        # SQLAlchemy engine 생성
-        connection_string = (
-            f"mysql+pymysql://{config['username']}:{config['password']}"
-            f"@{config['host']}:{config['port']}/{config['dbname']}"
-        )
-        self.engine = create_engine(connection_string, pool_recycle=3600, pool_size=5)
+        # 로드 결과 컬럼 dtype (float32 프로파일이면 가격/거래량 float32)
+        value_dtype = 'float32' if dtype_profile.resolve_profile(config) == 'float32' else 'float64'
+        self.dtypes = {'timestamp': 'int64', **{c: value_dtype for c in ['high', 'low', 'open', 'close', 'volume']}}
+
+        self.engine = engine if engine is not None else create_mysql_engine(config)
 
     @func_logging
     def load(self, address: StockAddress, start_ts: int = None, end_ts: int = None) -> pd.DataFrame:
@@ -34,6 +38,110 @@ class MySQLLoadStrategy(BaseLoadStrategy):
         Returns:
             로드된 DataFrame
         """
+        query, params = self._select_query(address, start_ts, end_ts)
+
+        try:
+            with self.engine.connect() as connection:
+                df = pd.read_sql(query, connection, params=params, dtype=self.dtypes)
+
+            # 데이터가 없으면 빈 DataFrame
+            if df.empty:
+                return pd.DataFrame(columns=['timestamp', 'high', 'low', 'open', 'close', 'volume'])
+
+            return df
+
+        except Exception as e:
+            # 테이블이 없거나 오류 발생 시 빈 DataFrame 반환
+            return pd.DataFrame(columns=['timestamp', 'high', 'low', 'open', 'close', 'volume'])
+
+    def iter_chunks(self, address: StockAddress, start_ts: int = None, end_ts: int = None,
+                    chunk_rows: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        데이터를 chunk_rows 행 이하 DataFrame으로 나눠 timestamp 순으로 반환
+
+        서버 측 커서(stream_results)로 결과를 받으므로 클라이언트는 chunk 하나만 메모리에 유지한다.
+        반복이 끝나거나 중단될 때까지 풀의 연결 하나를 점유한다.
+
+        Args:
+            address: StockAddress 객체
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+            chunk_rows: chunk 당 최대 행 수
+
+        Yields:
+            로드된 DataFrame 조각
+        """
+        query, params = self._select_query(address, start_ts, end_ts)
+
+        with self.engine.connect() as connection:
+            connection = connection.execution_options(stream_results=True, max_row_buffer=chunk_rows)
+            try:
+                chunks = pd.read_sql(query, connection, params=params, chunksize=chunk_rows, dtype=self.dtypes)
+            except Exception:
+                # 테이블이 없거나 오류 발생 시 chunk 없음
+                return
+
+            for chunk in chunks:
+                if not chunk.empty:
+                    yield chunk
+
+    @func_logging
+    def last_timestamp(self, address: StockAddress) -> int | None:
+        """
+        저장된 마지막 타임스탬프 조회 (PRIMARY KEY 인덱스로 MAX만 조회)
+
+        Args:
+            address: StockAddress 객체
+
+        Returns:
+            마지막 타임스탬프 (데이터나 테이블이 없으면 None)
+        """
+        try:
+            with self.engine.connect() as connection:
+                last_ts = connection.execute(text(f"SELECT MAX(timestamp) FROM {address.to_tablename()}")).scalar()
+        except Exception:
+            # 테이블이 없거나 오류 발생 시
+            return None
+
+        return int(last_ts) if last_ts is not None else None
+
+    @func_logging
+    def version(self, address: StockAddress) -> str | None:
+        """
+        저장된 데이터의 버전 토큰 조회 (메타데이터 테이블의 write_version, 기본 키 조회 한 번)
+
+        MySQLSaveStrategy가 저장마다 데이터와 같은 트랜잭션에서 write_version을 올리므로
+        같은 초 안에 같은 행 수로 덮어쓴 경우도 구분된다.
+
+        Args:
+            address: StockAddress 객체
+
+        Returns:
+            버전 문자열 (저장 기록이나 테이블이 없으면 None)
+        """
+        query = text(f"SELECT write_version FROM {METADATA_TABLE} WHERE address_key = :address_key")
+        try:
+            with self.engine.connect() as connection:
+                write_version = connection.execute(query, {"address_key": address.to_tablename()}).scalar()
+        except Exception:
+            # 테이블이 없거나 오류 발생 시
+            return None
+
+        return f"write:{write_version}" if write_version is not None else None
+
+    @staticmethod
+    def _select_query(address: StockAddress, start_ts: int = None, end_ts: int = None) -> tuple:
+        """
+        범위 조회 SELECT 쿼리 구성
+
+        Args:
+            address: StockAddress 객체
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+
+        Returns:
+            (TextClause, 바인딩 파라미터 dict)
+        """
         table_name = address.to_tablename()
 
         # WHERE 절 구성
@@ -53,16 +161,4 @@ class MySQLLoadStrategy(BaseLoadStrategy):
         # SELECT 쿼리
         query = text(f"SELECT timestamp, high, low, open, close, volume FROM {table_name}{where_sql} ORDER BY timestamp")
 
-        try:
-            with self.engine.connect() as connection:
-                df = pd.read_sql(query, connection, params=params)
-
-            # 데이터가 없으면 빈 DataFrame
-            if df.empty:
-                return pd.DataFrame(columns=['timestamp', 'high', 'low', 'open', 'close', 'volume'])
-
-            return df
-
-        except Exception as e:
-            # 테이블이 없거나 오류 발생 시 빈 DataFrame 반환
-            return pd.DataFrame(columns=['timestamp', 'high', 'low', 'open', 'close', 'volume'])
+        return query, params
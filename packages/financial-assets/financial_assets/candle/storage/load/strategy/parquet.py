@@ -1,6 +1,13 @@
+import json
 from pathlib import Path
+from typing import Iterator
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from .....stock_address import StockAddress
+from ...parquet_manifest import ParquetManifest
+from ... import dtype_profile
 from .base import BaseLoadStrategy
 from simple_logger import init_logging, func_logging
 
@@ -21,35 +28,279 @@ class ParquetLoadStrategy(BaseLoadStrategy):
         """
         데이터 로드
 
+        매니페스트로 범위와 겹치는 파티션만 고른 뒤, 각 파티션에서 row group 통계(tick min/max)로
+        겹치는 row group만 디코딩하고 tick 필터를 적용한다.
+
         Args:
             address: StockAddress 객체
-            start_ts: 시작 타임스탬프 (무시됨)
-            end_ts: 종료 타임스탬프 (무시됨)
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
 
         Returns:
             로드된 DataFrame
         """
-        filepath = self.basepath / f"{address.to_filename()}.parquet"
+        filepaths = self._select_files(address, start_ts, end_ts)
 
         # 파일이 없으면 빈 DataFrame 반환
-        if not filepath.exists():
+        if not filepaths:
             return pd.DataFrame(columns=['timestamp', 'high', 'low', 'open', 'close', 'volume'])
 
-        # parquet 파일 로드
-        df = pd.read_parquet(filepath)
+        dfs = [self._read_file(filepath, start_ts, end_ts) for filepath in filepaths]
+        if len(dfs) == 1:
+            return dfs[0]
+        return pd.concat(dfs, ignore_index=True)
 
-        # metadata에서 unit 읽기
-        unit = df.attrs.get('unit', 1)
+    def iter_chunks(self, address: StockAddress, start_ts: int = None, end_ts: int = None,
+                    chunk_rows: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        데이터를 chunk_rows 행 이하 DataFrame으로 나눠 timestamp 순으로 반환
 
-        # tick → timestamp 역변환
-        df = self._tick_to_timestamp(df, unit)
+        파티션을 순서대로 열고 범위와 겹치는 row group만 batch 단위로 디코딩하므로
+        메모리에는 chunk 하나와 디코딩 중인 batch만 유지된다.
 
-        # start_ts/end_ts는 무시하고 전체 로드
-        if start_ts is not None or end_ts is not None:
-            import warnings
-            warnings.warn("ParquetLoadStrategy does not support start_ts/end_ts filtering. Loading entire dataset.")
+        Args:
+            address: StockAddress 객체
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+            chunk_rows: chunk 당 최대 행 수
 
-        return df
+        Yields:
+            timestamp 컬럼을 가진 DataFrame (마지막 chunk만 chunk_rows보다 작을 수 있음)
+        """
+        pending = []
+        pending_rows = 0
+
+        for filepath in self._select_files(address, start_ts, end_ts):
+            with pq.ParquetFile(filepath) as parquet_file:
+                attrs = self._read_attrs(parquet_file)
+                column, unit, low, high = self._tick_bounds(parquet_file, start_ts, end_ts)
+                row_groups = self._select_row_groups(parquet_file, column, low, high)
+                batches = parquet_file.iter_batches(batch_size=chunk_rows, row_groups=row_groups) if row_groups else []
+
+                for batch in batches:
+                    table = pa.Table.from_batches([batch])
+                    mask = self._range_mask(table[column], low, high)
+                    if mask is not None:
+                        table = table.filter(mask)
+                    if table.num_rows == 0:
+                        continue
+
+                    # 파일마다 unit이 다를 수 있으므로 timestamp로 변환한 뒤 모은다
+                    df = dtype_profile.decode(table.to_pandas(), attrs)
+                    pending.append(self._tick_to_timestamp(df, unit))
+                    pending_rows += table.num_rows
+
+                    while pending_rows >= chunk_rows:
+                        merged = pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+                        yield merged.iloc[:chunk_rows].reset_index(drop=True)
+                        rest = merged.iloc[chunk_rows:].reset_index(drop=True)
+                        pending = [rest] if len(rest) else []
+                        pending_rows = len(rest)
+
+        if pending_rows:
+            yield pd.concat(pending, ignore_index=True) if len(pending) > 1 else pending[0]
+
+    @func_logging
+    def last_timestamp(self, address: StockAddress) -> int | None:
+        """
+        저장된 마지막 타임스탬프 조회
+
+        파티션 레이아웃은 매니페스트의 마지막 파티션 max_ts만 읽고, 단일 파일 레이아웃은 전체를 로드한다.
+
+        Args:
+            address: StockAddress 객체
+
+        Returns:
+            마지막 타임스탬프 (데이터가 없으면 None)
+        """
+        dirpath = ParquetManifest.dirpath_for(self.basepath, address)
+        if ParquetManifest.exists(dirpath):
+            partitions = ParquetManifest.load(dirpath).partitions
+            return int(partitions[-1]['max_ts']) if partitions else None
+
+        return super().last_timestamp(address)
+
+    @func_logging
+    def version(self, address: StockAddress) -> str | None:
+        """
+        저장된 데이터의 버전 토큰 조회
+
+        저장은 항상 새 파티션 파일을 발급하므로 매니페스트의 next_id가 저장마다 증가한다.
+        단일 파일 레이아웃은 파일의 mtime_ns와 크기를 사용한다.
+
+        Args:
+            address: StockAddress 객체
+
+        Returns:
+            버전 문자열 (데이터가 없으면 None)
+        """
+        dirpath = ParquetManifest.dirpath_for(self.basepath, address)
+        if ParquetManifest.exists(dirpath):
+            manifest = ParquetManifest.load(dirpath)
+            return f"manifest:{manifest.next_id}" if manifest.partitions else None
+
+        legacy_path = ParquetManifest.legacy_path_for(self.basepath, address)
+        if not legacy_path.exists():
+            return None
+        stat = legacy_path.stat()
+        return f"file:{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _select_files(self, address: StockAddress, start_ts: int = None, end_ts: int = None) -> list[Path]:
+        """
+        범위와 겹치는 parquet 파일 목록 (timestamp 순)
+
+        Args:
+            address: StockAddress 객체
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+
+        Returns:
+            파일 경로 리스트 (없으면 빈 리스트)
+        """
+        dirpath = ParquetManifest.dirpath_for(self.basepath, address)
+
+        if ParquetManifest.exists(dirpath):
+            manifest = ParquetManifest.load(dirpath)
+            return [manifest.path_of(p) for p in manifest.select(start_ts, end_ts)]
+
+        # 단일 파일 레이아웃 (이전 버전 호환)
+        legacy_path = ParquetManifest.legacy_path_for(self.basepath, address)
+        return [legacy_path] if legacy_path.exists() else []
+
+    @func_logging
+    def _read_file(self, filepath: Path, start_ts: int = None, end_ts: int = None) -> pd.DataFrame:
+        """
+        파일 하나를 범위 조건으로 로드
+
+        Args:
+            filepath: parquet 파일 경로
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+
+        Returns:
+            timestamp 컬럼을 가진 DataFrame
+        """
+        if start_ts is None and end_ts is None:
+            # 전체 로드 (pandas가 metadata의 attrs 복원)
+            df = pd.read_parquet(filepath)
+            attrs = df.attrs
+        else:
+            df, attrs = self._read_range(filepath, start_ts, end_ts)
+
+        # 정수 가격 복원, tick → timestamp 역변환
+        df = dtype_profile.decode(df, attrs)
+        return self._tick_to_timestamp(df, attrs.get('unit', 1))
+
+    @func_logging
+    def _read_range(self, filepath: Path, start_ts: int = None, end_ts: int = None) -> tuple[pd.DataFrame, dict]:
+        """
+        범위에 해당하는 row group만 읽어 필터링
+
+        Args:
+            filepath: parquet 파일 경로
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+
+        Returns:
+            (tick 컬럼을 가진 DataFrame, 파일 attrs)
+        """
+        parquet_file = pq.ParquetFile(filepath)
+        attrs = self._read_attrs(parquet_file)
+        column, unit, low, high = self._tick_bounds(parquet_file, start_ts, end_ts)
+
+        row_groups = self._select_row_groups(parquet_file, column, low, high)
+        if not row_groups:
+            return parquet_file.schema_arrow.empty_table().to_pandas(), attrs
+
+        table = parquet_file.read_row_groups(row_groups)
+
+        # 경계 row group의 범위 밖 행 제거
+        table = table.filter(self._range_mask(table[column], low, high))
+
+        return table.to_pandas(), attrs
+
+    def _tick_bounds(self, parquet_file: pq.ParquetFile, start_ts: int = None,
+                     end_ts: int = None) -> tuple[str, int, int | None, int | None]:
+        """
+        timestamp 범위를 파일의 정렬 컬럼 범위로 변환
+
+        Args:
+            parquet_file: ParquetFile 객체
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+
+        Returns:
+            (컬럼명, unit, 하한(이상), 상한(미만)). 범위가 없으면 하한/상한은 None
+        """
+        unit = int(self._read_attrs(parquet_file).get('unit', 1))
+
+        # tick 컬럼이 없는 파일은 timestamp 컬럼을 그대로 사용
+        column = 'tick' if 'tick' in parquet_file.schema_arrow.names else 'timestamp'
+        if column == 'timestamp':
+            unit = 1
+
+        # timestamp 범위를 tick 범위로 변환: tick * unit >= start_ts ⇔ tick >= ceil(start_ts / unit)
+        low = -(-start_ts // unit) if start_ts is not None else None
+        high = -(-end_ts // unit) if end_ts is not None else None
+
+        return column, unit, low, high
+
+    @staticmethod
+    def _select_row_groups(parquet_file: pq.ParquetFile, column: str, low: int | None, high: int | None) -> list[int]:
+        """
+        row group 통계로 [low, high)와 겹치는 row group만 선택
+
+        Args:
+            parquet_file: ParquetFile 객체
+            column: 정렬 컬럼명 (tick 또는 timestamp)
+            low: 하한 (이상, None이면 제한 없음)
+            high: 상한 (미만, None이면 제한 없음)
+
+        Returns:
+            row group 인덱스 리스트
+        """
+        column_idx = parquet_file.schema.names.index(column)
+        row_groups = []
+        for i in range(parquet_file.metadata.num_row_groups):
+            stats = parquet_file.metadata.row_group(i).column(column_idx).statistics
+            if stats is not None and stats.has_min_max:
+                if low is not None and stats.max < low:
+                    continue
+                if high is not None and stats.min >= high:
+                    continue
+            row_groups.append(i)
+        return row_groups
+
+    @staticmethod
+    def _range_mask(values, low: int | None, high: int | None):
+        """[low, high) 필터 마스크 (범위가 없으면 None)"""
+        mask = None
+        if low is not None:
+            mask = pc.greater_equal(values, low)
+        if high is not None:
+            upper = pc.less(values, high)
+            mask = upper if mask is None else pc.and_(mask, upper)
+        return mask
+
+    @staticmethod
+    def _read_attrs(parquet_file: pq.ParquetFile) -> dict:
+        """
+        pandas가 기록한 DataFrame.attrs 읽기
+
+        Args:
+            parquet_file: ParquetFile 객체
+
+        Returns:
+            attrs dict (unit, price_scale 등. 없으면 빈 dict)
+        """
+        metadata = parquet_file.schema_arrow.metadata or {}
+
+        # pandas 3.x는 PANDAS_ATTRS, 2.x는 pandas 메타데이터의 attributes에 저장
+        if b'PANDAS_ATTRS' in metadata:
+            return json.loads(metadata[b'PANDAS_ATTRS'])
+        if b'pandas' in metadata:
+            return json.loads(metadata[b'pandas']).get('attributes', {})
+        return {}
 
     @func_logging
     def _tick_to_timestamp(self, df: pd.DataFrame, unit: int) -> pd.DataFrame:
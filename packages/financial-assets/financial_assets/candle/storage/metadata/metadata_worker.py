@@ -1,4 +1,6 @@
+import numpy as np
 from ....stock_address import StockAddress
+from .. import gap_index
 from .strategy.base import BaseMetadataStrategy
 from simple_logger import init_logging, func_logging
 
@@ -15,7 +17,34 @@ class MetadataWorker:
         # 마지막 업데이트 타임스탬프 조회
         return self.strategy.get_last_update_ts(address)
 
+    @func_logging
+    def get_many(self, addresses: list[StockAddress]) -> list[int | None]:
+        # 여러 주소의 마지막 업데이트 타임스탬프 일괄 조회 (addresses 순서, 없으면 None)
+        return self.strategy.get_many(addresses)
+
     @func_logging
     def set_last_update_ts(self, address: StockAddress, timestamp: int) -> None:
         # 마지막 업데이트 타임스탬프 저장
         self.strategy.set_last_update_ts(address, timestamp)
+
+    @func_logging
+    def set_many(self, items: list[tuple[StockAddress, int]]) -> None:
+        # 여러 주소의 마지막 업데이트 타임스탬프 일괄 저장
+        self.strategy.set_many(items)
+
+    @func_logging
+    def get_gaps(self, address: StockAddress, start_ts: int = None, end_ts: int = None) -> list[tuple[int, int]]:
+        # 범위 안의 빈 구간 [start_ts, end_ts) 조회 (범위 경계로 잘라서 반환)
+        return gap_index.clip_gaps(self.strategy.get_gaps(address, start_ts, end_ts), start_ts, end_ts)
+
+    @func_logging
+    def update_gaps(self, address: StockAddress, timestamps: np.ndarray, storage_last_ts: int = None) -> None:
+        # 저장 직후 빈 구간 인덱스 갱신 (storage_last_ts는 저장 전 값, 간격이 일정하지 않은 timeframe은 건너뜀)
+        step = address.timeframe_seconds()
+        if step is None:
+            return
+
+        # storage_last_ts에서 끝나는 기존 구간 (직전 저장 캔들 추정용)
+        stored = self.strategy.get_gaps(address, storage_last_ts - 1, storage_last_ts + 1) if storage_last_ts else []
+        from_ts, gaps = gap_index.gaps_for_save(timestamps, step, storage_last_ts, stored)
+        self.strategy.replace_gaps(address, gaps, from_ts)
@@ -14,3 +14,20 @@ class BaseMetadataStrategy(ABC):
     def set_last_update_ts(self, address: StockAddress, timestamp: int) -> None:
         # 마지막 업데이트 타임스탬프 저장
         pass
+
+    def set_many(self, items: list[tuple[StockAddress, int]]) -> None:
+        # 여러 주소의 마지막 업데이트 타임스탬프 일괄 저장 (기본: 개별 저장 반복)
+        for address, timestamp in items:
+            self.set_last_update_ts(address, timestamp)
+
+    def get_many(self, addresses: list[StockAddress]) -> list[int | None]:
+        # 여러 주소의 마지막 업데이트 타임스탬프 일괄 조회 (기본: 개별 조회 반복)
+        return [self.get_last_update_ts(address) for address in addresses]
+
+    def get_gaps(self, address: StockAddress, start_ts: int = None, end_ts: int = None) -> list[tuple[int, int]]:
+        # 범위와 겹치는 빈 구간 [start_ts, end_ts) 조회 (시간 순)
+        raise NotImplementedError(f"{type(self).__name__} does not support gap index")
+
+    def replace_gaps(self, address: StockAddress, gaps: list[tuple[int, int]], from_ts: int = None) -> None:
+        # end_ts가 from_ts 이상인 빈 구간을 gaps로 교체 (from_ts가 None이면 전체 교체)
+        raise NotImplementedError(f"{type(self).__name__} does not support gap index")
@@ -1,5 +1,7 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Engine
 from .....stock_address import StockAddress
+from ...mysql_engine import create_mysql_engine, ensure_database, ensure_metadata_table
 from .base import BaseMetadataStrategy
 from simple_logger import init_logging, func_logging, logger
 
@@ -8,51 +10,38 @@ class MySQLMetadataStrategy(BaseMetadataStrategy):
     # MySQL 메타데이터 전략 (테이블 기반)
 
     METADATA_TABLE = 'fa_candles_metadata'
+    GAPS_TABLE = 'fa_candles_gaps'
 
     @init_logging
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, engine: Engine = None):
+        # engine: 외부에서 주입할 SQLAlchemy engine (None이면 config로 생성)
         self.config = config
-
-        # 데이터베이스 생성용 engine (데이터베이스 지정 없음)
-        connection_string_no_db = (
-            f"mysql+pymysql://{config['username']}:{config['password']}"
-            f"@{config['host']}:{config['port']}"
-        )
-        self.engine_no_db = create_engine(connection_string_no_db, pool_recycle=3600)
-
-        # SQLAlchemy engine 생성 (데이터베이스 지정)
-        connection_string = (
-            f"mysql+pymysql://{config['username']}:{config['password']}"
-            f"@{config['host']}:{config['port']}/{config['dbname']}"
-        )
-        self.engine = create_engine(connection_string, pool_recycle=3600, pool_size=5)
+        self.engine = engine if engine is not None else create_mysql_engine(config)
 
         # 데이터베이스 및 메타데이터 테이블 생성 (없으면)
         self._ensure_database_and_table()
 
     def _ensure_database_and_table(self) -> None:
-        # 1. 데이터베이스 생성 (없으면)
-        dbname = self.config['dbname']
-        create_db_sql = f"CREATE DATABASE IF NOT EXISTS {dbname}"
-
+        # 1. 데이터베이스 생성 (없으면, 프로세스당 한 번)
         try:
-            with self.engine_no_db.begin() as connection:
-                connection.execute(text(create_db_sql))
+            ensure_database(self.config)
         except Exception as e:
             logger.error(f"데이터베이스 생성 실패: {e}")
 
-        # 2. 메타데이터 테이블 생성 (없으면)
-        create_table_sql = f"""
-        CREATE TABLE IF NOT EXISTS {self.METADATA_TABLE} (
-            address_key VARCHAR(64) PRIMARY KEY,
-            last_update_ts BIGINT NOT NULL,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        # 2. 메타데이터 테이블(ensure_metadata_table)과 빈 구간 인덱스 테이블 생성 (없으면)
+        create_gaps_table_sql = f"""
+        CREATE TABLE IF NOT EXISTS {self.GAPS_TABLE} (
+            address_key VARCHAR(64) NOT NULL,
+            start_ts BIGINT NOT NULL,
+            end_ts BIGINT NOT NULL,
+            PRIMARY KEY (address_key, start_ts)
         )
         """
 
         try:
             with self.engine.begin() as connection:
-                connection.execute(text(create_table_sql))
+                ensure_metadata_table(connection)
+                connection.execute(text(create_gaps_table_sql))
         except Exception as e:
             logger.error(f"메타데이터 테이블 생성 실패: {e}")
 
@@ -80,6 +69,27 @@ class MySQLMetadataStrategy(BaseMetadataStrategy):
             # 테이블이 없거나 오류 발생 시 None 반환
             return None
 
+    @func_logging
+    def get_many(self, addresses: list[StockAddress]) -> list[int | None]:
+        # 여러 주소의 마지막 업데이트 타임스탬프를 한 번의 IN 조회로 반환 (addresses 순서, 없으면 None)
+        if not addresses:
+            return []
+
+        keys = [address.to_tablename() for address in addresses]
+        query = text(
+            f"SELECT address_key, last_update_ts FROM {self.METADATA_TABLE} "
+            f"WHERE address_key IN :address_keys"
+        ).bindparams(bindparam('address_keys', expanding=True))
+
+        try:
+            with self.engine.connect() as connection:
+                found = {key: int(ts) for key, ts in connection.execute(query, {"address_keys": keys})}
+        except Exception:
+            # 테이블이 없거나 오류 발생 시 모두 None
+            return [None] * len(keys)
+
+        return [found.get(key) for key in keys]
+
     @func_logging
     def set_last_update_ts(self, address: StockAddress, timestamp: int) -> None:
         # 마지막 업데이트 타임스탬프 저장
@@ -94,3 +104,66 @@ class MySQLMetadataStrategy(BaseMetadataStrategy):
 
         with self.engine.begin() as connection:
             connection.execute(query, {"address_key": address_key, "timestamp": timestamp})
+
+    @func_logging
+    def set_many(self, items: list[tuple[StockAddress, int]]) -> None:
+        # 여러 주소의 마지막 업데이트 타임스탬프를 한 트랜잭션에서 일괄 UPSERT
+        if not items:
+            return
+
+        query = text(
+            f"INSERT INTO {self.METADATA_TABLE} (address_key, last_update_ts) "
+            f"VALUES (:address_key, :timestamp) "
+            f"ON DUPLICATE KEY UPDATE last_update_ts = VALUES(last_update_ts)"
+        )
+        params = [
+            {"address_key": address.to_tablename(), "timestamp": timestamp}
+            for address, timestamp in items
+        ]
+
+        with self.engine.begin() as connection:
+            connection.execute(query, params)
+
+    @func_logging
+    def get_gaps(self, address: StockAddress, start_ts: int = None, end_ts: int = None) -> list[tuple[int, int]]:
+        # 범위와 겹치는 빈 구간 [start_ts, end_ts) 조회 (시간 순)
+        where_sql = "address_key = :address_key"
+        params = {"address_key": address.to_tablename()}
+        if start_ts is not None:
+            where_sql += " AND end_ts > :start_ts"
+            params["start_ts"] = start_ts
+        if end_ts is not None:
+            where_sql += " AND start_ts < :end_ts"
+            params["end_ts"] = end_ts
+
+        query = text(f"SELECT start_ts, end_ts FROM {self.GAPS_TABLE} WHERE {where_sql} ORDER BY start_ts")
+
+        try:
+            with self.engine.connect() as connection:
+                return [(int(start), int(end)) for start, end in connection.execute(query, params)]
+        except Exception:
+            # 테이블이 없거나 오류 발생 시 빈 리스트
+            return []
+
+    @func_logging
+    def replace_gaps(self, address: StockAddress, gaps: list[tuple[int, int]], from_ts: int = None) -> None:
+        # end_ts가 from_ts 이상인 빈 구간을 gaps로 교체 (from_ts가 None이면 전체 교체)
+        address_key = address.to_tablename()
+
+        with self.engine.begin() as connection:
+            if from_ts is None:
+                connection.execute(
+                    text(f"DELETE FROM {self.GAPS_TABLE} WHERE address_key = :address_key"),
+                    {"address_key": address_key},
+                )
+            else:
+                connection.execute(
+                    text(f"DELETE FROM {self.GAPS_TABLE} WHERE address_key = :address_key AND end_ts >= :from_ts"),
+                    {"address_key": address_key, "from_ts": from_ts},
+                )
+
+            if gaps:
+                connection.execute(
+                    text(f"INSERT INTO {self.GAPS_TABLE} (address_key, start_ts, end_ts) VALUES (:address_key, :start_ts, :end_ts)"),
+                    [{"address_key": address_key, "start_ts": int(start), "end_ts": int(end)} for start, end in gaps],
+                )
@@ -1,56 +1,161 @@
 import json
+import os
+import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from threading import Lock
+from typing import Iterator
 from .....stock_address import StockAddress
 from .base import BaseMetadataStrategy
-from simple_logger import init_logging, func_logging
+from simple_logger import init_logging, func_logging, logger
 
 
 class ParquetMetadataStrategy(BaseMetadataStrategy):
-    # Parquet 메타데이터 전략 (JSON 파일 기반)
+    # Parquet 메타데이터 전략 (내장 SQLite 파일 기반)
+    # 저장 한 번에 해당 주소 행만 UPSERT하며, 프로세스 간 동시성은 SQLite 파일 잠금(WAL)으로 처리
+
+    METADATA_TABLE = 'fa_candles_metadata'
+    GAPS_TABLE = 'fa_candles_gaps'
+
+    # 다른 프로세스가 쓰기 잠금을 잡고 있을 때 기다리는 최대 시간 (초)
+    LOCK_TIMEOUT = 30.0
+
+    # IN 조회 한 번에 바인딩할 주소 수 (SQLite 바인딩 변수 개수 제한)
+    QUERY_BATCH = 500
 
     @init_logging
     def __init__(self, config: dict):
         self.basepath = Path(config['basepath'])
-        self.metadata_file = self.basepath / '_metadata.json'
-        self._lock = Lock()
+        self.metadata_db = self.basepath / '_metadata.db'
 
         # 디렉토리 생성 (없으면)
         self.basepath.mkdir(parents=True, exist_ok=True)
 
-        # 메타데이터 파일 초기화 (없으면)
-        if not self.metadata_file.exists():
-            with open(self.metadata_file, 'w') as f:
-                json.dump({}, f)
+        # 메타데이터 테이블 생성 (없으면)
+        with self._transaction() as connection:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.METADATA_TABLE} ("
+                f"address_key TEXT PRIMARY KEY, last_update_ts INTEGER NOT NULL)"
+            )
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.GAPS_TABLE} ("
+                f"address_key TEXT NOT NULL, start_ts INTEGER NOT NULL, end_ts INTEGER NOT NULL, "
+                f"PRIMARY KEY (address_key, start_ts))"
+            )
+
+        # 이전 버전의 _metadata.json이 있으면 가져오기
+        self._migrate_json(self.basepath / '_metadata.json')
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # 호출마다 새 연결 (sqlite3 연결은 스레드 간 공유 불가). 정상 종료 시 commit, 예외 시 rollback
+        connection = sqlite3.connect(self.metadata_db, timeout=self.LOCK_TIMEOUT)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _migrate_json(self, json_file: Path) -> None:
+        # JSON 메타데이터를 테이블로 옮기고 파일은 .migrated로 이름 변경
+        # 테이블에 이미 있는 주소는 더 최신 값이므로 유지 (INSERT OR IGNORE)
+        if not json_file.exists():
+            return
+
+        try:
+            with open(json_file, 'r') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"메타데이터 JSON 읽기 실패: {e}")
+            return
+
+        with self._transaction() as connection:
+            connection.executemany(
+                f"INSERT OR IGNORE INTO {self.METADATA_TABLE} (address_key, last_update_ts) VALUES (?, ?)",
+                [(key, int(ts)) for key, ts in metadata.items() if ts is not None],
+            )
+
+        try:
+            os.replace(json_file, json_file.with_name(json_file.name + '.migrated'))
+        except FileNotFoundError:
+            # 다른 프로세스가 먼저 옮긴 경우
+            pass
 
     @func_logging
     def get_last_update_ts(self, address: StockAddress) -> int | None:
         # 마지막 업데이트 타임스탬프 조회
-        with self._lock:
-            if not self.metadata_file.exists():
-                return None
+        return self.get_many([address])[0]
 
-            with open(self.metadata_file, 'r') as f:
-                metadata = json.load(f)
+    @func_logging
+    def get_many(self, addresses: list[StockAddress]) -> list[int | None]:
+        # 여러 주소의 마지막 업데이트 타임스탬프를 한 번의 연결로 조회 (addresses 순서, 없으면 None)
+        if not addresses:
+            return []
 
-            address_key = address.to_filename()
-            return metadata.get(address_key)
+        keys = [address.to_filename() for address in addresses]
+        found = {}
+
+        with self._transaction() as connection:
+            for begin in range(0, len(keys), self.QUERY_BATCH):
+                batch = keys[begin:begin + self.QUERY_BATCH]
+                placeholders = ', '.join('?' * len(batch))
+                rows = connection.execute(
+                    f"SELECT address_key, last_update_ts FROM {self.METADATA_TABLE} "
+                    f"WHERE address_key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                found.update(rows)
+
+        return [found.get(key) for key in keys]
 
     @func_logging
     def set_last_update_ts(self, address: StockAddress, timestamp: int) -> None:
         # 마지막 업데이트 타임스탬프 저장
-        with self._lock:
-            # 기존 메타데이터 로드
-            if self.metadata_file.exists():
-                with open(self.metadata_file, 'r') as f:
-                    metadata = json.load(f)
-            else:
-                metadata = {}
+        self.set_many([(address, timestamp)])
 
-            # 업데이트
-            address_key = address.to_filename()
-            metadata[address_key] = timestamp
+    @func_logging
+    def set_many(self, items: list[tuple[StockAddress, int]]) -> None:
+        # 여러 주소의 마지막 업데이트 타임스탬프를 한 트랜잭션에서 일괄 UPSERT
+        if not items:
+            return
+
+        with self._transaction() as connection:
+            connection.executemany(
+                f"INSERT INTO {self.METADATA_TABLE} (address_key, last_update_ts) VALUES (?, ?) "
+                f"ON CONFLICT(address_key) DO UPDATE SET last_update_ts = excluded.last_update_ts",
+                [(address.to_filename(), int(timestamp)) for address, timestamp in items],
+            )
 
-            # 저장
-            with open(self.metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+    @func_logging
+    def get_gaps(self, address: StockAddress, start_ts: int = None, end_ts: int = None) -> list[tuple[int, int]]:
+        # 범위와 겹치는 빈 구간 [start_ts, end_ts) 조회 (시간 순)
+        query = f"SELECT start_ts, end_ts FROM {self.GAPS_TABLE} WHERE address_key = ?"
+        params = [address.to_filename()]
+        if start_ts is not None:
+            query += " AND end_ts > ?"
+            params.append(start_ts)
+        if end_ts is not None:
+            query += " AND start_ts < ?"
+            params.append(end_ts)
+
+        with self._transaction() as connection:
+            rows = connection.execute(query + " ORDER BY start_ts", params).fetchall()
+        return [(int(start), int(end)) for start, end in rows]
+
+    @func_logging
+    def replace_gaps(self, address: StockAddress, gaps: list[tuple[int, int]], from_ts: int = None) -> None:
+        # end_ts가 from_ts 이상인 빈 구간을 gaps로 교체 (from_ts가 None이면 전체 교체)
+        address_key = address.to_filename()
+
+        with self._transaction() as connection:
+            if from_ts is None:
+                connection.execute(f"DELETE FROM {self.GAPS_TABLE} WHERE address_key = ?", (address_key,))
+            else:
+                connection.execute(
+                    f"DELETE FROM {self.GAPS_TABLE} WHERE address_key = ? AND end_ts >= ?",
+                    (address_key, from_ts),
+                )
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {self.GAPS_TABLE} (address_key, start_ts, end_ts) VALUES (?, ?, ?)",
+                [(address_key, int(start), int(end)) for start, end in gaps],
+            )
@@ -0,0 +1,114 @@
+from threading import Lock
+from pymysql.constants import FIELD_TYPE
+from pymysql.converters import conversions
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import NullPool
+from simple_logger import func_logging
+
+
+# 커넥션 풀 기본값 (config의 pool_size, max_overflow로 조정)
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
+POOL_RECYCLE = 3600
+
+# DECIMAL 컬럼을 Decimal 객체 대신 float로 바로 받는 pymysql 변환 테이블
+# (캔들 가격은 DECIMAL(13, 4)이며 로드 결과는 어차피 float64 컬럼)
+FLOAT_DECIMAL_CONVERSIONS = {**conversions, FIELD_TYPE.DECIMAL: float, FIELD_TYPE.NEWDECIMAL: float}
+
+# 메타데이터 테이블: 주소별 마지막 업데이트 시각과 저장마다 1씩 증가하는 쓰기 버전
+# (쓰기 버전은 MySQLSaveStrategy가 데이터와 같은 트랜잭션에서 올리며 MySQLLoadStrategy.version의 토큰)
+METADATA_TABLE = 'fa_candles_metadata'
+CREATE_METADATA_TABLE_SQL = f"""
+CREATE TABLE IF NOT EXISTS {METADATA_TABLE} (
+    address_key VARCHAR(64) PRIMARY KEY,
+    last_update_ts BIGINT NOT NULL,
+    write_version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+)
+"""
+
+# 이 프로세스에서 이미 생성 확인한 데이터베이스 (host, port, dbname)
+_ensured_databases: set = set()
+_ensured_lock = Lock()
+
+
+def mysql_url(config: dict, with_database: bool = True) -> str:
+    """
+    config로 pymysql 접속 URL 구성
+
+    Args:
+        config: 환경변수 설정 dict (host, port, dbname, username, password 포함)
+        with_database: False면 데이터베이스를 지정하지 않은 URL
+
+    Returns:
+        SQLAlchemy 접속 URL
+    """
+    url = (
+        f"mysql+pymysql://{config['username']}:{config['password']}"
+        f"@{config['host']}:{config['port']}"
+    )
+    if with_database:
+        url += f"/{config['dbname']}"
+    return url
+
+
+@func_logging
+def create_mysql_engine(config: dict) -> Engine:
+    """
+    MySQL 전략들이 공유할 engine(커넥션 풀) 생성
+
+    Args:
+        config: 환경변수 설정 dict (pool_size, max_overflow 선택)
+
+    Returns:
+        SQLAlchemy Engine
+    """
+    return create_engine(
+        mysql_url(config),
+        pool_size=int(config.get('pool_size', POOL_SIZE)),
+        max_overflow=int(config.get('max_overflow', MAX_OVERFLOW)),
+        pool_recycle=POOL_RECYCLE,
+        pool_pre_ping=True,
+        connect_args={'conv': FLOAT_DECIMAL_CONVERSIONS},
+    )
+
+
+@func_logging
+def ensure_database(config: dict) -> None:
+    """
+    데이터베이스 생성 (없으면). 프로세스당 데이터베이스별 한 번만 실행
+
+    데이터베이스 미지정 연결은 이 용도로만 필요하므로 풀 없이 연결하고 바로 닫는다.
+
+    Args:
+        config: 환경변수 설정 dict (host, port, dbname, username, password 포함)
+    """
+    key = (config['host'], config['port'], config['dbname'])
+    with _ensured_lock:
+        if key in _ensured_databases:
+            return
+
+        engine_no_db = create_engine(mysql_url(config, with_database=False), poolclass=NullPool)
+        try:
+            with engine_no_db.begin() as connection:
+                connection.execute(text(f"CREATE DATABASE IF NOT EXISTS {config['dbname']}"))
+        finally:
+            engine_no_db.dispose()
+
+        _ensured_databases.add(key)
+
+
+def ensure_metadata_table(connection: Connection) -> None:
+    """
+    메타데이터 테이블 생성 (없으면)
+
+    write_version 컬럼이 없던 이전 버전 테이블에는 컬럼을 추가한다.
+
+    Args:
+        connection: 트랜잭션 중인 SQLAlchemy Connection
+    """
+    connection.execute(text(CREATE_METADATA_TABLE_SQL))
+    columns = {column['name'] for column in inspect(connection).get_columns(METADATA_TABLE)}
+    if 'write_version' not in columns:
+        connection.execute(text(f"ALTER TABLE {METADATA_TABLE} ADD COLUMN write_version BIGINT NOT NULL DEFAULT 0"))
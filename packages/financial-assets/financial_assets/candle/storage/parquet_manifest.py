@@ -0,0 +1,114 @@
+import json
+import os
+from pathlib import Path
+from ...stock_address import StockAddress
+
+
+class ParquetManifest:
+    """
+    주소별 파티션 Parquet 레이아웃의 매니페스트
+
+    레이아웃:
+        {basepath}/{address.to_filename()}/_manifest.json
+        {basepath}/{address.to_filename()}/part-000000.parquet
+        ...
+
+    파티션은 timestamp 순으로 정렬되어 있고 서로 겹치지 않는다.
+    파티션 파일은 항상 새 이름으로 기록한 뒤 매니페스트를 원자적으로 교체하므로,
+    중간에 중단되어도 매니페스트가 가리키는 파일은 온전하다.
+    """
+
+    FILENAME = '_manifest.json'
+    VERSION = 1
+
+    def __init__(self, dirpath: Path, partitions: list = None, next_id: int = 0):
+        """
+        Args:
+            dirpath: 주소별 파티션 디렉토리
+            partitions: 파티션 목록 [{"file", "min_ts", "max_ts", "rows"}, ...]
+            next_id: 다음 파티션 파일 번호
+        """
+        self.dirpath = Path(dirpath)
+        self.partitions = partitions or []
+        self.next_id = next_id
+
+    @staticmethod
+    def dirpath_for(basepath: Path, address: StockAddress) -> Path:
+        """주소별 파티션 디렉토리 경로"""
+        return Path(basepath) / address.to_filename()
+
+    @staticmethod
+    def legacy_path_for(basepath: Path, address: StockAddress) -> Path:
+        """단일 파일 레이아웃 경로 (이전 버전 호환)"""
+        return Path(basepath) / f"{address.to_filename()}.parquet"
+
+    @classmethod
+    def exists(cls, dirpath: Path) -> bool:
+        return (Path(dirpath) / cls.FILENAME).exists()
+
+    @classmethod
+    def load(cls, dirpath: Path) -> 'ParquetManifest':
+        """
+        매니페스트 로드 (없으면 빈 매니페스트)
+
+        Args:
+            dirpath: 주소별 파티션 디렉토리
+
+        Returns:
+            ParquetManifest 객체
+        """
+        path = Path(dirpath) / cls.FILENAME
+        if not path.exists():
+            return cls(dirpath)
+
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+        return cls(dirpath, data.get('partitions', []), data.get('next_id', 0))
+
+    def save(self) -> None:
+        """매니페스트를 임시 파일에 기록 후 원자적으로 교체"""
+        self.dirpath.mkdir(parents=True, exist_ok=True)
+        path = self.dirpath / self.FILENAME
+        tmp = self.dirpath / f"{self.FILENAME}.tmp"
+
+        with open(tmp, 'w') as f:
+            json.dump({
+                'version': self.VERSION,
+                'next_id': self.next_id,
+                'partitions': self.partitions,
+            }, f)
+
+        os.replace(tmp, path)
+
+    def new_partition_path(self) -> Path:
+        """아직 사용되지 않은 파티션 파일 경로 발급"""
+        path = self.dirpath / f"part-{self.next_id:06d}.parquet"
+        self.next_id += 1
+        return path
+
+    def path_of(self, partition: dict) -> Path:
+        """파티션 항목의 파일 경로"""
+        return self.dirpath / partition['file']
+
+    def select(self, start_ts: int = None, end_ts: int = None) -> list:
+        """
+        [start_ts, end_ts) 범위와 겹치는 파티션 목록
+
+        Args:
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+
+        Returns:
+            timestamp 순 파티션 목록
+        """
+        return [
+            p for p in self.partitions
+            if (start_ts is None or p['max_ts'] >= start_ts)
+            and (end_ts is None or p['min_ts'] < end_ts)
+        ]
+
+    @property
+    def rows(self) -> int:
+        """전체 행 수"""
+        return sum(p['rows'] for p in self.partitions)
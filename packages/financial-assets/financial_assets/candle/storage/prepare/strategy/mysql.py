@@ -1,5 +1,9 @@
-from sqlalchemy import create_engine, text
+from threading import Lock
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
 from .....stock_address import StockAddress
+from ... import dtype_profile
+from ...mysql_engine import create_mysql_engine, ensure_database, ensure_metadata_table
 from .base import BasePrepareStrategy
 from simple_logger import init_logging, func_logging
 
@@ -7,69 +11,76 @@ from simple_logger import init_logging, func_logging
 class MySQLPrepareStrategy(BasePrepareStrategy):
     """MySQL 저장소 준비 전략"""
 
+    # 프로파일별 (가격, 거래량) 컬럼 타입. scaled 프로파일은 Parquet 전용
+    COLUMN_TYPES = {
+        'float64': ('DECIMAL(13, 4)', 'DOUBLE'),
+        'float32': ('FLOAT', 'FLOAT'),
+    }
+
+    # 이 프로세스에서 이미 준비한 (engine URL, 테이블명). DDL은 테이블당 한 번만 실행
+    _prepared: set = set()
+    _prepared_lock = Lock()
+
     @init_logging
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, engine: Engine = None):
         """
         Args:
-            config: 환경변수 설정 dict (host, port, dbname, username, password 포함)
-        """
-        self.config = config
+            config: 환경변수 설정 dict (host, port, dbname, username, password 포함, dtype_profile 선택)
+            engine: 외부에서 주입할 SQLAlchemy engine (None이면 config로 생성)
 
-        # SQLAlchemy engine 생성 (데이터베이스 지정)
-        connection_string = (
-            f"mysql+pymysql://{config['username']}:{config['password']}"
-            f"@{config['host']}:{config['port']}/{config['dbname']}"
-        )
-        self.engine = create_engine(connection_string, pool_recycle=3600)
+        Raises:
+            ValueError: MySQL이 지원하지 않는 dtype 프로파일인 경우
+        """
+        profile = dtype_profile.resolve_profile(config)
+        if profile not in self.COLUMN_TYPES:
+            raise ValueError(f"dtype profile '{profile}' is not supported by the mysql strategy")
 
-        # 데이터베이스 생성용 engine (데이터베이스 지정 없음)
-        connection_string_no_db = (
-            f"mysql+pymysql://{config['username']}:{config['password']}"
-            f"@{config['host']}:{config['port']}"
-        )
-        self.engine_no_db = create_engine(connection_string_no_db, pool_recycle=3600)
+        self.config = config
+        self.price_type, self.volume_type = self.COLUMN_TYPES[profile]
+        self.engine = engine if engine is not None else create_mysql_engine(config)
 
     @func_logging
     def prepare(self, address: StockAddress) -> None:
         """
         데이터베이스, 테이블 및 메타데이터 테이블 생성
 
+        이미 준비한 테이블이면 DDL 없이 바로 반환한다.
+
         Args:
             address: StockAddress 객체
         """
-        # 1. 데이터베이스 생성 (없으면)
-        dbname = self.config['dbname']
-        create_db_sql = f"CREATE DATABASE IF NOT EXISTS {dbname}"
-
-        with self.engine_no_db.begin() as connection:
-            connection.execute(text(create_db_sql))
-
-        # 2. 메타데이터 테이블 생성 (없으면)
-        create_metadata_table_sql = """
-        CREATE TABLE IF NOT EXISTS fa_candles_metadata (
-            address_key VARCHAR(64) PRIMARY KEY,
-            last_update_ts BIGINT NOT NULL,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-        )
-        """
+        table_name = address.to_tablename()
+        url = str(self.engine.url)
 
-        with self.engine.begin() as connection:
-            connection.execute(text(create_metadata_table_sql))
+        if (url, table_name) in self._prepared:
+            return
 
-        # 3. 캔들 데이터 테이블 생성 (없으면)
-        table_name = address.to_tablename()
+        with self._prepared_lock:
+            if (url, table_name) in self._prepared:
+                return
 
-        create_table_sql = f"""
-        CREATE TABLE IF NOT EXISTS {table_name} (
-            timestamp BIGINT NOT NULL,
-            high DECIMAL(13, 4) NOT NULL,
-            low DECIMAL(13, 4) NOT NULL,
-            open DECIMAL(13, 4) NOT NULL,
-            close DECIMAL(13, 4) NOT NULL,
-            volume DOUBLE NOT NULL,
-            PRIMARY KEY (timestamp)
-        )
-        """
+            # 1. 데이터베이스 생성 (없으면, 프로세스당 한 번)
+            ensure_database(self.config)
+
+            # 2. 메타데이터 테이블 생성 (없으면)
+            if (url, None) not in self._prepared:
+                with self.engine.begin() as connection:
+                    ensure_metadata_table(connection)
+                self._prepared.add((url, None))
+
+            # 3. 캔들 데이터 테이블 생성 (없으면)
+            create_table_sql = f"""
+            CREATE TABLE IF NOT EXISTS {table_name} (
+                timestamp BIGINT NOT NULL,
+                high {self.price_type} NOT NULL,
+                low {self.price_type} NOT NULL,
+                open {self.price_type} NOT NULL,
+                close {self.price_type} NOT NULL,
+                volume {self.volume_type} NOT NULL,
+                PRIMARY KEY (timestamp)
+            )
+            """
 
-        with self.engine.begin() as connection:
-            connection.execute(text(create_table_sql))
+            with self.engine.begin() as connection:
+                connection.execute(text(create_table_sql))
+            self._prepared.add((url, table_name))
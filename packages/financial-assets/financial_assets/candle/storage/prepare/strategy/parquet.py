@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 from .....stock_address import StockAddress
 from .base import BasePrepareStrategy
@@ -19,16 +18,10 @@ class ParquetPrepareStrategy(BasePrepareStrategy):
     @func_logging
     def prepare(self, address: StockAddress) -> None:
         """
-        디렉토리 생성 및 메타데이터 파일 초기화
+        디렉토리 생성 (메타데이터 DB는 ParquetMetadataStrategy가 초기화)
 
         Args:
             address: StockAddress 객체
         """
         # basepath가 없으면 생성
         self.basepath.mkdir(parents=True, exist_ok=True)
-
-        # 메타데이터 파일 초기화 (없으면)
-        metadata_file = self.basepath / '_metadata.json'
-        if not metadata_file.exists():
-            with open(metadata_file, 'w') as f:
-                json.dump({}, f)
@@ -1,6 +1,9 @@
+import time
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
 from .....stock_address import StockAddress
+from ...mysql_engine import METADATA_TABLE, create_mysql_engine
 from .base import BaseSaveStrategy
 from simple_logger import init_logging, func_logging
 
@@ -8,24 +11,31 @@ from simple_logger import init_logging, func_logging
 class MySQLSaveStrategy(BaseSaveStrategy):
     """MySQL 데이터 저장 전략"""
 
+    COLUMNS = ['timestamp', 'high', 'low', 'open', 'close', 'volume']
+
+    # 한 번의 executemany로 보낼 행 수 기본값 (pymysql은 이를 다중 행 INSERT로 묶어 전송)
+    CHUNK_SIZE = 10_000
+
     @init_logging
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, engine: Engine = None):
         """
         Args:
-            config: 환경변수 설정 dict (host, port, dbname, username, password 포함)
+            config: 환경변수 설정 dict (host, port, dbname, username, password 포함, chunk_size 선택)
+            engine: 외부에서 주입할 SQLAlchemy engine (None이면 config로 생성)
         """
-        # SQLAlchemy engine 생성
-        connection_string = (
-            f"mysql+pymysql://{config['username']}:{config['password']}"
-            f"@{config['host']}:{config['port']}/{config['dbname']}"
-        )
-        self.engine = create_engine(connection_string, pool_recycle=3600, pool_size=5)
+        self.chunk_size = int(config.get('chunk_size', self.CHUNK_SIZE))
+
+        self.engine = engine if engine is not None else create_mysql_engine(config)
 
     @func_logging
     def save(self, address: StockAddress, df: pd.DataFrame, storage_last_ts: int = None) -> None:
         """
         데이터 저장
 
+        storage_last_ts 이상 기존 데이터를 지운 뒤 chunk_size 단위 다중 행 UPSERT로 기록한다.
+        UPSERT이므로 초기 저장이 이미 있는 행과 겹쳐도(백필 재실행 등) 실패하지 않는다.
+        같은 트랜잭션에서 메타데이터 테이블의 write_version을 1 올린다 (MySQLLoadStrategy.version 토큰).
+
         Args:
             address: StockAddress 객체
             df: 저장할 DataFrame
@@ -34,7 +44,7 @@ class MySQLSaveStrategy(BaseSaveStrategy):
         table_name = address.to_tablename()
 
         # round(4) 전처리
-        df_to_save = self._preprocess(df.copy())
+        df_to_save = self._preprocess(df[self.COLUMNS].copy())
 
         with self.engine.begin() as connection:
             if storage_last_ts is not None:
@@ -45,9 +55,82 @@ class MySQLSaveStrategy(BaseSaveStrategy):
                 # df에서 storage_last_ts 이상만 필터링
                 df_to_save = df_to_save[df_to_save['timestamp'] >= storage_last_ts]
 
-            # INSERT
+            # UPSERT (드라이버 executemany에 튜플을 직접 전달해 SQLAlchemy 바인딩 처리 생략)
             if not df_to_save.empty:
-                df_to_save.to_sql(table_name, connection, if_exists='append', index=False)
+                upsert_sql = self._upsert_sql(table_name, connection.dialect)
+                for params in self._chunks(df_to_save):
+                    connection.exec_driver_sql(upsert_sql, params)
+
+            connection.execute(
+                text(self._bump_version_sql(connection.dialect)),
+                {"address_key": table_name, "now": int(time.time())},
+            )
+
+    def _upsert_sql(self, table_name: str, dialect) -> str:
+        """
+        방언별 UPSERT 구문
+
+        Args:
+            table_name: 테이블명
+            dialect: SQLAlchemy Dialect (mysql/mariadb, sqlite)
+
+        Returns:
+            드라이버 paramstyle 위치 파라미터를 가진 SQL (COLUMNS 순서)
+        """
+        placeholder = '?' if dialect.paramstyle == 'qmark' else '%s'
+        columns = ', '.join(self.COLUMNS)
+        values = ', '.join([placeholder] * len(self.COLUMNS))
+        value_columns = self.COLUMNS[1:]
+
+        if dialect.name == 'sqlite':
+            updates = ', '.join(f"{c} = excluded.{c}" for c in value_columns)
+            return (
+                f"INSERT INTO {table_name} ({columns}) VALUES ({values}) "
+                f"ON CONFLICT(timestamp) DO UPDATE SET {updates}"
+            )
+
+        updates = ', '.join(f"{c} = VALUES({c})" for c in value_columns)
+        return (
+            f"INSERT INTO {table_name} ({columns}) VALUES ({values}) "
+            f"ON DUPLICATE KEY UPDATE {updates}"
+        )
+
+    @staticmethod
+    def _bump_version_sql(dialect) -> str:
+        """
+        방언별 쓰기 버전 증가 구문 (메타데이터 행이 없으면 write_version=1로 생성)
+
+        Args:
+            dialect: SQLAlchemy Dialect (mysql/mariadb, sqlite)
+
+        Returns:
+            :address_key, :now 파라미터를 가진 SQL
+        """
+        insert = (
+            f"INSERT INTO {METADATA_TABLE} (address_key, last_update_ts, write_version) "
+            f"VALUES (:address_key, :now, 1) "
+        )
+        if dialect.name == 'sqlite':
+            return insert + "ON CONFLICT(address_key) DO UPDATE SET write_version = write_version + 1"
+        return insert + "ON DUPLICATE KEY UPDATE write_version = write_version + 1"
+
+    def _chunks(self, df: pd.DataFrame):
+        """
+        DataFrame을 chunk_size 행 단위 파라미터 리스트로 변환
+
+        Args:
+            df: 저장할 DataFrame
+
+        Yields:
+            [(timestamp, high, low, open, close, volume), ...]
+        """
+        # 컬럼 단위 tolist()로 NumPy 스칼라를 파이썬 기본형으로 한 번에 변환
+        columns = [df[c].tolist() for c in self.COLUMNS]
+        rows = len(df)
+
+        for begin in range(0, rows, self.chunk_size):
+            end = min(begin + self.chunk_size, rows)
+            yield list(zip(*(column[begin:end] for column in columns)))
 
     @func_logging
     def _preprocess(self, df: pd.DataFrame) -> pd.DataFrame:
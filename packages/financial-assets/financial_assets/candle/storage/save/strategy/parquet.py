@@ -3,59 +3,62 @@ import pandas as pd
 from functools import reduce
 from math import gcd
 from .....stock_address import StockAddress
+from ...parquet_manifest import ParquetManifest
+from ... import dtype_profile
 from .base import BaseSaveStrategy
 from simple_logger import init_logging, func_logging
 
 
 class ParquetSaveStrategy(BaseSaveStrategy):
-    """Parquet 데이터 저장 전략"""
+    """Parquet 데이터 저장 전략 (주소별 파티션 + 매니페스트)"""
+
+    # row group 당 행 수 (범위 로드 시 row group 통계로 건너뛰는 단위)
+    ROW_GROUP_SIZE = 50_000
+
+    # 파티션 파일 당 최대 행 수 (업데이트 시 다시 쓰는 최대 단위)
+    PARTITION_ROWS = 200_000
 
     @init_logging
     def __init__(self, config: dict):
         """
         Args:
-            config: 환경변수 설정 dict (basepath 포함)
+            config: 환경변수 설정 dict (basepath 포함, dtype_profile 선택)
         """
         self.basepath = Path(config['basepath'])
+        self.profile = dtype_profile.resolve_profile(config)
 
     @func_logging
     def save(self, address: StockAddress, df: pd.DataFrame, storage_last_ts: int = None) -> None:
         """
         데이터 저장
 
+        업데이트 시에는 storage_last_ts 이상을 포함하는 파티션과 가득 차지 않은 마지막 파티션만
+        다시 쓰므로, 비용이 전체 이력이 아니라 꼬리 파티션 크기에 비례한다.
+
         Args:
             address: StockAddress 객체
             df: 저장할 DataFrame
             storage_last_ts: 저장소에 기록된 마지막 타임스탬프
         """
-        filepath = self.basepath / f"{address.to_filename()}.parquet"
+        dirpath = ParquetManifest.dirpath_for(self.basepath, address)
+        legacy_path = ParquetManifest.legacy_path_for(self.basepath, address)
 
         if storage_last_ts is None:
             # 초기 저장
-            if filepath.exists():
-                raise FileExistsError(f"File already exists: {filepath}")
+            if ParquetManifest.exists(dirpath):
+                raise FileExistsError(f"File already exists: {dirpath}")
+            if legacy_path.exists():
+                raise FileExistsError(f"File already exists: {legacy_path}")
 
             # round(4) 전처리
             df_to_save = self._preprocess(df.copy())
+            df_to_save = df_to_save.sort_values('timestamp').reset_index(drop=True)
 
-            # tick 변환 및 저장
-            self._save_with_tick(df_to_save, filepath)
+            manifest = ParquetManifest(dirpath)
+            self._write_partitions(manifest, [], df_to_save)
         else:
             # 업데이트 저장
-            # 기존 파일 로드
-            existing_df = pd.read_parquet(filepath)
-
-            # metadata에서 unit 읽기
-            metadata = pd.read_parquet(filepath).attrs
-            unit = metadata.get('unit', 1)
-
-            # tick을 timestamp로 역변환
-            if 'tick' in existing_df.columns:
-                existing_df['timestamp'] = existing_df['tick'] * unit
-                existing_df = existing_df.drop(columns=['tick'])
-
-            # storage_last_ts 이상 데이터 제거
-            existing_df = existing_df[existing_df['timestamp'] < storage_last_ts]
+            manifest = self._load_manifest(dirpath, legacy_path)
 
             # df에서 storage_last_ts 이상만 필터링
             df_to_add = df[df['timestamp'] >= storage_last_ts].copy()
@@ -63,12 +66,105 @@ class ParquetSaveStrategy(BaseSaveStrategy):
             # round(4) 전처리
             df_to_add = self._preprocess(df_to_add)
 
+            # 다시 쓸 파티션: storage_last_ts 이상 데이터를 포함하는 파티션 + 가득 차지 않은 마지막 파티션
+            keep = [p for p in manifest.partitions if p['max_ts'] < storage_last_ts]
+            rewrite = [p for p in manifest.partitions if p['max_ts'] >= storage_last_ts]
+            if keep and keep[-1]['rows'] < self.PARTITION_ROWS:
+                rewrite.insert(0, keep.pop())
+
+            # 다시 쓸 파티션에서 storage_last_ts 미만 데이터만 유지
+            parts = []
+            for partition in rewrite:
+                if partition['min_ts'] >= storage_last_ts:
+                    continue
+                existing_df = self._read_partition(manifest.path_of(partition))
+                parts.append(existing_df[existing_df['timestamp'] < storage_last_ts])
+
             # 병합
-            combined_df = pd.concat([existing_df, df_to_add], ignore_index=True)
+            combined_df = pd.concat(parts + [df_to_add], ignore_index=True)
             combined_df = combined_df.sort_values('timestamp').reset_index(drop=True)
 
-            # tick 변환 및 저장
-            self._save_with_tick(combined_df, filepath)
+            self._write_partitions(manifest, keep, combined_df, obsolete=rewrite)
+
+            # 단일 파일 레이아웃에서 이전한 경우 기존 파일 제거
+            legacy_path.unlink(missing_ok=True)
+
+    @func_logging
+    def _load_manifest(self, dirpath: Path, legacy_path: Path) -> ParquetManifest:
+        """
+        매니페스트 로드. 단일 파일 레이아웃이면 파티션 하나로 등록
+
+        Args:
+            dirpath: 주소별 파티션 디렉토리
+            legacy_path: 단일 파일 레이아웃 경로
+
+        Returns:
+            ParquetManifest 객체
+        """
+        if ParquetManifest.exists(dirpath) or not legacy_path.exists():
+            return ParquetManifest.load(dirpath)
+
+        # 기존 단일 파일을 파티션으로 이전 (데이터는 업데이트 시 꼬리 파티션과 함께 다시 쓰임)
+        legacy_df = self._read_partition(legacy_path)
+        manifest = ParquetManifest(dirpath)
+        self._write_partitions(manifest, [], legacy_df)
+        return manifest
+
+    @func_logging
+    def _write_partitions(self, manifest: ParquetManifest, keep: list, df: pd.DataFrame, obsolete: list = None) -> None:
+        """
+        df를 PARTITION_ROWS 단위 새 파티션으로 기록하고 매니페스트 교체
+
+        Args:
+            manifest: ParquetManifest 객체
+            keep: 그대로 유지할 파티션 목록
+            df: 새로 기록할 DataFrame (timestamp 정렬됨)
+            obsolete: 매니페스트 교체 후 삭제할 파티션 목록
+        """
+        manifest.dirpath.mkdir(parents=True, exist_ok=True)
+
+        written = []
+        for begin in range(0, len(df), self.PARTITION_ROWS):
+            chunk = df.iloc[begin:begin + self.PARTITION_ROWS]
+            path = manifest.new_partition_path()
+            self._save_with_tick(chunk, path)
+            written.append({
+                'file': path.name,
+                'min_ts': int(chunk['timestamp'].iloc[0]),
+                'max_ts': int(chunk['timestamp'].iloc[-1]),
+                'rows': len(chunk),
+            })
+
+        manifest.partitions = keep + written
+        manifest.save()
+
+        # 매니페스트가 더 이상 가리키지 않는 파일 정리
+        for partition in obsolete or []:
+            manifest.path_of(partition).unlink(missing_ok=True)
+
+    @staticmethod
+    def _read_partition(filepath: Path) -> pd.DataFrame:
+        """
+        파티션 파일을 timestamp 컬럼 DataFrame으로 로드
+
+        Args:
+            filepath: parquet 파일 경로
+
+        Returns:
+            timestamp 컬럼을 가진 DataFrame
+        """
+        df = pd.read_parquet(filepath)
+
+        # metadata에서 unit 읽기, 정수 가격 복원
+        unit = df.attrs.get('unit', 1)
+        df = dtype_profile.decode(df, df.attrs)
+
+        # tick을 timestamp로 역변환
+        if 'tick' in df.columns:
+            df['timestamp'] = df['tick'] * unit
+            df = df.drop(columns=['tick'])
+
+        return df[['timestamp', 'high', 'low', 'open', 'close', 'volume']]
 
     @func_logging
     def _preprocess(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -119,7 +215,9 @@ class ParquetSaveStrategy(BaseSaveStrategy):
     @func_logging
     def _save_with_tick(self, df: pd.DataFrame, filepath: Path) -> None:
         """
-        tick 변환 후 저장
+        tick 변환, 프로파일 dtype 변환 후 저장
+
+        tick 컬럼은 사전 인코딩 대신 delta 인코딩으로 기록한다 (일정 간격이면 거의 0바이트).
 
         Args:
             df: 저장할 DataFrame
@@ -137,8 +235,18 @@ class ParquetSaveStrategy(BaseSaveStrategy):
         cols = ['tick', 'high', 'low', 'open', 'close', 'volume']
         df_to_save = df_to_save[cols]
 
+        # 가격/거래량을 프로파일 dtype으로 변환
+        df_to_save, profile_attrs = dtype_profile.encode(df_to_save, self.profile)
+
         # metadata에 unit 저장 (int로 변환하여 JSON serialization 문제 방지)
         df_to_save.attrs['unit'] = int(unit)
+        df_to_save.attrs.update(profile_attrs)
 
         # parquet 저장
-        df_to_save.to_parquet(filepath, index=False)
+        df_to_save.to_parquet(
+            filepath,
+            index=False,
+            row_group_size=self.ROW_GROUP_SIZE,
+            use_dictionary=cols[1:],
+            column_encoding={'tick': 'DELTA_BINARY_PACKED'},
+        )
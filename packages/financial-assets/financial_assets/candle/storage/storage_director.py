@@ -1,3 +1,7 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from ...stock_address import StockAddress
 from .prepare import PrepareWorker
 from .save import SaveWorker
 from .load import LoadWorker
@@ -6,18 +10,25 @@ from .prepare.strategy import ParquetPrepareStrategy, MySQLPrepareStrategy
 from .save.strategy import ParquetSaveStrategy, MySQLSaveStrategy
 from .load.strategy import ParquetLoadStrategy, MySQLLoadStrategy
 from .metadata.strategy import ParquetMetadataStrategy, MySQLMetadataStrategy
+from .mysql_engine import create_mysql_engine
 from simple_logger import init_logging, func_logging
 
 
 class StorageDirector:
     """전략 선택 및 Worker 관리"""
 
+    # load_many/save_many 동시 I/O 스레드 수 기본값
+    MAX_WORKERS = 8
+
     @init_logging
     def __init__(self, env_config: dict):
         """
         Args:
-            env_config: 환경변수 설정 dict
+            env_config: 환경변수 설정 dict (max_workers 지정 시 일괄 작업 스레드 수,
+                mysql 전략은 pool_size/max_overflow로 공유 커넥션 풀 크기 조정)
         """
+        self.max_workers = int(env_config.get('max_workers', self.MAX_WORKERS))
+
         strategy = env_config.get('strategy')
 
         if strategy == 'parquet':
@@ -26,10 +37,12 @@ class StorageDirector:
             load_strategy = ParquetLoadStrategy(env_config)
             metadata_strategy = ParquetMetadataStrategy(env_config)
         elif strategy == 'mysql':
-            prepare_strategy = MySQLPrepareStrategy(env_config)
-            save_strategy = MySQLSaveStrategy(env_config)
-            load_strategy = MySQLLoadStrategy(env_config)
-            metadata_strategy = MySQLMetadataStrategy(env_config)
+            # 네 전략이 하나의 engine(커넥션 풀)을 공유
+            self.engine = create_mysql_engine(env_config)
+            prepare_strategy = MySQLPrepareStrategy(env_config, engine=self.engine)
+            save_strategy = MySQLSaveStrategy(env_config, engine=self.engine)
+            load_strategy = MySQLLoadStrategy(env_config, engine=self.engine)
+            metadata_strategy = MySQLMetadataStrategy(env_config, engine=self.engine)
         else:
             raise ValueError(f"Unsupported storage strategy: {strategy}")
 
@@ -58,3 +71,79 @@ class StorageDirector:
     def get_metadata_worker(self) -> MetadataWorker:
         """MetadataWorker 인스턴스 반환"""
         return self.metadata_worker
+
+    @func_logging
+    def load_many(self, addresses: list[StockAddress], start_ts: int = None, end_ts: int = None) -> list[pd.DataFrame]:
+        """
+        여러 주소의 데이터를 동시에 로드
+
+        Args:
+            addresses: StockAddress 리스트
+            start_ts: 시작 타임스탬프 (이상)
+            end_ts: 종료 타임스탬프 (미만)
+
+        Returns:
+            addresses 순서와 같은 DataFrame 리스트
+        """
+        if not addresses:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(addresses))) as executor:
+            return list(executor.map(lambda address: self.load_worker(address, start_ts, end_ts), addresses))
+
+    @func_logging
+    def save_many(self, candles: list) -> None:
+        """
+        여러 Candle을 동시에 저장하고 메타데이터는 한 번에 기록
+
+        각 Candle은 Candle.save()와 같은 순서(prepare → save)로 처리되며,
+        성공한 Candle만 빈 구간 인덱스와 is_new/storage_last_ts가 갱신되고 메타데이터에 기록된다.
+        실패한 Candle이 있으면 나머지 처리를 마친 뒤 첫 번째 예외를 다시 발생시킨다.
+
+        Args:
+            candles: Candle 리스트 (주소 중복 불가)
+
+        Raises:
+            ValueError: 같은 주소가 두 번 이상 포함된 경우
+        """
+        candles = [c for c in candles if c.candle_df is not None and not c.candle_df.empty]
+        if not candles:
+            return
+
+        keys = [c.address.to_filename() for c in candles]
+        if len(set(keys)) != len(keys):
+            raise ValueError("save_many does not accept duplicate addresses")
+
+        def save_one(candle) -> None:
+            if candle.is_new:
+                self.prepare_worker(candle.address)
+            self.save_worker(candle.address, candle.candle_df, candle.storage_last_ts)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(candles))) as executor:
+            futures = [executor.submit(save_one, candle) for candle in candles]
+
+        saved = []
+        errors = []
+        for candle, future in zip(candles, futures):
+            error = future.exception()
+            if error is not None:
+                errors.append(error)
+                continue
+
+            # 빈 구간 인덱스 갱신 후 상태 업데이트
+            try:
+                self.metadata_worker.update_gaps(candle.address, candle.candle_df['timestamp'].to_numpy(), candle.storage_last_ts)
+            except Exception as e:
+                errors.append(e)
+
+            candle.is_new = False
+            candle.storage_last_ts = int(candle.candle_df['timestamp'].iloc[-1])
+            saved.append(candle)
+
+        # 메타데이터 일괄 업데이트 (현재 시간으로 저장)
+        if saved:
+            now = int(time.time())
+            self.metadata_worker.set_many([(candle.address, now) for candle in saved])
+
+        if errors:
+            raise errors[0]
@@ -0,0 +1,49 @@
+"""테스트용 Candle 저장소 격리 fixture
+
+Candle은 첫 인스턴스 생성 시 EnvManageWorker로 .env를 읽어(없으면 작업 디렉토리에 생성)
+클래스 저장소를 만든다. 여기 fixture는 클래스 변수를 임시 디렉토리 설정으로 직접 교체하므로
+테스트가 .env나 기본 data/ 디렉토리를 남기지 않는다.
+
+다른 패키지 테스트에서는 conftest.py에서 import해 같은 fixture를 사용한다:
+    from financial_assets.candle.testing import candle_env, parquet_storage  # noqa: F401
+"""
+
+import pytest
+from .candle import Candle
+from .storage import StorageDirector
+from .column_cache import ColumnCache
+
+
+class FixedEnvManager:
+    """EnvManageWorker 대체: .env 대신 고정 설정 반환"""
+
+    def __init__(self, config: dict):
+        self._config = config
+
+    def __call__(self) -> dict:
+        return dict(self._config)
+
+
+def _parquet_env(basepath) -> dict:
+    return {'strategy': 'parquet', 'basepath': str(basepath), 'cache_dir': str(basepath / "cache")}
+
+
+@pytest.fixture
+def candle_env(tmp_path_factory, monkeypatch) -> None:
+    """Candle 기본 설정을 임시 디렉토리 Parquet 저장소로 교체 (저장소는 첫 Candle 생성 시 생성)"""
+    monkeypatch.setattr(Candle, "_env_manager", FixedEnvManager(_parquet_env(tmp_path_factory.mktemp("candle"))))
+    monkeypatch.setattr(Candle, "_storage", None)
+    monkeypatch.setattr(Candle, "_column_cache", None)
+    monkeypatch.setattr(Candle, "_load_cache", None)
+
+
+@pytest.fixture
+def parquet_storage(tmp_path, monkeypatch) -> StorageDirector:
+    """Candle 클래스 저장소를 임시 디렉토리의 Parquet 저장소로 교체"""
+    env_config = _parquet_env(tmp_path)
+    director = StorageDirector(env_config)
+    monkeypatch.setattr(Candle, "_env_manager", FixedEnvManager(env_config))
+    monkeypatch.setattr(Candle, "_storage", director)
+    monkeypatch.setattr(Candle, "_column_cache", ColumnCache(env_config['cache_dir']))
+    monkeypatch.setattr(Candle, "_load_cache", None)
+    return director
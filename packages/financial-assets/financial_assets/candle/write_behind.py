@@ -0,0 +1,188 @@
+import threading
+import pandas as pd
+from ..stock_address import StockAddress
+from .candle import Candle
+from simple_logger import init_logging, func_logging, logger
+
+
+class CandleWriteBehind:
+    """
+    실시간 캔들 업데이트를 모아 백그라운드 스레드에서 저장하는 write-behind 버퍼
+
+    update()는 DataFrame을 주소별 대기열에 넣고 바로 반환하므로 전략 루프 지연이 저장소(디스크/DB) 지연과 무관해진다.
+    flush_interval초마다 또는 대기 행 수가 flush_rows에 도달하면 주소별로 병합해 Candle.save_many로 한 번에 저장한다.
+    종료 시 close()(또는 with 블록)를 호출해야 대기 중인 데이터가 저장된다.
+    """
+
+    @init_logging
+    def __init__(self, flush_interval: float = 1.0, flush_rows: int = 10_000):
+        """
+        Args:
+            flush_interval: 백그라운드 저장 주기 (초)
+            flush_rows: 모든 주소의 대기 행 수 합이 이 값에 도달하면 주기를 기다리지 않고 저장
+        """
+        if flush_interval <= 0 or flush_rows < 1:
+            raise ValueError("flush_interval and flush_rows must be positive")
+
+        self.flush_interval = flush_interval
+        self.flush_rows = flush_rows
+
+        # 주소별 대기열 {address_key: (address, [DataFrame, ...])}
+        self._pending: dict = {}
+        self._pending_rows = 0
+        self._lock = threading.Lock()
+
+        # 저장은 한 번에 하나만 (백그라운드 스레드와 flush() 호출자 사이)
+        self._flush_lock = threading.Lock()
+
+        # 주소별 이어 저장 기준 Candle (저장 후 마지막 캔들만 유지)
+        self._candles: dict[str, Candle] = {}
+
+        self._closed = False
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="CandleWriteBehind", daemon=True)
+        self._thread.start()
+
+    def update(self, address: StockAddress, new_df: pd.DataFrame) -> None:
+        """
+        새 캔들을 대기열에 추가 (저장소 접근 없이 반환)
+
+        Args:
+            address: StockAddress 객체
+            new_df: 새 캔들 DataFrame (Candle.update와 같은 형식)
+
+        Raises:
+            RuntimeError: close() 이후 호출한 경우
+        """
+        if new_df is None or new_df.empty:
+            return
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("CandleWriteBehind is closed")
+
+            key = address.to_filename()
+            if key not in self._pending:
+                self._pending[key] = (address, [])
+            self._pending[key][1].append(new_df)
+            self._pending_rows += len(new_df)
+
+            if self._pending_rows >= self.flush_rows:
+                self._wakeup.set()
+
+    @property
+    def pending_rows(self) -> int:
+        """저장 대기 중인 행 수"""
+        with self._lock:
+            return self._pending_rows
+
+    @func_logging
+    def flush(self) -> None:
+        """
+        대기 중인 데이터를 호출 스레드에서 바로 저장
+
+        백그라운드 저장이 실패해 대기열로 돌아온 데이터도 함께 다시 시도한다.
+
+        Raises:
+            Exception: 저장 실패 시 (실패한 데이터는 대기열로 돌아가 다음 저장에서 다시 시도)
+        """
+        self._flush_once()
+
+    @func_logging
+    def close(self) -> None:
+        """
+        백그라운드 스레드를 멈추고 대기 중인 데이터를 모두 저장
+
+        Raises:
+            Exception: 마지막 저장이 실패한 경우
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        self._wakeup.set()
+        self._thread.join()
+        self.flush()
+
+    def __enter__(self) -> 'CandleWriteBehind':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        # flush_interval마다 또는 flush_rows 도달 시 저장, close() 후 종료
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+
+            try:
+                self._flush_once()
+            except Exception as e:
+                # 데이터는 대기열로 돌아갔으므로 다음 주기나 flush()/close()에서 다시 시도
+                logger.error(f"CandleWriteBehind 저장 실패: {e}")
+
+            with self._lock:
+                if self._closed:
+                    return
+
+    def _flush_once(self) -> None:
+        # 대기열을 비우고 주소별로 병합해 저장. 실패하면 꺼낸 데이터를 대기열 앞쪽에 되돌린다
+        with self._flush_lock:
+            with self._lock:
+                drained, self._pending = self._pending, {}
+                self._pending_rows = 0
+
+            if not drained:
+                return
+
+            try:
+                candles = [self._merge(address, frames) for address, frames in drained.values()]
+                Candle.save_many(candles)
+            except Exception:
+                # 어느 주소까지 저장됐는지 알 수 없으므로 기준 Candle을 버리고 다음 저장에서 저장소 기준으로 다시 연다
+                for key in drained:
+                    self._candles.pop(key, None)
+                self._requeue(drained)
+                raise
+
+            # 메모리에는 이어 저장 기준인 마지막 캔들만 남긴다
+            for candle in candles:
+                candle.candle_df = candle.candle_df.tail(1).reset_index(drop=True)
+                candle.is_partial = True
+
+    def _merge(self, address: StockAddress, frames: list[pd.DataFrame]) -> Candle:
+        # 주소의 대기 DataFrame들을 기준 Candle에 증가형 경로로 병합
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        first_ts = int(df['timestamp'].min())
+
+        key = address.to_filename()
+        candle = self._candles.get(key)
+        if candle is not None and candle.last_timestamp() is not None and first_ts >= candle.last_timestamp():
+            candle.update(df)
+            return candle
+
+        # 처음이거나 유지 중인 마지막 캔들보다 앞선 데이터면 그 지점부터 저장소에서 다시 연다
+        last_ts = Candle.get_storage_last_ts(address)
+        if last_ts is None:
+            candle = Candle(address)
+            candle.update(df)
+        else:
+            candle = Candle.load(address, start_ts=min(first_ts, last_ts))
+            candle.update(df)
+
+            # first_ts 이후 저장 데이터를 모두 읽었으므로 그 지점부터 다시 기록해도 안전하다
+            candle.storage_last_ts = min(candle.storage_last_ts, first_ts)
+
+        self._candles[key] = candle
+        return candle
+
+    def _requeue(self, drained: dict) -> None:
+        # 저장하지 못한 데이터를 그 사이 들어온 데이터보다 앞에 되돌린다
+        with self._lock:
+            for key, (address, frames) in drained.items():
+                self._pending_rows += sum(len(frame) for frame in frames)
+                if key in self._pending:
+                    frames = frames + self._pending[key][1]
+                self._pending[key] = (address, frames)
@@ -1,7 +1,6 @@
 """TensorBuilder: List[Candle]을 3D numpy 텐서로 변환"""
 
 import numpy as np
-import pandas as pd
 from typing import List
 from simple_logger import func_logging
 
@@ -37,23 +36,27 @@ class TensorBuilder:
         if len(exchanges) > 1:
             raise ValueError(f"모든 candle은 같은 exchange여야 합니다. 발견된 exchange: {exchanges}")
 
-        # 1. 타임스탬프 합집합 수집 (이미 정렬된 상태)
-        all_timestamps = set()
-        for candle in candles:
-            if not candle.candle_df.empty:
-                all_timestamps.update(candle.candle_df['timestamp'].values)
-
-        timestamps = np.array(sorted(all_timestamps), dtype=np.int64)
+        # 1. 타임스탬프 합집합 수집 (np.unique는 정렬된 결과 반환)
+        # Candle의 컬럼 배열을 직접 사용하므로 메모리 맵 Candle은 DataFrame을 만들지 않는다
+        columns = [
+            (candle, candle.timestamp if candle.timestamp is not None else np.empty(0, dtype=np.int64))
+            for candle in candles
+        ]
+        non_empty = [ts for _, ts in columns if len(ts) > 0]
+        if non_empty:
+            timestamps = np.unique(np.concatenate(non_empty)).astype(np.int64)
+        else:
+            timestamps = np.array([], dtype=np.int64)
 
         # 2. 종목 및 시작 시점 수집, 시작 시점 기준 정렬
         symbol_info = []
-        for candle in candles:
+        for candle, ts in columns:
             symbol = candle.address.to_symbol().to_slash()
-            if not candle.candle_df.empty:
-                first_ts = int(candle.candle_df['timestamp'].iloc[0])
+            if len(ts) > 0:
+                first_ts = int(ts[0])
             else:
                 first_ts = np.inf  # 빈 데이터는 뒤로
-            symbol_info.append((symbol, first_ts, candle))
+            symbol_info.append((symbol, first_ts, candle, ts))
 
         # 시작 시점 빠른 순 정렬
         symbol_info.sort(key=lambda x: x[1])
@@ -64,24 +67,16 @@ class TensorBuilder:
         n_timestamps = len(timestamps)
         tensor = np.full((n_symbols, n_timestamps, 5), np.nan, dtype=np.float64)
 
-        # 4. timestamp → index 매핑
-        ts_to_idx = {int(ts): idx for idx, ts in enumerate(timestamps)}
-
-        # 5. 각 Candle의 데이터를 텐서에 채우기
-        for symbol_idx, (symbol, _, candle) in enumerate(symbol_info):
-            if candle.candle_df.empty:
+        # 4. 각 Candle의 컬럼을 timestamp 인덱스 위치에 한 번에 채우기 (OHLCV 순서)
+        for symbol_idx, (symbol, _, candle, ts) in enumerate(symbol_info):
+            if len(ts) == 0:
                 continue
 
-            df = candle.candle_df
-            for _, row in df.iterrows():
-                ts = int(row['timestamp'])
-                ts_idx = ts_to_idx[ts]
-
-                # OHLCV 순서로 배치
-                tensor[symbol_idx, ts_idx, 0] = float(row['open'])
-                tensor[symbol_idx, ts_idx, 1] = float(row['high'])
-                tensor[symbol_idx, ts_idx, 2] = float(row['low'])
-                tensor[symbol_idx, ts_idx, 3] = float(row['close'])
-                tensor[symbol_idx, ts_idx, 4] = float(row['volume'])
+            ts_idx = np.searchsorted(timestamps, ts)
+            tensor[symbol_idx, ts_idx, 0] = candle.open
+            tensor[symbol_idx, ts_idx, 1] = candle.high
+            tensor[symbol_idx, ts_idx, 2] = candle.low
+            tensor[symbol_idx, ts_idx, 3] = candle.close
+            tensor[symbol_idx, ts_idx, 4] = candle.volume
 
         return tensor, symbols, timestamps
@@ -1,7 +1,13 @@
+import re
 from dataclasses import dataclass
 from ..symbol import Symbol
 
 
+# timeframe 단위별 초 (월 단위 "M"은 길이가 일정하지 않아 제외)
+_TIMEFRAME_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_TIMEFRAME_PATTERN = re.compile(r"^(\d+)([smhdw])$")
+
+
 @dataclass
 class StockAddress:
     """거래소와 거래쌍 정보 표현 주소 체계"""
@@ -20,6 +26,13 @@ class StockAddress:
         """언더스코어 구분 테이블명 형식 (소문자)"""
         return f"{self.archetype}_{self.exchange}_{self.tradetype}_{self.base}_{self.quote}_{self.timeframe}".lower()
 
+    def timeframe_seconds(self) -> int | None:
+        """timeframe의 캔들 간격 (초). 월 단위 등 간격이 일정하지 않으면 None"""
+        match = _TIMEFRAME_PATTERN.match(self.timeframe)
+        if match is None:
+            return None
+        return int(match.group(1)) * _TIMEFRAME_UNIT_SECONDS[match.group(2)]
+
     def to_symbol(self) -> Symbol:
         """거래쌍 심볼 객체 생성 (base/quote)"""
         return Symbol(f"{self.base}/{self.quote}")
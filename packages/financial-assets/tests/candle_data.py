@@ -0,0 +1,25 @@
+"""캔들 저장소 테스트용 데이터 생성 헬퍼"""
+
+import numpy as np
+import pandas as pd
+
+
+START_TS = 1609459200
+
+
+def make_candles(n: int, start_ts: int = START_TS, step: int = 60) -> pd.DataFrame:
+    """step 간격 캔들 n개 생성"""
+    close = 100.0 + np.arange(n, dtype=float)
+    return pd.DataFrame({
+        'timestamp': start_ts + step * np.arange(n),
+        'high': close + 1.0,
+        'low': close - 1.0,
+        'open': close,
+        'close': close,
+        'volume': np.ones(n),
+    })
+
+
+def drop_rows(df: pd.DataFrame, indices) -> pd.DataFrame:
+    """지정한 행을 빼서 빈 구간 만들기"""
+    return df.drop(index=list(indices)).reset_index(drop=True)
@@ -1,12 +1,19 @@
 """Pytest fixtures for financial-assets tests."""
 
 import pytest
+from sqlalchemy import create_engine, text
 from financial_assets.order import SpotOrder
 from financial_assets.trade import SpotTrade
 from financial_assets.constants import OrderSide
 from financial_assets.stock_address import StockAddress
 from financial_assets.pair import Pair
 from financial_assets.token import Token
+from financial_assets.candle.testing import candle_env, parquet_storage  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def isolated_candle_env(candle_env):
+    """parquet_storage를 쓰지 않는 테스트도 Candle 기본 저장소를 임시 디렉토리로 격리"""
 
 
 @pytest.fixture
@@ -98,3 +105,39 @@ def create_spot_trade(
         timestamp=timestamp,
         fee=fee,
     )
+
+
+@pytest.fixture
+def address():
+    return StockAddress("candle", "binance", "spot", "btc", "usdt", "1m")
+
+
+@pytest.fixture
+def config(tmp_path):
+    return {'basepath': str(tmp_path)}
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path, address):
+    """MySQL 저장 전략용 SQLite 대체 engine (캔들 테이블과 메타데이터 테이블 생성됨)"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'candles.db'}")
+    with engine.begin() as connection:
+        connection.execute(text(f"""
+        CREATE TABLE {address.to_tablename()} (
+            timestamp BIGINT NOT NULL,
+            high DECIMAL(13, 4) NOT NULL,
+            low DECIMAL(13, 4) NOT NULL,
+            open DECIMAL(13, 4) NOT NULL,
+            close DECIMAL(13, 4) NOT NULL,
+            volume DOUBLE NOT NULL,
+            PRIMARY KEY (timestamp)
+        )
+        """))
+        connection.execute(text("""
+        CREATE TABLE fa_candles_metadata (
+            address_key VARCHAR(64) PRIMARY KEY,
+            last_update_ts BIGINT NOT NULL,
+            write_version BIGINT NOT NULL DEFAULT 0
+        )
+        """))
+    return engine
@@ -0,0 +1,102 @@
+"""Candle.update 추가 버퍼 테스트"""
+
+import pandas as pd
+from financial_assets.candle import Candle
+from .candle_data import START_TS, make_candles
+
+
+class TestCandleIncrementalUpdate:
+    """Candle.update 추가 경로 테스트"""
+
+    def _reference(self, base, *updates):
+        combined = pd.concat([base, *updates], ignore_index=True)
+        combined = combined.drop_duplicates(subset=['timestamp'], keep='last')
+        return combined.sort_values('timestamp').reset_index(drop=True)
+
+    def test_append_uses_buffer(self, address):
+        """마지막 이후 데이터는 버퍼에 추가"""
+        candle = Candle(address, make_candles(5))
+        candle.update(make_candles(2, START_TS + 60 * 5))
+
+        assert candle._buffer is not None
+        assert candle.candle_df['timestamp'].tolist() == make_candles(7)['timestamp'].tolist()
+
+    def test_same_timestamp_overwrites_last_row(self, address):
+        """마지막 timestamp와 같으면 마지막 행만 갱신"""
+        candle = Candle(address, make_candles(5))
+        last = make_candles(1, START_TS + 60 * 4)
+        last['close'] = 555.0
+
+        candle.update(last)
+
+        assert len(candle.candle_df) == 5
+        assert candle.close[-1] == 555.0
+
+    def test_overwrite_keeps_earlier_snapshot(self, address):
+        """덮어쓰기 전에 받은 candle_df는 바뀌지 않음 (copy-on-write)"""
+        candle = Candle(address, make_candles(2))
+        candle.update(make_candles(1, START_TS + 60 * 2))
+        snapshot = candle.candle_df
+        last = make_candles(1, START_TS + 60 * 2)
+        last['close'] = 99.0
+
+        candle.update(last)
+
+        assert snapshot['close'].tolist() == [100.0, 101.0, 100.0]
+        assert candle.candle_df['close'].tolist() == [100.0, 101.0, 99.0]
+
+    def test_wider_dtype_is_not_downcast(self, address):
+        """float32 버퍼에 float64 값을 넣으면 버퍼를 float64로 넓힘"""
+        candle = Candle(address, make_candles(3).astype({'close': 'float32'}))
+        tick = make_candles(1, START_TS + 60 * 3)
+        tick['close'] = 0.1
+
+        candle.update(tick)
+
+        assert candle.close.dtype == 'float64'
+        assert candle.close[-1] == 0.1
+
+    def test_many_ticks_match_general_merge(self, address):
+        """틱 단위 갱신 결과가 일반 병합과 동일"""
+        base = make_candles(3)
+        candle = Candle(address, base)
+        updates = []
+        for i in range(3, 1500):
+            tick = make_candles(1, START_TS + 60 * i)
+            partial = tick.copy()
+            partial['close'] = -1.0
+            updates += [partial, tick]
+            candle.update(partial)
+            candle.update(tick)
+
+        pd.testing.assert_frame_equal(candle.candle_df, self._reference(base, *updates), check_dtype=False)
+
+    def test_out_of_order_falls_back_to_merge(self, address):
+        """과거 데이터가 섞이면 일반 병합"""
+        candle = Candle(address, make_candles(10, START_TS + 60 * 5))
+        candle.update(make_candles(2, START_TS + 60 * 15))
+        older = make_candles(3)
+
+        candle.update(older)
+
+        assert candle._buffer is None
+        expected = [START_TS + 60 * i for i in [0, 1, 2] + list(range(5, 17))]
+        assert candle.candle_df['timestamp'].tolist() == expected
+        assert candle.candle_df.index.tolist() == list(range(15))
+
+    def test_unsorted_new_rows_are_normalized(self, address):
+        """새 데이터 내부 순서/중복은 정리 후 추가"""
+        candle = Candle(address, make_candles(3))
+        new_df = make_candles(3, START_TS + 60 * 3).iloc[[2, 0, 1, 0]].reset_index(drop=True)
+
+        candle.update(new_df)
+
+        assert candle.timestamp.tolist() == [START_TS + 60 * i for i in range(6)]
+
+    def test_save_after_append(self, parquet_storage, address):
+        """버퍼 추가 후 저장/로드"""
+        candle = Candle(address, make_candles(5))
+        candle.save()
+        candle.update(make_candles(2, START_TS + 60 * 5), save_immediately=True)
+
+        assert Candle.load(address).candle_df['timestamp'].tolist() == make_candles(7)['timestamp'].tolist()
@@ -0,0 +1,93 @@
+"""메모리 맵 컬럼 캐시 테스트"""
+
+import numpy as np
+from financial_assets.candle import Candle
+from financial_assets.candle.column_cache import ColumnCache
+from .candle_data import START_TS, make_candles
+
+
+class TestColumnCache:
+    """메모리 맵 컬럼 캐시 테스트"""
+
+    def test_write_and_read_mapped(self, tmp_path, address):
+        """기록한 컬럼을 읽기 전용 메모리 맵으로 반환"""
+        cache = ColumnCache(str(tmp_path))
+        df = make_candles(50)
+        cache.write(address, df, source_version=123)
+
+        columns = cache.read(address, source_version=123)
+        assert isinstance(columns['close'], np.memmap)
+        assert columns['timestamp'].dtype == np.int64
+        assert not columns['close'].flags.writeable
+        np.testing.assert_array_equal(columns['close'], df['close'].to_numpy())
+
+    def test_version_mismatch_and_invalidate(self, tmp_path, address):
+        """원본 버전이 다르거나 무효화되면 None"""
+        cache = ColumnCache(str(tmp_path))
+        cache.write(address, make_candles(5), source_version=1)
+
+        assert cache.read(address, source_version=2) is None
+
+        cache.invalidate(address)
+        assert cache.read(address, source_version=1) is None
+
+    def test_rewrite_keeps_open_maps_valid(self, tmp_path, address):
+        """재기록해도 기존 메모리 맵 내용은 유지"""
+        cache = ColumnCache(str(tmp_path))
+        cache.write(address, make_candles(5), source_version=1)
+        old = cache.read(address, source_version=1)
+
+        cache.write(address, make_candles(8), source_version=2)
+
+        assert len(old['timestamp']) == 5
+        assert len(cache.read(address, source_version=2)['timestamp']) == 8
+
+
+class TestCandleLoadMapped:
+    """Candle.load_mapped 테스트"""
+
+    def test_load_mapped_zero_copy_views(self, parquet_storage, address):
+        """컬럼은 메모리 맵 뷰, DataFrame은 요청 시 생성"""
+        Candle(address, make_candles(20)).save()
+
+        candle = Candle.load_mapped(address)
+
+        assert isinstance(candle.close, np.memmap)
+        assert candle.storage_last_ts == START_TS + 60 * 19
+        assert candle._candle_df is None
+        assert candle.candle_df['close'].tolist() == make_candles(20)['close'].tolist()
+
+    def test_save_invalidates_cache(self, parquet_storage, address):
+        """저장 후에는 새 데이터로 캐시 재생성"""
+        candle = Candle(address, make_candles(20))
+        candle.save()
+        assert len(Candle.load_mapped(address).timestamp) == 20
+
+        candle.update(make_candles(25))
+        candle.save()
+
+        assert len(Candle.load_mapped(address).timestamp) == 25
+
+    def test_external_write_in_same_second_invalidates_cache(self, parquet_storage, address):
+        """다른 프로세스가 같은 초 안에 저장해도 (last_update_ts 동일) 오래된 캐시를 쓰지 않음"""
+        Candle(address, make_candles(20)).save()
+        assert len(Candle.load_mapped(address).timestamp) == 20
+        last_update_ts = parquet_storage.get_metadata_worker().get_last_update_ts(address)
+
+        # Candle.save의 명시적 무효화를 거치지 않는 저장 (다른 프로세스)
+        writer = Candle.load(address)
+        writer.update(make_candles(25))
+        parquet_storage.save_many([writer])
+        parquet_storage.get_metadata_worker().set_last_update_ts(address, last_update_ts)
+
+        assert len(Candle.load_mapped(address).timestamp) == 25
+
+    def test_update_replaces_mapped_columns(self, parquet_storage, address):
+        """update 후 컬럼 속성은 새 DataFrame 기준"""
+        Candle(address, make_candles(20)).save()
+        candle = Candle.load_mapped(address)
+
+        candle.update(make_candles(22))
+
+        assert not isinstance(candle.close, np.memmap)
+        assert len(candle.close) == 22
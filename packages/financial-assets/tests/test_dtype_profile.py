@@ -0,0 +1,119 @@
+"""dtype 저장 프로파일 테스트"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from sqlalchemy import create_engine
+from financial_assets.candle.column_cache import ColumnCache
+from financial_assets.candle.storage.save.strategy import ParquetSaveStrategy
+from financial_assets.candle.storage.load.strategy import ParquetLoadStrategy, MySQLLoadStrategy
+from financial_assets.candle.storage.save.strategy import MySQLSaveStrategy
+from financial_assets.candle.storage.prepare.strategy import MySQLPrepareStrategy
+from financial_assets.candle.storage.parquet_manifest import ParquetManifest
+from .candle_data import START_TS, make_candles
+
+
+class TestDtypeProfile:
+    """저장 dtype 프로파일 테스트"""
+
+    PRICES = ['high', 'low', 'open', 'close']
+
+    def _candles(self, n=300):
+        df = make_candles(n)
+        df['close'] = df['close'] + 0.12345
+        return df
+
+    def _partitions(self, config, address):
+        dirpath = ParquetManifest.dirpath_for(config['basepath'], address)
+        manifest = ParquetManifest.load(dirpath)
+        return [pq.ParquetFile(manifest.path_of(p)) for p in manifest.partitions]
+
+    def test_float32_profile(self, config, address):
+        """float32 프로파일은 float32로 저장하고 float32로 로드"""
+        config = {**config, 'dtype_profile': 'float32'}
+        df = self._candles()
+        ParquetSaveStrategy(config).save(address, df)
+
+        loaded = ParquetLoadStrategy(config).load(address)
+
+        assert all(loaded[c].dtype == np.float32 for c in self.PRICES + ['volume'])
+        assert np.allclose(loaded['close'], df['close'].round(4), rtol=1e-6)
+        assert str(self._partitions(config, address)[0].schema_arrow.field('close').type) == 'float'
+
+    def test_scaled_profile_round_trip(self, config, address):
+        """scaled 프로파일은 int32 정수로 저장하고 float64로 정확히 복원"""
+        config = {**config, 'dtype_profile': 'scaled'}
+        df = self._candles()
+        ParquetSaveStrategy(config).save(address, df)
+
+        parquet_file = self._partitions(config, address)[0]
+        assert str(parquet_file.schema_arrow.field('close').type) == 'int32'
+
+        load_strategy = ParquetLoadStrategy(config)
+        loaded = load_strategy.load(address)
+        ranged = load_strategy.load(address, START_TS + 60 * 10, START_TS + 60 * 20)
+        chunks = list(load_strategy.iter_chunks(address, chunk_rows=128))
+
+        assert loaded['close'].dtype == np.float64
+        assert loaded['close'].tolist() == df['close'].round(4).tolist()
+        assert ranged['close'].tolist() == df['close'].round(4).tolist()[10:20]
+        assert pd.concat(chunks)['close'].tolist() == df['close'].round(4).tolist()
+
+    def test_scaled_profile_large_prices_use_int64(self, config, address):
+        """int32 범위를 넘는 가격은 int64로 저장"""
+        config = {**config, 'dtype_profile': 'scaled'}
+        df = self._candles(10)
+        df['high'] = 500_000.5
+        ParquetSaveStrategy(config).save(address, df)
+
+        assert str(self._partitions(config, address)[0].schema_arrow.field('high').type) == 'int64'
+        assert ParquetLoadStrategy(config).load(address)['high'].tolist() == [500_000.5] * 10
+
+    def test_profile_change_keeps_old_partitions_readable(self, config, address):
+        """float64로 저장한 뒤 scaled로 업데이트해도 모든 파티션을 복원"""
+        save_strategy = ParquetSaveStrategy(config)
+        save_strategy.PARTITION_ROWS = 100
+        save_strategy.save(address, self._candles(250))
+
+        scaled_strategy = ParquetSaveStrategy({**config, 'dtype_profile': 'scaled'})
+        scaled_strategy.PARTITION_ROWS = 100
+        cut_ts = START_TS + 60 * 240
+        scaled_strategy.save(address, self._candles(300), cut_ts)
+
+        loaded = ParquetLoadStrategy(config).load(address)
+        assert loaded['close'].tolist() == self._candles(300)['close'].round(4).tolist()
+
+    def test_tick_column_delta_encoded(self, config, address):
+        """tick 컬럼은 delta 인코딩으로 기록"""
+        ParquetSaveStrategy(config).save(address, self._candles())
+
+        column = self._partitions(config, address)[0].metadata.row_group(0).column(0)
+        assert column.path_in_schema == 'tick'
+        assert 'DELTA_BINARY_PACKED' in column.encodings
+
+    def test_unsupported_profile(self, config):
+        """지원하지 않는 프로파일은 ValueError"""
+        with pytest.raises(ValueError):
+            ParquetSaveStrategy({**config, 'dtype_profile': 'float16'})
+        with pytest.raises(ValueError):
+            MySQLPrepareStrategy({'dtype_profile': 'scaled'}, engine=create_engine("sqlite://"))
+
+    def test_mysql_load_native_dtypes(self, sqlite_engine, address):
+        """MySQL 로드 결과는 프로파일 dtype의 NumPy 컬럼 (SQLite 대체)"""
+        MySQLSaveStrategy({}, engine=sqlite_engine).save(address, self._candles(20))
+
+        loaded = MySQLLoadStrategy({'dtype_profile': 'float32'}, engine=sqlite_engine).load(address)
+
+        assert loaded['timestamp'].dtype == np.int64
+        assert all(loaded[c].dtype == np.float32 for c in self.PRICES + ['volume'])
+
+    def test_column_cache_keeps_float32(self, tmp_path, address):
+        """컬럼 캐시는 float32 컬럼을 넓히지 않음"""
+        df = self._candles(10).astype({c: np.float32 for c in self.PRICES + ['volume']})
+        cache = ColumnCache(str(tmp_path))
+        cache.write(address, df, 1)
+
+        columns = cache.read(address, 1)
+        assert columns['close'].dtype == np.float32
+        assert columns['timestamp'].dtype == np.int64
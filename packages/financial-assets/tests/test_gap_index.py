@@ -0,0 +1,158 @@
+"""빈 구간 인덱스 테스트"""
+
+import numpy as np
+from sqlalchemy import create_engine, text
+from financial_assets.stock_address import StockAddress
+from financial_assets.candle import Candle
+from financial_assets.candle.storage.load.strategy import ParquetLoadStrategy, MySQLLoadStrategy
+from financial_assets.candle.storage.save.strategy import MySQLSaveStrategy
+from financial_assets.candle.storage.metadata.strategy import MySQLMetadataStrategy
+from financial_assets.candle.storage.parquet_manifest import ParquetManifest
+from financial_assets.candle.storage import gap_index
+from .candle_data import START_TS, make_candles, drop_rows
+
+
+class TestGapIndex:
+    """빈 구간 인덱스 테스트"""
+
+    def test_find_gaps(self):
+        """step보다 큰 간격만 [start, end)로 반환"""
+        timestamps = np.array([0, 60, 120, 300, 360, 600])
+        assert gap_index.find_gaps(timestamps, 60) == [(180, 300), (420, 600)]
+        assert gap_index.find_gaps(np.array([0, 60, 90, 120]), 60) == []
+        assert gap_index.find_gaps(np.array([0]), 60) == []
+
+    def test_gaps_for_save_uses_previous_row(self):
+        """df에 storage_last_ts 이전 행이 있으면 그 행을 기준으로 계산"""
+        timestamps = np.array([0, 60, 120, 300, 360])
+        assert gap_index.gaps_for_save(timestamps, 60, 120, []) == (120, [(180, 300)])
+        assert gap_index.gaps_for_save(timestamps, 60, None, []) == (None, [(180, 300)])
+
+    def test_gaps_for_save_without_previous_row(self):
+        """df가 storage_last_ts부터 시작하면 기존 인덱스로 직전 행 추정"""
+        timestamps = np.array([600, 840])
+        assert gap_index.gaps_for_save(timestamps, 60, 600, [(300, 600)]) == (600, [(300, 600), (660, 840)])
+        assert gap_index.gaps_for_save(timestamps, 60, 600, []) == (600, [(660, 840)])
+
+    def test_load_update_save_on_empty_address(self, parquet_storage, address):
+        """빈 주소를 load한 Candle(storage_last_ts=0)의 첫 저장은 epoch 0부터의 구간을 기록하지 않음"""
+        candle = Candle.load(address)
+        assert candle.storage_last_ts == 0
+
+        candle.update(drop_rows(make_candles(10), [4]))
+        candle.save()
+
+        assert Candle.get_gaps(address) == [(START_TS + 240, START_TS + 300)]
+        assert gap_index.gaps_for_save(np.array([600, 660]), 60, 0, []) == (None, [])
+
+    def test_clip_gaps(self):
+        """범위 경계로 자르고 겹치지 않는 구간 제거"""
+        gaps = [(100, 200), (300, 400), (500, 600)]
+        assert gap_index.clip_gaps(gaps, 150, 550) == [(150, 200), (300, 400), (500, 550)]
+        assert gap_index.clip_gaps(gaps, 400, 500) == []
+
+    def test_save_records_gaps(self, parquet_storage, address):
+        """초기 저장 시 빠진 구간 기록, 범위 조회는 경계로 잘림"""
+        Candle(address, drop_rows(make_candles(100), [10, 11, 12, 50])).save()
+
+        assert Candle.get_gaps(address) == [(START_TS + 600, START_TS + 780), (START_TS + 3000, START_TS + 3060)]
+        assert Candle.get_gaps(address, START_TS + 660, START_TS + 2000) == [(START_TS + 660, START_TS + 780)]
+
+    def test_update_extends_gaps(self, parquet_storage, address):
+        """업데이트 저장 시 기존 마지막 캔들과 새 데이터 사이 구간 추가"""
+        Candle(address, drop_rows(make_candles(20), [5])).save()
+
+        candle = Candle.load(address, START_TS + 60 * 15)
+        candle.update(make_candles(5, START_TS + 60 * 30), save_immediately=True)
+
+        assert Candle.get_gaps(address) == [(START_TS + 300, START_TS + 360), (START_TS + 1200, START_TS + 1800)]
+
+    def test_fill_gap_with_out_of_order_update(self, parquet_storage, address):
+        """빈 구간을 채우는 업데이트는 저장되고 인덱스에서 사라짐"""
+        Candle(address, drop_rows(make_candles(50), range(20, 25))).save()
+
+        candle = Candle.load(address)
+        candle.update(make_candles(5, START_TS + 60 * 20), save_immediately=True)
+
+        assert Candle.get_gaps(address) == []
+        assert Candle.load(address).candle_df['timestamp'].tolist() == make_candles(50)['timestamp'].tolist()
+
+    def test_irregular_timeframe_not_indexed(self, parquet_storage):
+        """월 단위 timeframe은 기록하지 않음"""
+        address = StockAddress("candle", "binance", "spot", "btc", "usdt", "1M")
+        Candle(address, make_candles(5, step=86400 * 31)).save()
+
+        assert Candle.get_gaps(address) == []
+
+    def test_save_many_records_gaps(self, parquet_storage, address):
+        """save_many도 빈 구간 인덱스 갱신"""
+        other = StockAddress("candle", "upbit", "spot", "btc", "krw", "1m")
+        Candle.save_many([Candle(address, drop_rows(make_candles(10), [3])), Candle(other, make_candles(10))])
+
+        assert Candle.get_gaps(address) == [(START_TS + 180, START_TS + 240)]
+        assert Candle.get_gaps(other) == []
+
+    def test_mysql_replace_gaps(self, tmp_path, monkeypatch, address):
+        """MySQL 전략 빈 구간 교체/조회 (SQLite 대체)"""
+        monkeypatch.setattr(MySQLMetadataStrategy, '_ensure_database_and_table', lambda self: None)
+        engine = create_engine(f"sqlite:///{tmp_path / 'meta.db'}")
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE fa_candles_gaps (address_key VARCHAR(64) NOT NULL, start_ts BIGINT NOT NULL, "
+                "end_ts BIGINT NOT NULL, PRIMARY KEY (address_key, start_ts))"
+            ))
+        strategy = MySQLMetadataStrategy({}, engine=engine)
+
+        strategy.replace_gaps(address, [(100, 200), (300, 400)])
+        strategy.replace_gaps(address, [(320, 500)], from_ts=350)
+
+        assert strategy.get_gaps(address) == [(100, 200), (320, 500)]
+        assert strategy.get_gaps(address, 450) == [(320, 500)]
+
+
+class TestStorageLastTimestamp:
+    """전체 로드 없는 마지막 캔들 timestamp 조회 테스트"""
+
+    def test_parquet_uses_manifest(self, parquet_storage, address):
+        """파티션 레이아웃은 매니페스트 max_ts 반환, 데이터 없으면 None"""
+        assert Candle.get_storage_last_ts(address) is None
+
+        Candle(address, make_candles(50)).save()
+
+        assert Candle.get_storage_last_ts(address) == START_TS + 60 * 49
+
+    def test_parquet_legacy_file(self, config, address):
+        """단일 파일 레이아웃은 로드해서 계산"""
+        make_candles(5).to_parquet(ParquetManifest.legacy_path_for(config['basepath'], address))
+
+        assert ParquetLoadStrategy(config).last_timestamp(address) == START_TS + 60 * 4
+
+    def test_mysql_max(self, sqlite_engine, address):
+        """MySQL 전략은 MAX(timestamp) 조회, 테이블이 없으면 None"""
+        MySQLSaveStrategy({}, engine=sqlite_engine).save(address, make_candles(20))
+        load_strategy = MySQLLoadStrategy({}, engine=sqlite_engine)
+
+        assert load_strategy.last_timestamp(address) == START_TS + 60 * 19
+        assert load_strategy.last_timestamp(StockAddress("candle", "binance", "spot", "eth", "usdt", "1m")) is None
+
+    def test_mysql_version_changes_on_write(self, sqlite_engine, address):
+        """MySQL 버전 토큰은 저장마다 증가하는 write_version (같은 초, 같은 행 수 덮어쓰기도 구분)"""
+        save_strategy = MySQLSaveStrategy({}, engine=sqlite_engine)
+        load_strategy = MySQLLoadStrategy({}, engine=sqlite_engine)
+        assert load_strategy.version(address) is None
+
+        save_strategy.save(address, make_candles(20))
+        first = load_strategy.version(address)
+        rewritten = make_candles(20)
+        rewritten.loc[19, 'close'] = -1.0
+        save_strategy.save(address, rewritten, storage_last_ts=START_TS + 60 * 19)
+
+        assert first == "write:1"
+        assert load_strategy.version(address) == "write:2"
+        assert load_strategy.version(StockAddress("candle", "binance", "spot", "eth", "usdt", "1m")) is None
+
+    def test_mysql_version_without_metadata_table(self, tmp_path, address):
+        """메타데이터 테이블이 없으면 None"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+
+        assert MySQLLoadStrategy({}, engine=engine).version(address) is None
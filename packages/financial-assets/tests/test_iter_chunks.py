@@ -0,0 +1,79 @@
+"""Candle.iter_chunks 테스트"""
+
+import pytest
+import pandas as pd
+from sqlalchemy import create_engine
+from financial_assets.candle import Candle
+from financial_assets.candle.storage.save.strategy import ParquetSaveStrategy
+from financial_assets.candle.storage.load.strategy import ParquetLoadStrategy, MySQLLoadStrategy
+from financial_assets.candle.storage.save.strategy import MySQLSaveStrategy
+from .candle_data import START_TS, make_candles
+
+
+class TestIterChunks:
+    """chunk 단위 스트리밍 로드 테스트"""
+
+    def _save(self, config, address, df):
+        save_strategy = ParquetSaveStrategy(config)
+        save_strategy.ROW_GROUP_SIZE = 40
+        save_strategy.PARTITION_ROWS = 150
+        save_strategy.save(address, df)
+
+    def test_parquet_chunks_across_partitions(self, config, address):
+        """파티션 경계와 무관하게 chunk_rows 크기로 순서대로 반환"""
+        df = make_candles(500)
+        self._save(config, address, df)
+
+        chunks = list(ParquetLoadStrategy(config).iter_chunks(address, chunk_rows=64))
+
+        assert [len(c) for c in chunks] == [64] * 7 + [52]
+        assert pd.concat(chunks)['timestamp'].tolist() == df['timestamp'].tolist()
+        assert list(chunks[0].columns) == ['timestamp', 'high', 'low', 'open', 'close', 'volume']
+
+    def test_parquet_chunks_range(self, config, address):
+        """범위 밖 행은 반환하지 않음"""
+        df = make_candles(500)
+        self._save(config, address, df)
+        start_ts = START_TS + 60 * 137
+        end_ts = START_TS + 60 * 321
+
+        chunks = list(ParquetLoadStrategy(config).iter_chunks(address, start_ts, end_ts, chunk_rows=50))
+
+        expected = df[(df['timestamp'] >= start_ts) & (df['timestamp'] < end_ts)]
+        assert all(len(c) <= 50 for c in chunks)
+        assert pd.concat(chunks)['timestamp'].tolist() == expected['timestamp'].tolist()
+        assert pd.concat(chunks)['close'].tolist() == expected['close'].tolist()
+
+    def test_parquet_missing_address(self, config, address):
+        """저장된 데이터가 없으면 chunk 없음"""
+        assert list(ParquetLoadStrategy(config).iter_chunks(address, chunk_rows=10)) == []
+
+    def test_candle_iter_chunks(self, parquet_storage, address):
+        """Candle.iter_chunks는 LoadWorker를 통해 스트리밍"""
+        Candle(address, make_candles(300)).save()
+
+        chunks = list(Candle.iter_chunks(address, chunk_rows=128))
+
+        assert [len(c) for c in chunks] == [128, 128, 44]
+        assert pd.concat(chunks)['timestamp'].tolist() == make_candles(300)['timestamp'].tolist()
+
+    def test_invalid_chunk_rows(self, parquet_storage, address):
+        """chunk_rows가 1 미만이면 ValueError"""
+        with pytest.raises(ValueError):
+            Candle.iter_chunks(address, chunk_rows=0)
+
+    def test_mysql_chunks(self, sqlite_engine, address):
+        """MySQL 전략은 chunk_rows 크기로 순서대로 반환 (SQLite 대체)"""
+        df = make_candles(250)
+        MySQLSaveStrategy({}, engine=sqlite_engine).save(address, df)
+        start_ts = START_TS + 60 * 10
+
+        chunks = list(MySQLLoadStrategy({}, engine=sqlite_engine).iter_chunks(address, start_ts, chunk_rows=100))
+
+        assert [len(c) for c in chunks] == [100, 100, 40]
+        assert pd.concat(chunks)['timestamp'].tolist() == df['timestamp'].tolist()[10:]
+
+    def test_mysql_missing_table(self, tmp_path, address):
+        """테이블이 없으면 chunk 없음"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+        assert list(MySQLLoadStrategy({}, engine=engine).iter_chunks(address, chunk_rows=10)) == []
@@ -0,0 +1,117 @@
+"""Candle.load LRU 캐시 테스트"""
+
+from financial_assets.stock_address import StockAddress
+from financial_assets.candle import Candle
+from financial_assets.candle.load_cache import LoadCache
+from .candle_data import START_TS, make_candles
+
+
+class TestLoadCache:
+    """Candle.load LRU 캐시 테스트"""
+
+    def test_contained_range_served_by_slicing(self, address):
+        """캐시된 범위에 포함되는 요청은 슬라이싱으로 응답"""
+        cache = LoadCache(10 * 1024 * 1024)
+        cache.put(address, None, None, make_candles(100))
+
+        df = cache.get(address, START_TS + 60 * 10, START_TS + 60 * 20)
+
+        assert df['timestamp'].tolist() == [START_TS + 60 * i for i in range(10, 20)]
+        assert cache.get(address, START_TS, None) is not None
+        assert cache.stats()['hits'] == 2
+
+    def test_uncontained_range_misses(self, address):
+        """캐시 범위를 벗어나는 요청은 miss"""
+        cache = LoadCache(10 * 1024 * 1024)
+        cache.put(address, START_TS + 60 * 10, START_TS + 60 * 20, make_candles(10, START_TS + 60 * 10))
+
+        assert cache.get(address, START_TS, START_TS + 60 * 15) is None
+        assert cache.get(address) is None
+        assert cache.stats()['misses'] == 2
+
+    def test_lru_eviction_by_bytes(self):
+        """바이트 상한 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        df = make_candles(100)
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        cache = LoadCache(size * 2)
+        addresses = [StockAddress("candle", "binance", "spot", f"s{i}", "usdt", "1m") for i in range(3)]
+
+        cache.put(addresses[0], None, None, df)
+        cache.put(addresses[1], None, None, df)
+        cache.get(addresses[0])
+        cache.put(addresses[2], None, None, df)
+
+        assert cache.get(addresses[1]) is None
+        assert cache.get(addresses[0]) is not None
+        assert cache.stats()['evictions'] == 1
+        assert cache.stats()['bytes'] <= size * 2
+
+    def test_returned_frame_is_isolated(self, address):
+        """반환된 DataFrame을 수정해도 캐시는 그대로"""
+        cache = LoadCache(10 * 1024 * 1024)
+        cache.put(address, None, None, make_candles(5))
+
+        df = cache.get(address)
+        df.loc[0, 'close'] = -1.0
+
+        assert cache.get(address)['close'].iloc[0] == 100.0
+
+    def test_put_after_invalidate_is_dropped(self, address):
+        """로드 도중 무효화되면 이전 세대 번호로 넣은 결과는 버림"""
+        cache = LoadCache(10 * 1024 * 1024)
+        generation = cache.generation(address)
+
+        cache.invalidate(address)
+        cache.put(address, None, None, make_candles(5), generation)
+        assert cache.get(address) is None
+
+        cache.put(address, None, None, make_candles(5), cache.generation(address))
+        assert len(cache.get(address)) == 5
+
+    def test_invalidate_only_touches_address(self, address):
+        """무효화는 해당 주소 항목만 제거하고 바이트 합계를 맞춤"""
+        cache = LoadCache(10 * 1024 * 1024)
+        other = StockAddress("candle", "binance", "spot", "eth", "usdt", "1m")
+        cache.put(address, None, None, make_candles(5))
+        cache.put(address, START_TS, None, make_candles(5))
+        cache.put(other, None, None, make_candles(5))
+
+        cache.invalidate(address)
+
+        assert cache.get(address) is None
+        assert cache.get(other) is not None
+        assert cache.stats()['entries'] == 1
+        assert cache.stats()['bytes'] == int(make_candles(5).memory_usage(index=True, deep=True).sum())
+
+    def test_candle_load_uses_cache_and_save_invalidates(self, parquet_storage, address, monkeypatch):
+        """Candle.load는 캐시를 사용하고 save 후에는 새로 로드"""
+        monkeypatch.setattr(Candle, "_load_cache", None)
+        Candle.enable_load_cache()
+        candle = Candle(address, make_candles(10))
+        candle.save()
+
+        assert len(Candle.load(address).candle_df) == 10
+        assert len(Candle.load(address, START_TS + 60 * 5).candle_df) == 5
+        assert Candle.load_cache_stats()['hits'] == 1
+
+        candle.update(make_candles(12), save_immediately=True)
+
+        assert len(Candle.load(address).candle_df) == 12
+        assert Candle.load_cache_stats()['misses'] == 2
+
+    def test_candle_load_many_loads_only_misses(self, parquet_storage, monkeypatch):
+        """load_many는 캐시에 없는 주소만 저장소에서 로드"""
+        monkeypatch.setattr(Candle, "_load_cache", None)
+        Candle.enable_load_cache()
+        addresses = [StockAddress("candle", "binance", "spot", f"s{i}", "usdt", "1m") for i in range(3)]
+        Candle.save_many([Candle(address, make_candles(4)) for address in addresses])
+        Candle.load(addresses[0])
+
+        requested = []
+        original = parquet_storage.load_many
+        monkeypatch.setattr(parquet_storage, "load_many", lambda a, s=None, e=None: requested.extend(a) or original(a, s, e))
+
+        candles = Candle.load_many(addresses)
+
+        assert [len(c.candle_df) for c in candles] == [4, 4, 4]
+        assert [a.base for a in requested] == ["s1", "s2"]
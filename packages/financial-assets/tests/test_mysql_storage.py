@@ -0,0 +1,101 @@
+"""MySQL 저장 전략 테스트 (SQLite engine 대체)"""
+
+import pandas as pd
+from sqlalchemy import create_engine, event, text
+from financial_assets.stock_address import StockAddress
+from financial_assets.candle.storage import StorageDirector
+from financial_assets.candle.storage.save.strategy import MySQLSaveStrategy
+from financial_assets.candle.storage.prepare.strategy import MySQLPrepareStrategy
+from financial_assets.candle.storage.metadata.strategy import MySQLMetadataStrategy
+from financial_assets.candle.storage.prepare.strategy import mysql as mysql_prepare_module
+from .candle_data import START_TS, make_candles
+
+
+class TestMySQLBulkSave:
+    """MySQLSaveStrategy 일괄 UPSERT 테스트 (SQLite 대체)"""
+
+    def _rows(self, engine, address):
+        with engine.connect() as connection:
+            return pd.read_sql(text(f"SELECT * FROM {address.to_tablename()} ORDER BY timestamp"), connection)
+
+    def test_chunked_initial_save(self, sqlite_engine, address):
+        """chunk_size 단위로 나눠 모두 기록"""
+        save_strategy = MySQLSaveStrategy({'chunk_size': 7}, engine=sqlite_engine)
+        chunks = []
+        original = save_strategy._chunks
+        save_strategy._chunks = lambda df: (chunks.append(len(c)) or c for c in original(df))
+
+        save_strategy.save(address, make_candles(30))
+
+        assert chunks == [7, 7, 7, 7, 2]
+        assert self._rows(sqlite_engine, address)['timestamp'].tolist() == make_candles(30)['timestamp'].tolist()
+
+    def test_initial_save_upserts_existing_rows(self, sqlite_engine, address):
+        """이미 있는 행과 겹쳐도 값을 갱신"""
+        save_strategy = MySQLSaveStrategy({}, engine=sqlite_engine)
+        save_strategy.save(address, make_candles(10))
+
+        updated = make_candles(12)
+        updated['close'] = 1.0
+        save_strategy.save(address, updated)
+
+        rows = self._rows(sqlite_engine, address)
+        assert len(rows) == 12
+        assert rows['close'].astype(float).tolist() == [1.0] * 12
+
+    def test_update_replaces_tail(self, sqlite_engine, address):
+        """storage_last_ts 이상은 새 데이터로 대체"""
+        save_strategy = MySQLSaveStrategy({}, engine=sqlite_engine)
+        save_strategy.save(address, make_candles(20))
+
+        cut_ts = START_TS + 60 * 10
+        save_strategy.save(address, make_candles(3, cut_ts), cut_ts)
+
+        assert self._rows(sqlite_engine, address)['timestamp'].tolist() == [START_TS + 60 * i for i in range(13)]
+
+
+class TestMySQLSharedEngine:
+    """MySQL 전략 공유 engine 및 DDL 1회 실행 테스트"""
+
+    MYSQL_CONFIG = {
+        'strategy': 'mysql', 'host': 'localhost', 'port': 3306, 'dbname': 'fa_test',
+        'username': 'root', 'password': '', 'pool_size': 3, 'max_overflow': 2,
+    }
+
+    def test_director_shares_one_engine(self, monkeypatch):
+        """네 전략이 같은 engine을 사용하고 풀 크기 설정을 반영"""
+        monkeypatch.setattr(MySQLMetadataStrategy, '_ensure_database_and_table', lambda self: None)
+
+        director = StorageDirector(self.MYSQL_CONFIG)
+        strategies = [
+            director.get_prepare_worker().strategy,
+            director.get_save_worker().strategy,
+            director.get_load_worker().strategy,
+            director.get_metadata_worker().strategy,
+        ]
+
+        assert all(strategy.engine is director.engine for strategy in strategies)
+        assert director.engine.pool.size() == 3
+        assert director.engine.pool._max_overflow == 2
+
+    def test_prepare_runs_ddl_once_per_table(self, tmp_path, monkeypatch, address):
+        """같은 테이블은 두 번째 prepare부터 DDL 없이 반환"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'candles.db'}")
+        statements = []
+        event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        # SQLite에는 데이터베이스/메타데이터 테이블(MySQL 전용 문법) 단계가 없으므로 완료된 것으로 간주
+        ensured = []
+        monkeypatch.setattr(mysql_prepare_module, 'ensure_database', ensured.append)
+        monkeypatch.setattr(MySQLPrepareStrategy, '_prepared', {(str(engine.url), None)})
+
+        prepare_strategy = MySQLPrepareStrategy(self.MYSQL_CONFIG, engine=engine)
+        other = StockAddress("candle", "binance", "spot", "eth", "usdt", "1m")
+        for _ in range(3):
+            prepare_strategy.prepare(address)
+        MySQLPrepareStrategy(self.MYSQL_CONFIG, engine=engine).prepare(address)
+        prepare_strategy.prepare(other)
+
+        creates = [sql for sql in statements if 'CREATE TABLE' in sql]
+        assert len(creates) == 2
+        assert len(ensured) == 2
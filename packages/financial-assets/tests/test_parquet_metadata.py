@@ -0,0 +1,101 @@
+"""SQLite 기반 Parquet 메타데이터 테스트"""
+
+import json
+import multiprocessing
+from sqlalchemy import create_engine, text
+from financial_assets.stock_address import StockAddress
+from financial_assets.candle import Candle
+from financial_assets.candle.storage.metadata.strategy import MySQLMetadataStrategy, ParquetMetadataStrategy
+from .candle_data import make_candles
+
+
+def _set_metadata_in_process(basepath: str, worker: int, count: int) -> None:
+    """다른 프로세스에서 메타데이터 기록 (프로세스 간 잠금 테스트용)"""
+    strategy = ParquetMetadataStrategy({'basepath': basepath})
+    for i in range(count):
+        address = StockAddress("candle", "binance", "spot", f"c{worker}x{i}", "usdt", "1m")
+        strategy.set_last_update_ts(address, worker * 1000 + i)
+
+
+class TestParquetMetadata:
+    """SQLite 기반 Parquet 메타데이터 전략 테스트"""
+
+    def _addresses(self, n):
+        return [StockAddress("candle", "binance", "spot", f"coin{i}", "usdt", "1m") for i in range(n)]
+
+    def test_set_and_get(self, config, address):
+        """저장한 값을 조회, 없으면 None"""
+        strategy = ParquetMetadataStrategy(config)
+        assert strategy.get_last_update_ts(address) is None
+
+        strategy.set_last_update_ts(address, 100)
+        strategy.set_last_update_ts(address, 200)
+
+        assert strategy.get_last_update_ts(address) == 200
+        assert ParquetMetadataStrategy(config).get_last_update_ts(address) == 200
+
+    def test_get_many_and_set_many(self, config):
+        """입력 순서대로 반환하고 없는 주소는 None (QUERY_BATCH 초과 포함)"""
+        strategy = ParquetMetadataStrategy(config)
+        addresses = self._addresses(1200)
+        strategy.set_many([(address, i) for i, address in enumerate(addresses) if i % 3])
+
+        result = strategy.get_many(list(reversed(addresses)))
+
+        expected = [None if i % 3 == 0 else i for i in reversed(range(1200))]
+        assert result == expected
+        assert strategy.get_many([]) == []
+
+    def test_migrates_legacy_json(self, config, tmp_path, address):
+        """이전 _metadata.json 값을 가져오고 파일은 .migrated로 변경"""
+        other = StockAddress("candle", "upbit", "spot", "btc", "krw", "1m")
+        (tmp_path / '_metadata.json').write_text(json.dumps({address.to_filename(): 123, other.to_filename(): 456}))
+
+        strategy = ParquetMetadataStrategy(config)
+
+        assert strategy.get_many([address, other]) == [123, 456]
+        assert not (tmp_path / '_metadata.json').exists()
+        assert (tmp_path / '_metadata.json.migrated').exists()
+
+    def test_concurrent_processes(self, config, tmp_path):
+        """여러 프로세스가 동시에 기록해도 유실 없음"""
+        ParquetMetadataStrategy(config)
+        context = multiprocessing.get_context('spawn')
+        processes = [
+            context.Process(target=_set_metadata_in_process, args=(str(tmp_path), worker, 30))
+            for worker in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        addresses = [
+            StockAddress("candle", "binance", "spot", f"c{worker}x{i}", "usdt", "1m")
+            for worker in range(4) for i in range(30)
+        ]
+        expected = [worker * 1000 + i for worker in range(4) for i in range(30)]
+        assert ParquetMetadataStrategy(config).get_many(addresses) == expected
+
+    def test_candle_get_last_update_ts_many(self, parquet_storage, address):
+        """Candle.get_last_update_ts_many는 저장된 주소만 값을 반환"""
+        other = StockAddress("candle", "upbit", "spot", "btc", "krw", "1m")
+        Candle(address, make_candles(5)).save()
+
+        result = Candle.get_last_update_ts_many([address, other])
+
+        assert result[0] is not None and result[1] is None
+
+    def test_mysql_get_many(self, tmp_path, monkeypatch, address):
+        """MySQL 전략 get_many는 IN 조회 한 번으로 순서대로 반환 (SQLite 대체)"""
+        monkeypatch.setattr(MySQLMetadataStrategy, '_ensure_database_and_table', lambda self: None)
+        engine = create_engine(f"sqlite:///{tmp_path / 'meta.db'}")
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE fa_candles_metadata (address_key VARCHAR(64) PRIMARY KEY, last_update_ts BIGINT)"))
+            connection.execute(text(f"INSERT INTO fa_candles_metadata VALUES ('{address.to_tablename()}', 77)"))
+        other = StockAddress("candle", "upbit", "spot", "btc", "krw", "1m")
+
+        strategy = MySQLMetadataStrategy({}, engine=engine)
+
+        assert strategy.get_many([other, address]) == [None, 77]
@@ -0,0 +1,185 @@
+"""Parquet 저장/범위 로드 테스트"""
+
+import pytest
+import pyarrow.parquet as pq
+from financial_assets.candle.storage.save.strategy import ParquetSaveStrategy
+from financial_assets.candle.storage.load.strategy import ParquetLoadStrategy
+from financial_assets.candle.storage.parquet_manifest import ParquetManifest
+from .candle_data import START_TS, make_candles
+
+
+class TestParquetRangeLoad:
+    """ParquetLoadStrategy 범위 로드 테스트"""
+
+    def setup_method(self):
+        self.df = make_candles(1000)
+
+    def _save(self, config, address, row_group_size=100):
+        save_strategy = ParquetSaveStrategy(config)
+        save_strategy.ROW_GROUP_SIZE = row_group_size
+        save_strategy.save(address, self.df)
+
+    def test_full_load(self, config, address):
+        """범위 없이 전체 로드"""
+        self._save(config, address)
+        df = ParquetLoadStrategy(config).load(address)
+
+        assert len(df) == 1000
+        assert list(df.columns) == ['timestamp', 'high', 'low', 'open', 'close', 'volume']
+        assert df['timestamp'].tolist() == self.df['timestamp'].tolist()
+
+    def test_range_load(self, config, address):
+        """start_ts 이상, end_ts 미만만 반환"""
+        self._save(config, address)
+        start_ts = START_TS + 60 * 250
+        end_ts = START_TS + 60 * 420
+
+        df = ParquetLoadStrategy(config).load(address, start_ts, end_ts)
+
+        expected = self.df[(self.df['timestamp'] >= start_ts) & (self.df['timestamp'] < end_ts)]
+        assert df['timestamp'].tolist() == expected['timestamp'].tolist()
+        assert df['close'].tolist() == expected['close'].tolist()
+
+    def test_bounds_between_ticks(self, config, address):
+        """tick 경계가 아닌 타임스탬프도 올바르게 변환"""
+        self._save(config, address)
+        df = ParquetLoadStrategy(config).load(address, START_TS + 61, START_TS + 181)
+
+        assert df['timestamp'].tolist() == [START_TS + 120, START_TS + 180]
+
+    def test_open_ended_range(self, config, address):
+        """한쪽 경계만 지정"""
+        self._save(config, address)
+        load_strategy = ParquetLoadStrategy(config)
+
+        tail = load_strategy.load(address, start_ts=START_TS + 60 * 998)
+        head = load_strategy.load(address, end_ts=START_TS + 60 * 2)
+
+        assert tail['timestamp'].tolist() == [START_TS + 60 * 998, START_TS + 60 * 999]
+        assert head['timestamp'].tolist() == [START_TS, START_TS + 60]
+
+    def test_empty_range(self, config, address):
+        """범위 밖이면 빈 DataFrame"""
+        self._save(config, address)
+        df = ParquetLoadStrategy(config).load(address, START_TS + 60 * 5000, START_TS + 60 * 6000)
+
+        assert df.empty
+        assert list(df.columns) == ['timestamp', 'high', 'low', 'open', 'close', 'volume']
+
+    def test_only_matching_row_groups_decoded(self, config, address, monkeypatch):
+        """겹치는 row group만 읽음"""
+        self._save(config, address)
+        requested = []
+        original = pq.ParquetFile.read_row_groups
+
+        def spy(self, row_groups, *args, **kwargs):
+            requested.extend(row_groups)
+            return original(self, row_groups, *args, **kwargs)
+
+        monkeypatch.setattr(pq.ParquetFile, "read_row_groups", spy)
+        ParquetLoadStrategy(config).load(address, START_TS + 60 * 950, START_TS + 60 * 1000)
+
+        assert requested == [9]
+
+
+class TestParquetPartitionedSave:
+    """ParquetSaveStrategy 파티션 레이아웃 테스트"""
+
+    def _strategy(self, config, partition_rows=100):
+        save_strategy = ParquetSaveStrategy(config)
+        save_strategy.PARTITION_ROWS = partition_rows
+        return save_strategy
+
+    def test_initial_save_splits_partitions(self, config, address):
+        """초기 저장은 PARTITION_ROWS 단위로 분할"""
+        self._strategy(config).save(address, make_candles(250))
+
+        manifest = ParquetManifest.load(ParquetManifest.dirpath_for(config['basepath'], address))
+        assert [p['rows'] for p in manifest.partitions] == [100, 100, 50]
+        assert manifest.partitions[1]['min_ts'] == START_TS + 60 * 100
+
+        df = ParquetLoadStrategy(config).load(address)
+        assert df['timestamp'].tolist() == make_candles(250)['timestamp'].tolist()
+
+    def test_initial_save_raises_if_exists(self, config, address):
+        """이미 저장된 주소에 초기 저장 시 예외"""
+        save_strategy = self._strategy(config)
+        save_strategy.save(address, make_candles(10))
+
+        with pytest.raises(FileExistsError):
+            save_strategy.save(address, make_candles(10))
+
+    def test_update_rewrites_only_tail(self, config, address):
+        """업데이트는 꼬리 파티션만 다시 쓴다"""
+        save_strategy = self._strategy(config)
+        df = make_candles(250)
+        save_strategy.save(address, df)
+
+        dirpath = ParquetManifest.dirpath_for(config['basepath'], address)
+        before = ParquetManifest.load(dirpath).partitions
+
+        # 마지막 캔들 갱신 + 새 캔들 1개
+        last_ts = int(df['timestamp'].iloc[-1])
+        updated = make_candles(251)
+        updated.loc[249, 'close'] = 999.0
+        save_strategy.save(address, updated, last_ts)
+
+        after = ParquetManifest.load(dirpath).partitions
+        assert after[:2] == before[:2]
+        assert after[2]['file'] != before[2]['file']
+        assert after[2]['rows'] == 51
+        assert not (dirpath / before[2]['file']).exists()
+
+        loaded = ParquetLoadStrategy(config).load(address)
+        assert loaded['timestamp'].tolist() == updated['timestamp'].tolist()
+        assert loaded['close'].iloc[249] == 999.0
+
+    def test_update_fills_tail_then_opens_new_partition(self, config, address):
+        """꼬리 파티션이 가득 차면 새 파티션 생성"""
+        save_strategy = self._strategy(config)
+        save_strategy.save(address, make_candles(100))
+
+        df = make_candles(130)
+        save_strategy.save(address, df, int(df['timestamp'].iloc[99]))
+
+        manifest = ParquetManifest.load(ParquetManifest.dirpath_for(config['basepath'], address))
+        assert [p['rows'] for p in manifest.partitions] == [100, 30]
+
+    def test_update_truncates_from_storage_last_ts(self, config, address):
+        """storage_last_ts 이상 기존 데이터는 새 데이터로 대체"""
+        save_strategy = self._strategy(config)
+        save_strategy.save(address, make_candles(250))
+
+        cut_ts = START_TS + 60 * 120
+        new_df = make_candles(5, start_ts=cut_ts)
+        save_strategy.save(address, new_df, cut_ts)
+
+        loaded = ParquetLoadStrategy(config).load(address)
+        assert len(loaded) == 125
+        assert int(loaded['timestamp'].iloc[-1]) == cut_ts + 60 * 4
+
+    def test_range_load_across_partitions(self, config, address):
+        """여러 파티션에 걸친 범위 로드"""
+        self._strategy(config).save(address, make_candles(250))
+
+        df = ParquetLoadStrategy(config).load(address, START_TS + 60 * 95, START_TS + 60 * 205)
+        assert df['timestamp'].tolist() == [START_TS + 60 * i for i in range(95, 205)]
+
+    def test_legacy_single_file_migrated_on_update(self, config, address):
+        """단일 파일 레이아웃은 로드 가능하고 업데이트 시 파티션으로 이전"""
+        legacy = make_candles(150)
+        legacy_df = legacy.rename(columns={'timestamp': 'tick'})
+        legacy_df['tick'] = legacy_df['tick'] // 60
+        legacy_df = legacy_df[['tick', 'high', 'low', 'open', 'close', 'volume']]
+        legacy_df.attrs['unit'] = 60
+        legacy_path = ParquetManifest.legacy_path_for(config['basepath'], address)
+        legacy_df.to_parquet(legacy_path, index=False)
+
+        load_strategy = ParquetLoadStrategy(config)
+        assert load_strategy.load(address)['timestamp'].tolist() == legacy['timestamp'].tolist()
+
+        df = make_candles(160)
+        self._strategy(config).save(address, df, int(legacy['timestamp'].iloc[-1]))
+
+        assert not legacy_path.exists()
+        assert load_strategy.load(address)['timestamp'].tolist() == df['timestamp'].tolist()
@@ -0,0 +1,79 @@
+"""OHLCV 리샘플링 테스트"""
+
+import pytest
+import pandas as pd
+from financial_assets.stock_address import StockAddress
+from financial_assets.candle import Candle
+from .candle_data import START_TS, make_candles, drop_rows
+
+
+class TestResample:
+    """상위 timeframe 집계 및 파생 캔들 materialize 테스트"""
+
+    def test_resample_ohlcv(self):
+        """open=first, high=max, low=min, close=last, volume=sum, 버킷은 UTC 기준 정렬"""
+        from financial_assets.candle.resample import resample
+
+        df = make_candles(12, start_ts=START_TS + 120)  # 00:02 ~ 00:13
+        result = resample(df, 300)
+
+        assert result['timestamp'].tolist() == [START_TS, START_TS + 300, START_TS + 600]
+        assert result['open'].tolist() == [100.0, 103.0, 108.0]
+        assert result['close'].tolist() == [102.0, 107.0, 111.0]
+        assert result['high'].tolist() == [103.0, 108.0, 112.0]
+        assert result['low'].tolist() == [99.0, 102.0, 107.0]
+        assert result['volume'].tolist() == [3.0, 5.0, 4.0]
+
+    def test_weekly_buckets_start_monday(self):
+        """주 단위 버킷은 월요일 00:00 UTC에서 시작"""
+        from financial_assets.candle.resample import resample
+
+        result = resample(make_candles(14, step=86400), 604800)  # 2021-01-01(금)부터 14일
+
+        assert result['timestamp'].tolist() == [1609113600, 1609718400, 1610323200]
+        assert result['volume'].tolist() == [3.0, 7.0, 4.0]
+
+    def test_candle_resample_validates_timeframe(self, parquet_storage, address):
+        """기준 간격의 배수가 아니면 거부"""
+        candle = Candle(address, make_candles(10))
+
+        assert candle.resample('5m').address.timeframe == '5m'
+        with pytest.raises(ValueError):
+            candle.resample('90s')
+        with pytest.raises(ValueError):
+            candle.resample('1M')
+
+    def test_rollup_matches_full_resample(self, parquet_storage, address):
+        """chunk 경계와 무관하게 전체 집계와 같은 결과를 저장"""
+        from financial_assets.candle import CandleRollup
+
+        base = drop_rows(make_candles(1000), [10, 11, 500])
+        Candle(address, base).save()
+
+        saved = CandleRollup(address, ['5m', '1h'], chunk_rows=37).refresh()
+
+        five = StockAddress("candle", "binance", "spot", "btc", "usdt", "5m")
+        assert saved[five.to_filename()] == 200
+        expected = Candle(address, base).resample('1h').candle_df
+        loaded = Candle.load(StockAddress("candle", "binance", "spot", "btc", "usdt", "1h")).candle_df
+        pd.testing.assert_frame_equal(loaded.reset_index(drop=True), expected, check_dtype=False)
+
+    def test_rollup_incremental(self, parquet_storage, address):
+        """기준 캔들이 추가되면 마지막 파생 버킷부터만 다시 계산"""
+        from financial_assets.candle import CandleRollup
+
+        candles = make_candles(100)
+        rollup = CandleRollup(address, ['1h'])
+
+        Candle(address, candles.head(70)).save()
+        rollup.refresh()
+
+        base = Candle.load(address, start_ts=START_TS + 60 * 69)
+        base.update(candles.iloc[70:], save_immediately=True)
+        saved = rollup.refresh()
+
+        hour = StockAddress("candle", "binance", "spot", "btc", "usdt", "1h")
+        assert saved == {hour.to_filename(): 1}  # 진행 중이던 01:00 버킷만 다시 계산
+        loaded = Candle.load(hour).candle_df
+        assert loaded['volume'].tolist() == [60.0, 40.0]
+        assert loaded['close'].tolist() == [159.0, 199.0]
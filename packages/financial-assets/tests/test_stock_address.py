@@ -182,6 +182,24 @@ class TestStockAddressToSymbol:
         assert symbol.to_slash() == "AAPL/USD"
 
 
+class TestStockAddressTimeframe:
+    """timeframe 간격 변환 테스트"""
+
+    @pytest.mark.parametrize("timeframe, seconds", [
+        ("1s", 1), ("1m", 60), ("15m", 900), ("4h", 14400), ("1d", 86400), ("1w", 604800),
+    ])
+    def test_timeframe_seconds(self, timeframe, seconds):
+        """고정 간격 timeframe은 초로 변환"""
+        address = StockAddress("candle", "binance", "spot", "btc", "usdt", timeframe)
+        assert address.timeframe_seconds() == seconds
+
+    @pytest.mark.parametrize("timeframe", ["1M", "daily", ""])
+    def test_irregular_timeframe(self, timeframe):
+        """월 단위나 알 수 없는 형식은 None"""
+        address = StockAddress("candle", "binance", "spot", "btc", "usdt", timeframe)
+        assert address.timeframe_seconds() is None
+
+
 class TestStockAddressIntegration:
     """StockAddress 통합 테스트"""
 
@@ -0,0 +1,78 @@
+"""StorageDirector 일괄 로드/저장 테스트"""
+
+import pytest
+from financial_assets.stock_address import StockAddress
+from financial_assets.candle import Candle
+from financial_assets.candle.storage import StorageDirector
+from .candle_data import START_TS, make_candles
+
+
+class TestStorageDirectorBatch:
+    """StorageDirector 일괄 로드/저장 테스트"""
+
+    def _addresses(self, n):
+        return [StockAddress("candle", "binance", "spot", f"sym{i}", "usdt", "1m") for i in range(n)]
+
+    def test_save_many_then_load_many(self, config):
+        """여러 주소 저장 후 입력 순서대로 로드"""
+        director = StorageDirector({'strategy': 'parquet', **config})
+        addresses = self._addresses(5)
+        candles = [Candle(address, make_candles(10 + i)) for i, address in enumerate(addresses)]
+
+        director.save_many(candles)
+
+        assert all(not c.is_new for c in candles)
+        assert [c.storage_last_ts for c in candles] == [START_TS + 60 * (9 + i) for i in range(5)]
+
+        dfs = director.load_many(addresses)
+        assert [len(df) for df in dfs] == [10, 11, 12, 13, 14]
+
+        ranged = director.load_many(addresses, START_TS + 60 * 10, START_TS + 60 * 12)
+        assert [len(df) for df in ranged] == [0, 1, 2, 2, 2]
+
+    def test_save_many_writes_metadata_once(self, config, monkeypatch):
+        """메타데이터는 한 번의 일괄 기록"""
+        director = StorageDirector({'strategy': 'parquet', **config})
+        calls = []
+        monkeypatch.setattr(director.metadata_worker.strategy, "set_many", lambda items: calls.append(items))
+
+        candles = [Candle(address, make_candles(3)) for address in self._addresses(4)]
+        director.save_many(candles)
+
+        assert len(calls) == 1
+        assert [address.to_filename() for address, _ in calls[0]] == [c.address.to_filename() for c in candles]
+
+    def test_save_many_incremental(self, config):
+        """두 번째 일괄 저장은 업데이트 경로 사용"""
+        director = StorageDirector({'strategy': 'parquet', **config})
+        candles = [Candle(address, make_candles(3)) for address in self._addresses(2)]
+        director.save_many(candles)
+
+        for candle in candles:
+            candle.update(make_candles(5))
+        director.save_many(candles)
+
+        assert [len(df) for df in director.load_many([c.address for c in candles])] == [5, 5]
+
+    def test_save_many_rejects_duplicates(self, config):
+        """같은 주소 중복 시 예외"""
+        director = StorageDirector({'strategy': 'parquet', **config})
+        address = self._addresses(1)[0]
+
+        with pytest.raises(ValueError):
+            director.save_many([Candle(address, make_candles(3)), Candle(address, make_candles(3))])
+
+    def test_save_many_partial_failure(self, config):
+        """실패한 Candle은 상태를 유지하고 나머지는 저장"""
+        director = StorageDirector({'strategy': 'parquet', **config})
+        good, bad = self._addresses(2)
+        director.save_many([Candle(bad, make_candles(3))])
+
+        # 이미 저장된 주소를 새 Candle로 초기 저장하면 FileExistsError
+        candles = [Candle(good, make_candles(3)), Candle(bad, make_candles(3))]
+        with pytest.raises(FileExistsError):
+            director.save_many(candles)
+
+        assert not candles[0].is_new
+        assert candles[1].is_new
+        assert director.metadata_worker.get_last_update_ts(good) is not None
@@ -214,3 +214,23 @@ class TestBuildTensor:
         assert tensor.shape == (1, 2, 5)
         assert len(symbols) == 1
         assert symbols[0] == "BTC/USDT"
+
+    def test_build_with_empty_candle(self):
+        """컬럼 없는 빈 DataFrame Candle은 NaN 행으로 뒤에 배치"""
+        addr1 = StockAddress("candle", "binance", "spot", "BTC", "USDT", "1m")
+        addr2 = StockAddress("candle", "binance", "spot", "ETH", "USDT", "1m")
+        df = pd.DataFrame({
+            'timestamp': [1609459200, 1609459260],
+            'open': [29000.0, 29100.0],
+            'high': [29100.0, 29200.0],
+            'low': [28900.0, 29000.0],
+            'close': [29050.0, 29150.0],
+            'volume': [100.0, 110.0]
+        })
+
+        tensor, symbols, timestamps = TensorBuilder.build([Candle(addr1, df), Candle(addr2, pd.DataFrame())])
+
+        assert tensor.shape == (2, 2, 5)
+        assert symbols == ["BTC/USDT", "ETH/USDT"]
+        assert timestamps.tolist() == [1609459200, 1609459260]
+        assert np.isnan(tensor[1]).all()
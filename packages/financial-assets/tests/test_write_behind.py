@@ -0,0 +1,95 @@
+"""write-behind 저장 테스트"""
+
+import time
+import pytest
+from financial_assets.stock_address import StockAddress
+from financial_assets.candle import Candle
+from .candle_data import START_TS, make_candles, drop_rows
+
+
+class TestWriteBehind:
+    """write-behind 버퍼 저장 테스트"""
+
+    def test_update_defers_until_flush(self, parquet_storage, address):
+        """update는 대기열에만 넣고 flush에서 주소별로 병합 저장"""
+        from financial_assets.candle import CandleWriteBehind
+
+        other = StockAddress("candle", "upbit", "spot", "btc", "krw", "1m")
+        candles = make_candles(30)
+
+        with CandleWriteBehind(flush_interval=60) as writer:
+            for i in range(30):
+                writer.update(address, candles.iloc[i:i + 1])
+                writer.update(other, candles.iloc[i:i + 1])
+
+            assert writer.pending_rows == 60
+            assert Candle.get_storage_last_ts(address) is None
+
+            writer.flush()
+            assert writer.pending_rows == 0
+            assert Candle.load(address).timestamp.tolist() == candles['timestamp'].tolist()
+            assert Candle.load(other).timestamp.tolist() == candles['timestamp'].tolist()
+            assert Candle.get_last_update_ts(address) is not None
+
+    def test_flush_rows_wakes_background_thread(self, parquet_storage, address):
+        """대기 행 수가 flush_rows에 도달하면 주기를 기다리지 않고 백그라운드 저장"""
+        from financial_assets.candle import CandleWriteBehind
+
+        writer = CandleWriteBehind(flush_interval=60, flush_rows=10)
+        try:
+            writer.update(address, make_candles(10))
+            for _ in range(100):
+                if Candle.get_storage_last_ts(address) is not None:
+                    break
+                time.sleep(0.05)
+            assert Candle.get_storage_last_ts(address) == START_TS + 60 * 9
+        finally:
+            writer.close()
+
+    def test_live_bar_and_late_rows(self, parquet_storage, address):
+        """진행 중인 캔들 재전송은 마지막 값으로 덮어쓰고, 늦게 온 과거 행도 저장"""
+        from financial_assets.candle import CandleWriteBehind
+
+        candles = make_candles(20)
+        writer = CandleWriteBehind(flush_interval=60)
+        writer.update(address, drop_rows(candles, [5]))
+        writer.flush()
+
+        live = candles.tail(1).copy()
+        live['close'] = -1.0
+        writer.update(address, live)
+        writer.update(address, candles.iloc[5:6])
+        writer.close()
+
+        loaded = Candle.load(address).candle_df
+        assert loaded['timestamp'].tolist() == candles['timestamp'].tolist()
+        assert loaded['close'].iloc[-1] == -1.0
+        assert Candle.get_gaps(address) == []
+
+        with pytest.raises(RuntimeError):
+            writer.update(address, candles)
+        writer.close()
+
+    def test_failed_flush_requeues(self, parquet_storage, address, monkeypatch):
+        """저장이 실패하면 데이터를 대기열로 되돌리고 다음 flush에서 저장"""
+        from financial_assets.candle import CandleWriteBehind
+
+        original = Candle.save_many
+        calls = []
+
+        def failing_once(candles):
+            calls.append(len(candles))
+            if len(calls) == 1:
+                raise OSError("disk full")
+            original(candles)
+
+        monkeypatch.setattr(Candle, 'save_many', staticmethod(failing_once))
+
+        writer = CandleWriteBehind(flush_interval=60)
+        writer.update(address, make_candles(10))
+        with pytest.raises(OSError):
+            writer.flush()
+        assert writer.pending_rows == 10
+
+        writer.close()
+        assert len(Candle.load(address).candle_df) == 10
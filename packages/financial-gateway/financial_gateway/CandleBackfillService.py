@@ -0,0 +1,235 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+from simple_logger import init_logging, func_logging, logger
+
+from financial_assets.candle import Candle
+from financial_assets.stock_address import StockAddress
+from financial_gateway.gateways.base import BaseGateway
+from financial_gateway.RequestFactory import RequestFactory
+
+
+class CandleBackfillService:
+    # 여러 주소의 캔들 이력을 거래소 페이지 단위로 나눠 동시에 받아 저장소에 이어 저장
+    # 요청 속도(weight/초당 횟수)는 Gateway의 Throttler가 제한하고, 이 서비스는 동시 요청 수만 제한한다
+    # 중단 후 다시 실행하면 저장소의 마지막 캔들부터 이어받는다
+
+    # 거래소별 요청 한 번에 받을 수 있는 최대 캔들 수
+    PAGE_SIZES = {
+        "binance_spot": 1000,
+        "upbit_spot": 200,
+    }
+    DEFAULT_PAGE_SIZE = 200
+
+    # start_time을 지원하지 않아 end_time(to) 기준 과거 방향으로 조회하는 거래소
+    BACKWARD_GATEWAYS = {"upbit_spot"}
+
+    MAX_CONCURRENCY = 4
+    FLUSH_PAGES = 20
+    MAX_RETRIES = 3
+    RETRY_DELAY = 1.0
+
+    @init_logging(level="INFO", log_params=True)
+    def __init__(
+        self,
+        gateway: BaseGateway,
+        max_concurrency: int = MAX_CONCURRENCY,
+        flush_pages: int = FLUSH_PAGES,
+        page_size: Optional[int] = None,
+        max_retries: int = MAX_RETRIES,
+        retry_delay: float = RETRY_DELAY,
+    ):
+        """
+        Args:
+            gateway: execute(SeeCandlesRequest)를 지원하는 Gateway
+            max_concurrency: 모든 주소를 합친 동시 요청 수 상한
+            flush_pages: 주소별로 이 페이지 수만큼 받을 때마다 저장 (메모리 상한이자 재개 단위)
+            page_size: 요청 당 캔들 수 (None이면 거래소별 기본값)
+            max_retries: 실패한 페이지 재시도 횟수
+            retry_delay: 첫 재시도 대기 시간 (초, 재시도마다 두 배)
+        """
+        if max_concurrency < 1 or flush_pages < 1:
+            raise ValueError("max_concurrency and flush_pages must be positive")
+
+        self.gateway = gateway
+        self.max_concurrency = max_concurrency
+        self.flush_pages = flush_pages
+        self.page_size = page_size or self.PAGE_SIZES.get(gateway.gateway_name, self.DEFAULT_PAGE_SIZE)
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.backward = gateway.gateway_name in self.BACKWARD_GATEWAYS
+        self._request_factory = RequestFactory(gateway.gateway_name)
+
+    @func_logging(level="INFO", log_params=True)
+    async def backfill(self, addresses: List[StockAddress], start_ts: int, end_ts: int) -> Dict[str, int]:
+        """
+        [start_ts, end_ts) 범위의 캔들을 받아 저장
+
+        주소마다 저장소의 마지막 캔들 timestamp(storage_last_ts)를 먼저 조회해
+        max(start_ts, storage_last_ts)부터 받는다. 마지막 캔들은 진행 중이었을 수 있으므로 다시 받아 덮어쓴다.
+        페이지는 flush_pages개씩 동시에 받고, 받은 순서대로 Candle.update → save로 이어 저장하므로
+        중단되어도 저장된 구간은 온전하다. 실패한 주소가 있으면 나머지를 마친 뒤 첫 번째 예외를 다시 발생시킨다.
+
+        Args:
+            addresses: StockAddress 리스트 (timeframe이 고정 간격이어야 함)
+            start_ts: 시작 타임스탬프 (초, 이상)
+            end_ts: 종료 타임스탬프 (초, 미만)
+
+        Returns:
+            {address.to_filename(): 받은 캔들 수}
+
+        Raises:
+            ValueError: 범위가 비었거나 timeframe 간격을 알 수 없는 경우
+        """
+        if start_ts >= end_ts:
+            raise ValueError(f"Empty backfill range: [{start_ts}, {end_ts})")
+
+        for address in addresses:
+            if address.timeframe_seconds() is None:
+                raise ValueError(f"Backfill requires a fixed-interval timeframe: {address.timeframe}")
+
+        # 이어받을 지점 조회 (저장소 초기화가 한 번만 일어나도록 한 스레드에서 순서대로)
+        last_timestamps = await asyncio.to_thread(lambda: [Candle.get_storage_last_ts(a) for a in addresses])
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._backfill_one(address, start_ts, end_ts, last_ts, semaphore)
+              for address, last_ts in zip(addresses, last_timestamps)),
+            return_exceptions=True,
+        )
+
+        fetched = {}
+        errors = []
+        for address, result in zip(addresses, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Backfill failed: {address.to_filename()}: {result}")
+                errors.append(result)
+            else:
+                fetched[address.to_filename()] = result
+
+        if errors:
+            raise errors[0]
+
+        return fetched
+
+    async def _backfill_one(
+        self,
+        address: StockAddress,
+        start_ts: int,
+        end_ts: int,
+        last_ts: Optional[int],
+        semaphore: asyncio.Semaphore,
+    ) -> int:
+        # 주소 하나의 남은 범위를 페이지로 나눠 flush_pages개씩 받고 저장
+        resume_ts = start_ts if last_ts is None else max(start_ts, last_ts)
+        if resume_ts >= end_ts:
+            logger.info(f"Backfill already complete: {address.to_filename()}")
+            return 0
+
+        step = address.timeframe_seconds()
+        pages = self.split_pages(resume_ts, end_ts, step, self.page_size)
+        candle = await asyncio.to_thread(self._open_candle, address, last_ts)
+
+        fetched = 0
+        for begin in range(0, len(pages), self.flush_pages):
+            window = pages[begin:begin + self.flush_pages]
+            tasks = [
+                asyncio.ensure_future(self._fetch_page(address, page_start, page_end, step, semaphore))
+                for page_start, page_end in window
+            ]
+            try:
+                frames = await asyncio.gather(*tasks)
+            except BaseException:
+                # 한 페이지가 실패하면 구간 전체를 저장하지 않으므로 남은 요청은 취소
+                # (requires-python 3.10이라 TaskGroup 대신 직접 취소)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            frames = [df for df in frames if not df.empty]
+            if not frames:
+                continue
+
+            df = pd.concat(frames, ignore_index=True)
+            df = df.drop_duplicates(subset=["timestamp"], keep="last").sort_values("timestamp")
+            await asyncio.to_thread(self._save, candle, df.reset_index(drop=True))
+            fetched += len(df)
+
+        logger.info(f"Backfill done: {address.to_filename()} ({fetched} candles)")
+        return fetched
+
+    async def _fetch_page(
+        self,
+        address: StockAddress,
+        page_start: int,
+        page_end: int,
+        step: int,
+        semaphore: asyncio.Semaphore,
+    ) -> pd.DataFrame:
+        # 페이지 하나 요청 (실패 시 지수 백오프로 재시도), [page_start, page_end) 밖의 행은 버린다
+        count = -(-(page_end - page_start) // step)
+        if self.backward:
+            request = self._request_factory.see_candles(
+                address, address.timeframe, end_time=page_end, limit=count
+            )
+        else:
+            request = self._request_factory.see_candles(
+                address, address.timeframe, start_time=page_start, end_time=page_end - 1, limit=count
+            )
+
+        for attempt in range(self.max_retries + 1):
+            async with semaphore:
+                response = await self.gateway.execute(request)
+
+            if response.is_success:
+                df = response.candles
+                if df is None or df.empty:
+                    return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
+                mask = (df["timestamp"] >= page_start) & (df["timestamp"] < page_end)
+                return df[mask]
+
+            if attempt < self.max_retries:
+                delay = self.retry_delay * (2 ** attempt)
+                logger.warning(
+                    f"Candle page failed ({response.error_code}), retry in {delay}s: "
+                    f"{address.to_filename()} [{page_start}, {page_end})"
+                )
+                await asyncio.sleep(delay)
+
+        raise RuntimeError(
+            f"Candle page failed after {self.max_retries} retries: {address.to_filename()} "
+            f"[{page_start}, {page_end}) {response.error_code}: {response.error_message}"
+        )
+
+    @staticmethod
+    def split_pages(start_ts: int, end_ts: int, step: int, page_size: int) -> List[Tuple[int, int]]:
+        """
+        [start_ts, end_ts) 범위를 page_size 캔들 단위 구간으로 분할
+
+        Args:
+            start_ts: 시작 타임스탬프 (초, 이상)
+            end_ts: 종료 타임스탬프 (초, 미만)
+            step: 캔들 간격 (초)
+            page_size: 구간 당 캔들 수
+
+        Returns:
+            [(page_start, page_end), ...] (시간 순, 마지막 구간은 end_ts에서 잘림)
+        """
+        span = step * page_size
+        return [(begin, min(begin + span, end_ts)) for begin in range(start_ts, end_ts, span)]
+
+    @staticmethod
+    def _open_candle(address: StockAddress, last_ts: Optional[int]) -> Candle:
+        # 저장된 데이터가 있으면 마지막 캔들만 부분 로드 (이어 저장 기준점), 없으면 새 Candle
+        if last_ts is None:
+            return Candle(address)
+        return Candle.load(address, start_ts=last_ts)
+
+    @staticmethod
+    def _save(candle: Candle, df: pd.DataFrame) -> None:
+        # 증가형 경로로 병합 후 storage_last_ts 이후만 저장, 메모리에는 마지막 캔들만 남긴다
+        candle.update(df)
+        candle.save()
+        candle.candle_df = candle.candle_df.tail(1).reset_index(drop=True)
+        candle.is_partial = True
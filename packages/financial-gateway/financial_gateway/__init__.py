@@ -8,6 +8,7 @@ __version__ = "0.0.1"
 # Core Services
 from .RequestFactory import RequestFactory
 from .GatewayService import GatewayService
+from .CandleBackfillService import CandleBackfillService
 
 # Gateway Base Classes
 from .gateways.base import BaseGateway, SpotMarketGatewayBase
@@ -34,6 +35,7 @@ __all__ = [
     # Core Services
     "RequestFactory",
     "GatewayService",
+    "CandleBackfillService",
     # Gateways
     "BaseGateway",
     "SpotMarketGatewayBase",
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from simple_logger import bind_context
 from .BaseGateway import BaseGateway
 from financial_gateway.structures.base import BaseRequest, BaseResponse
 
@@ -6,7 +7,24 @@ from financial_gateway.structures.base import BaseRequest, BaseResponse
 class SpotMarketGatewayBase(BaseGateway):
     """Spot 시장 Gateway의 통일된 인터페이스"""
 
-    @abstractmethod
     async def execute(self, request: BaseRequest) -> BaseResponse:
-        """Request 처리 후 Response 반환"""
+        """Request 처리 후 Response 반환
+
+        request_id/gateway_name/symbol을 로깅 컨텍스트에 한 번 바인딩한 뒤 _route에 위임한다.
+        Throttler 대기, Worker encode/decode 등 하위 호출의 모든 로그와 프로파일러 통계에 전파된다.
+        """
+        with bind_context(**self._log_context(request)):
+            return await self._route(request)
+
+    @abstractmethod
+    async def _route(self, request: BaseRequest) -> BaseResponse:
+        """Request 타입에 따라 적절한 Worker로 라우팅"""
         raise NotImplementedError
+
+    def _log_context(self, request: BaseRequest) -> dict:
+        """Request에서 로깅 상관관계 필드 추출"""
+        context = {"request_id": request.request_id, "gateway_name": self.gateway_name}
+        address = getattr(request, "address", None)
+        if address is not None:
+            context["symbol"] = f"{address.base}/{address.quote}"
+        return context
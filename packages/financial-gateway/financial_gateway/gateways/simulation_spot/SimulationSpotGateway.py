@@ -90,7 +90,7 @@ class SimulationSpotGateway(SpotMarketGatewayBase):
     def is_realworld_gateway(self) -> bool:
         return False
 
-    async def execute(self, request: BaseRequest) -> BaseResponse:
+    async def _route(self, request: BaseRequest) -> BaseResponse:
         # Request 타입에 따라 적절한 Worker로 라우팅
         worker = self._workers.get(type(request))
 
@@ -94,7 +94,7 @@ class UpbitSpotGateway(SpotMarketGatewayBase):
     def is_realworld_gateway(self) -> bool:
         return True
 
-    async def execute(self, request: BaseRequest) -> BaseResponse:
+    async def _route(self, request: BaseRequest) -> BaseResponse:
         """Request 타입에 따라 적절한 Worker로 라우팅"""
         worker = self._workers.get(type(request))
 
@@ -0,0 +1,9 @@
+"""Pytest fixtures for financial-gateway tests."""
+
+import pytest
+from financial_assets.candle.testing import candle_env, parquet_storage  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def isolated_candle_env(candle_env):
+    """Candle을 만드는 테스트가 작업 디렉토리에 .env/data를 남기지 않도록 임시 디렉토리로 격리"""
@@ -0,0 +1,176 @@
+# CandleBackfillService 테스트 (가짜 Gateway + 임시 Parquet 저장소)
+
+import asyncio
+import numpy as np
+import pandas as pd
+import pytest
+
+from financial_assets.candle import Candle
+from financial_assets.stock_address import StockAddress
+from financial_gateway import CandleBackfillService
+from financial_gateway.structures.see_candles import SeeCandlesResponse
+
+
+START_TS = 1609459200
+
+
+def make_candles(n: int, start_ts: int = START_TS, step: int = 60) -> pd.DataFrame:
+    """거래소 응답 형식(timestamp, open, high, low, close, volume) 캔들 n개 생성"""
+    close = 100.0 + np.arange(n, dtype=float)
+    return pd.DataFrame({
+        "timestamp": start_ts + step * np.arange(n),
+        "open": close,
+        "high": close + 1.0,
+        "low": close - 1.0,
+        "close": close,
+        "volume": np.ones(n),
+    })
+
+
+class FakeCandleGateway:
+    """거래소 캔들 API를 흉내내는 Gateway (binance_spot: start_time 정방향, upbit_spot: end_time 역방향)"""
+
+    def __init__(self, gateway_name: str, candles: pd.DataFrame, fail_after: int = None):
+        self._gateway_name = gateway_name
+        self.candles = candles
+        self.fail_after = fail_after
+        self.requests = []
+
+    @property
+    def gateway_name(self) -> str:
+        return self._gateway_name
+
+    async def execute(self, request):
+        self.requests.append(request)
+        if self.fail_after is not None and len(self.requests) > self.fail_after:
+            return SeeCandlesResponse(
+                request_id=request.request_id, is_success=False, send_when=0, receive_when=0,
+                processed_when=0, timegaps=0, error_code="API_ERROR", error_message="boom",
+            )
+
+        ts = self.candles["timestamp"]
+        if request.start_time is not None:
+            df = self.candles[ts >= request.start_time]
+            if request.end_time is not None:
+                df = df[df["timestamp"] <= request.end_time]
+            df = df.head(request.limit)
+        else:
+            df = self.candles[ts < request.end_time].tail(request.limit)
+
+        await asyncio.sleep(0)
+        return SeeCandlesResponse(
+            request_id=request.request_id, is_success=True, send_when=0, receive_when=0,
+            processed_when=0, timegaps=0, candles=df.reset_index(drop=True),
+        )
+
+
+class StallingCandleGateway(FakeCandleGateway):
+    """첫 요청은 바로 실패하고 나머지 요청은 취소될 때까지 응답하지 않는 Gateway"""
+
+    def __init__(self, gateway_name: str, candles: pd.DataFrame):
+        super().__init__(gateway_name, candles, fail_after=0)
+        self.cancelled = 0
+
+    async def execute(self, request):
+        if not self.requests:
+            return await super().execute(request)
+
+        self.requests.append(request)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+
+@pytest.fixture
+def address():
+    return StockAddress("candle", "binance", "spot", "btc", "usdt", "1m")
+
+
+class TestCandleBackfillService:
+
+    def test_split_pages(self):
+        """page_size 캔들 단위로 나누고 마지막 구간은 end_ts에서 자름"""
+        pages = CandleBackfillService.split_pages(0, 250, 10, 10)
+
+        assert pages == [(0, 100), (100, 200), (200, 250)]
+
+    def test_forward_pages(self, parquet_storage, address):
+        """Binance는 1000개 페이지를 start_time으로 요청하고 전체를 저장"""
+        gateway = FakeCandleGateway("binance_spot", make_candles(2500))
+        service = CandleBackfillService(gateway, flush_pages=2)
+
+        end_ts = START_TS + 60 * 2500
+        fetched = asyncio.run(service.backfill([address], START_TS, end_ts))
+
+        assert fetched == {address.to_filename(): 2500}
+        assert [r.limit for r in gateway.requests] == [1000, 1000, 500]
+        assert Candle.load(address).timestamp.tolist() == make_candles(2500)["timestamp"].tolist()
+        assert Candle.get_gaps(address) == []
+
+    def test_backward_pages(self, parquet_storage):
+        """Upbit는 start_time 없이 end_time/200개 단위로 요청"""
+        address = StockAddress("candle", "upbit", "spot", "btc", "krw", "1m")
+        gateway = FakeCandleGateway("upbit_spot", make_candles(450))
+        service = CandleBackfillService(gateway)
+
+        asyncio.run(service.backfill([address], START_TS, START_TS + 60 * 450))
+
+        assert all(r.start_time is None for r in gateway.requests)
+        assert sorted(r.end_time for r in gateway.requests) == [START_TS + 60 * n for n in (200, 400, 450)]
+        assert len(Candle.load(address).candle_df) == 450
+
+    def test_resume_from_storage_last_ts(self, parquet_storage, address):
+        """저장소 마지막 캔들부터 이어받음 (마지막 캔들은 다시 받아 덮어씀)"""
+        candles = make_candles(1500)
+        stored = candles.head(1000).copy()
+        stored.loc[999, "close"] = -1.0
+        Candle(address, stored).save()
+
+        gateway = FakeCandleGateway("binance_spot", candles)
+        fetched = asyncio.run(CandleBackfillService(gateway).backfill([address], START_TS, START_TS + 60 * 1500))
+
+        assert fetched == {address.to_filename(): 501}
+        assert gateway.requests[0].start_time == START_TS + 60 * 999
+
+        loaded = Candle.load(address).candle_df
+        assert len(loaded) == 1500
+        assert loaded["close"].iloc[999] == candles["close"].iloc[999]
+
+    def test_failure_keeps_saved_windows(self, parquet_storage, address):
+        """재시도 후에도 실패하면 예외를 올리고, 앞서 저장한 구간에서 다시 시작할 수 있음"""
+        gateway = FakeCandleGateway("binance_spot", make_candles(3000), fail_after=2)
+        service = CandleBackfillService(gateway, max_concurrency=1, flush_pages=1, max_retries=1, retry_delay=0)
+
+        end_ts = START_TS + 60 * 3000
+        with pytest.raises(RuntimeError):
+            asyncio.run(service.backfill([address], START_TS, end_ts))
+        assert Candle.get_storage_last_ts(address) == START_TS + 60 * 1999
+
+        gateway.fail_after = None
+        asyncio.run(service.backfill([address], START_TS, end_ts))
+        assert len(Candle.load(address).candle_df) == 3000
+
+    def test_failed_page_cancels_rest_of_window(self, parquet_storage, address):
+        """구간의 한 페이지가 실패하면 같은 구간의 남은 요청을 취소하고 예외를 올림"""
+        gateway = StallingCandleGateway("binance_spot", make_candles(3000))
+        service = CandleBackfillService(gateway, flush_pages=3, max_retries=0)
+
+        async def run():
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(service.backfill([address], START_TS, START_TS + 60 * 3000), timeout=5)
+            # 이벤트 루프 종료 시점이 아니라 예외가 올라오기 전에 취소되어야 함
+            return gateway.cancelled
+
+        assert asyncio.run(run()) == 2
+        assert len(gateway.requests) == 3
+        assert Candle.get_storage_last_ts(address) is None
+
+    def test_rejects_irregular_timeframe(self, parquet_storage):
+        """간격이 일정하지 않은 timeframe은 거부"""
+        address = StockAddress("candle", "binance", "spot", "btc", "usdt", "1M")
+        service = CandleBackfillService(FakeCandleGateway("binance_spot", make_candles(1)))
+
+        with pytest.raises(ValueError):
+            asyncio.run(service.backfill([address], START_TS, START_TS + 86400))
@@ -0,0 +1,294 @@
+"""simple_logger 데코레이터 오버헤드 벤치마크
+
+func_logging/init_logging 래퍼의 호출당 비용을 설정(콘솔/파일/필터링)과 옵션 조합별로 측정하고,
+대표 트레이스(SpotOrder 생성 + MultiCandle.get_snapshot)를 재생해 결과를 JSON으로 출력한다.
+
+사용법:
+    python benchmarks/bench_overhead.py --output bench.json
+    python benchmarks/bench_overhead.py --quick --compare bench.json --threshold 0.2
+
+--compare를 주면 기준 결과 대비 threshold 비율 이상 느려진 케이스를 출력하고 종료 코드 1을 반환한다.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from simple_logger import configure_logger, func_logging, init_logging, flush_logger, logger
+
+FLAGS = ("log_params", "log_result", "log_time")
+
+
+def _configs(log_dir: str) -> Dict[str, dict]:
+    """측정 대상 로거 설정 (데코레이터 레벨은 모두 DEBUG)"""
+    return {
+        # 콘솔만 (stdout은 측정 중 버퍼로 버림)
+        "console": dict(console_level="DEBUG", log_to_file=False),
+        # 파일만 (콘솔은 레벨로 차단)
+        "file": dict(log_dir=log_dir, console_level="CRITICAL", file_level="DEBUG"),
+        # 파일 + 비동기 큐
+        "file_async": dict(log_dir=log_dir, console_level="CRITICAL", file_level="DEBUG",
+                           async_mode=True, overflow="block"),
+        # 모든 sink가 DEBUG를 거름 → 래퍼 fast path
+        "filtered": dict(console_level="INFO", log_to_file=False),
+    }
+
+
+def _measure(run: Callable[[int], None], calls: int, repeat: int) -> dict:
+    """run(calls)를 repeat번 실행해 호출당 나노초 통계 반환"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        run(calls)
+        samples.append((time.perf_counter_ns() - start) / calls)
+    return {
+        "calls": calls,
+        "repeat": repeat,
+        "ns_per_call_min": min(samples),
+        "ns_per_call_median": statistics.median(samples),
+    }
+
+
+def _sync_runner(func: Callable) -> Callable[[int], None]:
+    def run(n: int) -> None:
+        for i in range(n):
+            func(i, 1.5, name="bench")
+    return run
+
+
+def _async_runner(func: Callable) -> Callable[[int], None]:
+    async def loop(n: int) -> None:
+        for i in range(n):
+            await func(i, 1.5, name="bench")
+
+    def run(n: int) -> None:
+        asyncio.run(loop(n))
+    return run
+
+
+def _target(x, y, name=None):
+    return x
+
+
+async def _async_target(x, y, name=None):
+    return x
+
+
+class _InitTarget:
+    def __init__(self, x, y, name=None):
+        self.x = x
+
+
+def bench_wrappers(calls: int, repeat: int) -> List[dict]:
+    """플래그 조합별 sync/async/init 래퍼 호출당 비용 (현재 설정 기준)"""
+    results = []
+
+    baselines = {
+        "sync": _sync_runner(_target),
+        "async": _async_runner(_async_target),
+        "init": _sync_runner(_InitTarget),
+    }
+    for kind, run in baselines.items():
+        results.append({"case": f"{kind}/undecorated", "kind": kind, **_measure(run, calls, repeat)})
+
+    for values in itertools.product((False, True), repeat=len(FLAGS)):
+        flags = dict(zip(FLAGS, values))
+        label = ",".join(name for name, on in flags.items() if on) or "plain"
+
+        runners = {
+            "sync": _sync_runner(func_logging(**flags)(_target)),
+            "async": _async_runner(func_logging(**flags)(_async_target)),
+        }
+        if not flags["log_result"] and not flags["log_time"]:
+            # init_logging은 log_params만 지원
+            cls = type("_InitTarget", (), {"__init__": init_logging(log_params=flags["log_params"])(_InitTarget.__init__)})
+            runners["init"] = _sync_runner(cls)
+
+        for kind, run in runners.items():
+            results.append({"case": f"{kind}/{label}", "kind": kind, **flags, **_measure(run, calls, repeat)})
+    return results
+
+
+@contextlib.contextmanager
+def _isolated_candle_env(workdir: str):
+    """Candle 저장소 초기화가 현재 디렉토리에 .env/data를 만들지 않도록 임시 디렉토리로 격리
+
+    저장소 환경변수를 모두 미리 지정하면 .env를 찾더라도 기록하지 않고, 찾지 못해 새로 만드는 .env와
+    저장소/캐시 디렉토리는 workdir 아래에 생긴다.
+    """
+    env = {
+        "FA_CANDLE_STORAGE_STRTG": "parquet",
+        "FA_CANDLE_STORAGE_PARQUET_BASEPATH": os.path.join(workdir, "fa_candles"),
+        "FA_CANDLE_STORAGE_DTYPE_PROFILE": "float64",
+        "FA_CANDLE_CACHE_DIR": os.path.join(workdir, "fa_candles_cache"),
+    }
+    previous = {key: os.environ.get(key) for key in env}
+    cwd = os.getcwd()
+    os.environ.update(env)
+    os.chdir(workdir)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _build_trace(n_orders: int, n_snapshots: int, workdir: str):
+    """SpotOrder 생성 n_orders건 + get_snapshot n_snapshots건을 재생하는 함수. financial_assets가 없으면 None
+
+    트레이스는 메모리 안의 Candle만 사용하지만 첫 Candle 생성 시 저장소가 초기화되므로 workdir로 격리한다.
+    """
+    try:
+        import numpy as np
+        import pandas as pd
+        from financial_assets.candle import Candle
+        from financial_assets.constants import OrderSide, OrderType
+        from financial_assets.multicandle import MultiCandle
+        from financial_assets.order import SpotOrder
+        from financial_assets.stock_address import StockAddress
+    except ImportError:
+        return None
+
+    n_times = 1000
+    timestamps = 1609459200 + 60 * np.arange(n_times)
+    candles = []
+    with _isolated_candle_env(workdir):
+        for base in ("BTC", "ETH", "SOL", "XRP"):
+            close = 100.0 + np.cumsum(np.random.default_rng(0).normal(size=n_times))
+            df = pd.DataFrame({
+                "timestamp": timestamps,
+                "open": close, "high": close + 1.0, "low": close - 1.0, "close": close,
+                "volume": np.ones(n_times),
+            })
+            candles.append(Candle(StockAddress("candle", "binance", "spot", base, "USDT", "1m"), df))
+    multicandle = MultiCandle(candles)
+    address = candles[0].address
+    ts = [int(t) for t in timestamps]
+
+    def run() -> None:
+        for i in range(n_orders):
+            SpotOrder(f"order-{i}", address, OrderSide.BUY, OrderType.LIMIT, 100.0, 0.1, ts[i % n_times])
+        for i in range(n_snapshots):
+            multicandle.get_snapshot(ts[i % n_times])
+
+    return run
+
+
+def bench_trace(run: Callable[[], None], repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        run()
+        samples.append(time.perf_counter_ns() - start)
+    return {"repeat": repeat, "ms_min": min(samples) / 1e6, "ms_median": statistics.median(samples) / 1e6}
+
+
+def run_all(calls: int, repeat: int, n_orders: int, n_snapshots: int) -> dict:
+    results = []
+    with tempfile.TemporaryDirectory(prefix="simple-logger-bench-") as log_dir:
+        trace = None
+        for config_name, options in _configs(log_dir).items():
+            # 콘솔 sink는 호출 시점의 sys.stdout에 print하므로 측정 중 출력은 버퍼로 버린다
+            with contextlib.redirect_stdout(io.StringIO()):
+                configure_logger(**options)
+                if trace is None:
+                    trace = _build_trace(n_orders, n_snapshots, log_dir) or False
+
+                for row in bench_wrappers(calls, repeat):
+                    results.append({"config": config_name, **row})
+                if trace:
+                    results.append({"config": config_name, "case": "trace/spot_order+get_snapshot", "kind": "trace",
+                                    "orders": n_orders, "snapshots": n_snapshots, **bench_trace(trace, repeat)})
+                flush_logger(timeout=30)
+        # 임시 디렉토리 삭제 전 파일 핸들 정리
+        logger.remove()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "loguru": _version("loguru"),
+            "simple_logger": _version("simple-logger"),
+            "trace": bool(trace),
+        },
+        "results": results,
+    }
+
+
+def _version(dist: str) -> Optional[str]:
+    try:
+        from importlib.metadata import version
+        return version(dist)
+    except Exception:
+        return None
+
+
+def _key(row: dict) -> str:
+    return f'{row["config"]}:{row["case"]}'
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[dict]:
+    """기준 결과 대비 threshold 비율 이상 느려진 케이스 목록"""
+    metric = lambda row: row.get("ns_per_call_min", row.get("ms_min"))
+    previous = {_key(row): metric(row) for row in baseline["results"]}
+    regressions = []
+    for row in current["results"]:
+        before = previous.get(_key(row))
+        if not before:
+            continue
+        ratio = metric(row) / before - 1.0
+        if ratio > threshold:
+            regressions.append({"key": _key(row), "before": before, "after": metric(row), "ratio": ratio})
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: stdout)")
+    parser.add_argument("--calls", type=int, default=20000, help="케이스당 호출 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최솟값/중앙값 보고)")
+    parser.add_argument("--orders", type=int, default=10000, help="트레이스 SpotOrder 생성 수")
+    parser.add_argument("--snapshots", type=int, default=10000, help="트레이스 get_snapshot 호출 수")
+    parser.add_argument("--quick", action="store_true", help="호출 수/반복을 줄인 빠른 측정")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀 판정 비율 (기본 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.calls, args.repeat, args.orders, args.snapshots = 2000, 3, 1000, 1000
+
+    report = run_all(args.calls, args.repeat, args.orders, args.snapshots)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for item in regressions:
+            print(f'회귀: {item["key"]} {item["before"]:.1f} -> {item["after"]:.1f} (+{item["ratio"]:.0%})', file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,41 @@
 
 __version__ = "0.0.1"
 
-from .logger import configure_logger, func_logging, init_logging
+from .logger import (
+    configure_logger,
+    configure_worker_logger,
+    configure_child_logger,
+    func_logging,
+    init_logging,
+    get_queue_stats,
+    flush_logger,
+    flush_summaries,
+)
+from .queue_sink import QueueSink
+from .render import register_summarizer
+from .profiler import Profiler, profiler
+from .json_log import read_json_logs
+from .multiprocess import start_log_listener, stop_log_listener
+from .context import bind_context, get_context
 from loguru import logger
 
 __all__ = [
     "configure_logger",
+    "configure_worker_logger",
+    "configure_child_logger",
+    "start_log_listener",
+    "stop_log_listener",
+    "bind_context",
+    "get_context",
     "func_logging",
     "init_logging",
+    "get_queue_stats",
+    "flush_logger",
+    "flush_summaries",
+    "QueueSink",
+    "register_summarizer",
+    "Profiler",
+    "profiler",
+    "read_json_logs",
     "logger",
 ]
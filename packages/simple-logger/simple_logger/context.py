@@ -0,0 +1,32 @@
+"""요청 단위 상관관계(correlation) 컨텍스트"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping
+
+# 현재 실행 흐름에 바인딩된 필드 (request_id, gateway_name, symbol 등)
+# asyncio Task는 생성 시점의 컨텍스트를 복사하므로 await/gather 하위 작업까지 전파된다
+_context_fields: ContextVar[Mapping[str, Any]] = ContextVar("log_context", default=MappingProxyType({}))
+
+
+@contextmanager
+def bind_context(**fields: Any) -> Iterator[None]:
+    """블록 안에서 기록되는 모든 로그 레코드와 프로파일러 통계에 필드를 추가
+
+    사용법:
+        with bind_context(request_id=request.request_id, gateway_name="binance_spot"):
+            await worker.execute(request)
+
+    중첩 시 바깥 필드에 병합되며, 블록을 벗어나면 이전 상태로 복원된다.
+    """
+    token = _context_fields.set(MappingProxyType({**_context_fields.get(), **fields}))
+    try:
+        yield
+    finally:
+        _context_fields.reset(token)
+
+
+def get_context() -> Mapping[str, Any]:
+    """현재 바인딩된 컨텍스트 필드 조회 (읽기 전용)"""
+    return _context_fields.get()
@@ -0,0 +1,292 @@
+"""구조화 로그 - JSON Lines 직렬화, 백그라운드 압축, 세그먼트 스트리밍 리더"""
+
+import glob
+import gzip
+import io
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from loguru import logger
+
+COMPRESSIONS = ("gzip", "zstd")
+_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+# retention 기간 문자열 단위 (초)
+_DURATION_UNITS = {
+    "s": 1, "sec": 1, "second": 1,
+    "m": 60, "min": 60, "minute": 60,
+    "h": 3600, "hour": 3600,
+    "d": 86400, "day": 86400,
+    "w": 604800, "week": 604800,
+    "month": 86400 * 30,
+    "y": 86400 * 365, "year": 86400 * 365,
+}
+_DURATION_PATTERN = re.compile(r"^\s*([\d.]+)\s*([a-z]+?)s?\s*$")
+
+# loguru 기본 extra 중 별도 필드로 내보내지 않을 내부 키
+_INTERNAL_EXTRA = ("serialized",)
+
+
+def serialize_record(record: Dict[str, Any]) -> str:
+    """loguru 레코드를 JSON 한 줄로 직렬화
+
+    class_name/func_id와 함께 extra에 바인딩된 값(elapsed, request_id 등)을 최상위 필드로 기록한다.
+    """
+    entry = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "message": record["message"],
+        "pid": record["process"].id,
+        "thread": record["thread"].name,
+        "location": f'{record["name"]}:{record["function"]}:{record["line"]}',
+    }
+    for key, value in record["extra"].items():
+        if key in _INTERNAL_EXTRA:
+            continue
+        entry[key] = value if isinstance(value, (str, int, float, bool, type(None))) else str(value)
+
+    exception = record["exception"]
+    if exception is not None and exception.type is not None:
+        entry["exception"] = "".join(
+            traceback.format_exception(exception.type, exception.value, exception.traceback)
+        )
+
+    return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _parse_duration(text: str) -> timedelta:
+    # "10 days", "1 week, 3 days", "12h" 형식의 기간 문자열 파싱
+    seconds = 0.0
+    for part in text.lower().split(","):
+        match = _DURATION_PATTERN.match(part)
+        if match is None or match.group(2) not in _DURATION_UNITS:
+            raise ValueError(f"Invalid retention: {text!r}")
+        seconds += float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+    return timedelta(seconds=seconds)
+
+
+def _make_retention(retention: Union[int, timedelta, str, Callable[[List[str]], None]]) -> Callable[[List[str]], None]:
+    # loguru retention과 같은 형식(개수, 기간, 기간 문자열, 함수)을 세그먼트 목록 정리 함수로 변환
+    if callable(retention):
+        return retention
+    if isinstance(retention, str):
+        retention = _parse_duration(retention)
+    if isinstance(retention, int):
+        count = retention
+
+        def keep_newest(paths: List[str]) -> None:
+            for path in sorted(paths, key=lambda p: os.stat(p).st_mtime, reverse=True)[count:]:
+                os.remove(path)
+
+        return keep_newest
+    if isinstance(retention, timedelta):
+        seconds = retention.total_seconds()
+
+        def remove_older(paths: List[str]) -> None:
+            limit = time.time() - seconds
+            for path in paths:
+                if os.stat(path).st_mtime <= limit:
+                    os.remove(path)
+
+        return remove_older
+    raise TypeError(f"Cannot infer retention for objects of type: {type(retention).__name__}")
+
+
+class BackgroundCompressor:
+    """로테이션된 세그먼트를 별도 스레드에서 압축하는 loguru compression 콜백
+
+    loguru는 로테이션 시점에 로그를 기록한 스레드에서 compression을 호출하므로,
+    실제 압축은 작업 큐에 넘기고 즉시 반환한다.
+
+    loguru의 retention은 로테이션 직후 세그먼트를 glob으로 찾아 정리하므로 압축 중인 임시 파일이나
+    곧 삭제될 원본과 겹칠 수 있다. 압축기를 쓸 때는 loguru retention을 끄고(None)
+    같은 압축 스레드에서 압축이 끝날 때마다 retention을 적용한다.
+    """
+
+    def __init__(
+        self,
+        method: str = "gzip",
+        level: Optional[int] = None,
+        retention: Union[int, timedelta, str, Callable[[List[str]], None], None] = None,
+        log_file: Union[str, Path, None] = None
+    ):
+        """
+        Args:
+            method: 압축 방식 ("gzip" | "zstd"). zstd는 zstandard 패키지 필요
+            level: 압축 레벨. None이면 방식별 기본값
+            retention: 세그먼트 보관 조건 (loguru retention 형식: 개수, timedelta, "10 days", 함수).
+                None이면 정리하지 않음
+            log_file: loguru 싱크 파일 경로. retention 대상 세그먼트(로테이션·압축 파일)를 찾는 기준
+        """
+        if method not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {method}")
+        if method == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError as e:
+                raise ImportError("zstd compression requires the 'zstandard' package") from e
+        if retention is not None and log_file is None:
+            raise ValueError("retention requires log_file")
+
+        self._method = method
+        self._level = level
+        self._retention = _make_retention(retention) if retention is not None else None
+        self._log_file = str(log_file) if log_file is not None else None
+        # 제출됐지만 아직 압축되지 않은 세그먼트 (retention 대상에서 제외)
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        # fork된 자식이 물려받은 핸들러를 닫을 때 부모의 세그먼트를 압축하지 않도록 생성 프로세스 기록
+        self._pid = os.getpid()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simple-logger-compress")
+
+    def __call__(self, path: str) -> None:
+        if os.getpid() != self._pid:
+            return
+        with self._pending_lock:
+            self._pending.add(os.path.abspath(path))
+        self._executor.submit(self._run, path)
+
+    def _run(self, path: str) -> None:
+        try:
+            self._compress(path)
+        finally:
+            with self._pending_lock:
+                self._pending.discard(os.path.abspath(path))
+        if self._retention is not None:
+            self._apply_retention()
+
+    def _compress(self, path: str) -> None:
+        source = Path(path)
+        target = source.with_name(source.name + _SUFFIXES[self._method])
+        tmp = target.with_name(target.name + ".tmp")
+        try:
+            with open(source, "rb") as src:
+                if self._method == "gzip":
+                    level = 6 if self._level is None else self._level
+                    with gzip.open(tmp, "wb", compresslevel=level) as dst:
+                        shutil.copyfileobj(src, dst)
+                else:
+                    import zstandard
+                    cctx = zstandard.ZstdCompressor(level=3 if self._level is None else self._level)
+                    with open(tmp, "wb") as raw, cctx.stream_writer(raw) as dst:
+                        shutil.copyfileobj(src, dst)
+            os.replace(tmp, target)
+            source.unlink()
+        except Exception as e:
+            # 압축 실패 시 원본 세그먼트는 그대로 보존
+            tmp.unlink(missing_ok=True)
+            logger.warning(f"로그 세그먼트 압축 실패: {path} ({e})")
+
+    def _segments(self) -> List[str]:
+        # retention 대상 세그먼트 목록 (현재 기록 중인 파일, 압축 대기·진행 중인 파일 제외)
+        root, ext = os.path.splitext(glob.escape(self._log_file))
+        # loguru 로테이션 이름: {root}.{날짜}{ext}, 압축 후 {root}.{날짜}{ext}.gz
+        paths = set(glob.glob(f"{root}.*{ext}")) | set(glob.glob(f"{root}.*{ext}.*"))
+        with self._pending_lock:
+            pending = set(self._pending)
+        return sorted(
+            path for path in paths
+            if not path.endswith(".tmp") and os.path.abspath(path) not in pending and os.path.isfile(path)
+        )
+
+    def _apply_retention(self) -> None:
+        # 압축 스레드에서만 호출되므로 임시 파일 생성·원본 삭제와 겹치지 않음
+        try:
+            self._retention(self._segments())
+        except Exception as e:
+            logger.warning(f"로그 세그먼트 정리 실패: {self._log_file} ({e})")
+
+    def close(self, wait: bool = True) -> None:
+        """대기 중인 압축 작업 처리 후 종료"""
+        self._executor.shutdown(wait=wait)
+
+
+def _open_segment(path: Path) -> io.TextIOBase:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        import zstandard
+        raw = open(path, "rb")
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True), encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _to_aware(value: Union[datetime, str, None]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value if value.tzinfo is not None else value.astimezone()
+
+
+def read_json_logs(
+    path: Union[str, Path],
+    level: Optional[str] = None,
+    since: Union[datetime, str, None] = None,
+    until: Union[datetime, str, None] = None,
+    **fields: Any
+) -> Iterator[dict]:
+    """JSON Lines 로그(압축 세그먼트 포함)를 스트리밍으로 읽어 조건에 맞는 레코드만 반환
+
+    사용법:
+        for entry in read_json_logs("./logs", level="INFO", request_id="abc-123"):
+            print(entry["time"], entry["func_id"], entry["message"])
+
+    Args:
+        path: 로그 파일 또는 디렉토리. 디렉토리면 *.jsonl, *.jsonl.gz, *.jsonl.zst를 이름순으로 읽음
+        level: 최소 레벨 이름
+        since: 이 시각 이후 레코드만 (datetime 또는 ISO 문자열, naive는 로컬 시간대)
+        until: 이 시각 이전 레코드만
+        **fields: 필드 값 일치 조건 (예: func_id="SpotOrder.__init__")
+    """
+    path = Path(path)
+    if path.is_dir():
+        segments = sorted(
+            p for p in path.iterdir()
+            if p.name.endswith((".jsonl", ".jsonl.gz", ".jsonl.zst"))
+        )
+    else:
+        segments = [path]
+
+    min_level_no = logger.level(level).no if level is not None else None
+    since = _to_aware(since)
+    until = _to_aware(until)
+    level_cache: Dict[str, int] = {}
+
+    for segment in segments:
+        with _open_segment(segment) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+
+                if any(entry.get(key) != value for key, value in fields.items()):
+                    continue
+
+                if min_level_no is not None:
+                    name = entry.get("level")
+                    if name not in level_cache:
+                        try:
+                            level_cache[name] = logger.level(name).no
+                        except ValueError:
+                            level_cache[name] = 0
+                    if level_cache[name] < min_level_no:
+                        continue
+
+                if since is not None or until is not None:
+                    time = datetime.fromisoformat(entry["time"])
+                    if since is not None and time < since:
+                        continue
+                    if until is not None and time > until:
+                        continue
+
+                yield entry
@@ -1,6 +1,10 @@
 """Simple Logger - loguru 기반 로거 래퍼"""
 
+import os
+import copy
 import time
+import atexit
+import threading
 import inspect
 from functools import wraps
 from typing import Callable, Any, Optional
@@ -10,18 +14,95 @@ from contextvars import ContextVar
 
 from loguru import logger
 
+from .queue_sink import QueueSink
+from .render import render
+from .sampling import CallSampler, CallSummary
+from .profiler import profiler
+from .json_log import BackgroundCompressor, serialize_record
+from .multiprocess import QueueForwardSink
+from .context import _context_fields
+
 # 컨텍스트 변수 (스레드별 독립 저장소)
 _context_class_name = ContextVar("class_name", default="-")
 _context_func_id = ContextVar("func_id", default="-")
 
 
+def _default_config() -> dict:
+    """기본 설정(지연/즉시 모두)에 쓰는 configure_logger 인자를 환경변수에서 구성
+
+    SIMPLE_LOGGER_FILE=0이면 파일 핸들러 제외,
+    SIMPLE_LOGGER_CONSOLE_LEVEL/SIMPLE_LOGGER_FILE_LEVEL로 기본 레벨(INFO/DEBUG) 변경.
+    """
+    return {
+        "console_level": os.getenv("SIMPLE_LOGGER_CONSOLE_LEVEL", "INFO").upper(),
+        "file_level": os.getenv("SIMPLE_LOGGER_FILE_LEVEL", "DEBUG").upper(),
+        "log_to_file": os.getenv("SIMPLE_LOGGER_FILE", "1").lower() not in ("0", "false", "no"),
+    }
+
+
+def _config_min_level_no(config: dict) -> int:
+    """설정에서 활성 sink 중 가장 낮은 레벨 번호 계산"""
+    level_no = logger.level(config["console_level"]).no
+    if config["log_to_file"]:
+        level_no = min(level_no, logger.level(config["file_level"]).no)
+    return level_no
+
+
+# 활성 sink 중 가장 낮은 레벨 번호 (configure_logger가 갱신)
+# 데코레이터 레벨이 이보다 낮으면 메시지 생성/logger.log 호출을 생략한다
+# 설정 전에는 기본 설정이 적용될 것으로 간주하여 같은 환경변수로 계산한다
+# (SIMPLE_LOGGER_STATIC_FILTER가 임포트 시점 데코레이터에도 적용되도록)
+_min_level_no = _config_min_level_no(_default_config())
+
+# 설정 시점: "lazy"면 첫 로그 기록 시 기본 설정, "eager"면 임포트 시 설정
+_config_mode = os.getenv("SIMPLE_LOGGER_CONFIG", "lazy").lower()
+_configured = False
+_bootstrap_lock = threading.Lock()
+# 지연 설정용 patcher가 loguru에 설치되어 있는지 (설정 후에는 레코드마다 호출되지 않도록 해제)
+_bootstrap_installed = False
+
+# 핸들러를 등록한 프로세스 id (포크된 자식 판별용)
+_configured_pid: Optional[int] = None
+
+# simple_logger가 logger.add로 등록한 핸들러 id (포크된 자식에서 이것만 제거)
+_handler_ids: list = []
+
+# 정적 필터 모드: 데코레이트 시점에 레벨이 걸러지면 원본 함수를 그대로 반환
+# 판단은 데코레이트 시점의 _min_level_no 기준이므로, 임포트 시점 데코레이터까지 적용하려면
+# 환경변수로 켜거나 데코레이트된 모듈을 임포트하기 전에 configure_logger(static_filter=True)를 호출한다
+_static_filter = os.getenv("SIMPLE_LOGGER_STATIC_FILTER", "").lower() in ("1", "true", "yes")
+
+# 비동기 모드 상태 (configure_logger(async_mode=True)일 때만 사용)
+_queue_sink: Optional[QueueSink] = None
+_file_writer = None
+
+# 로테이션 세그먼트 백그라운드 압축기 (compression 설정 시)
+_compressor: Optional[BackgroundCompressor] = None
+
+# 요약 모드 데코레이터 목록 (종료 시 남은 요약 출력용)
+_summaries: list = []
+
+
+def _level_no(level: str) -> int:
+    """레벨 이름을 loguru 레벨 번호로 변환"""
+    return logger.level(level).no
+
+
 def configure_logger(
     log_dir: Optional[str] = None,
     console_level: str = "INFO",
     file_level: str = "DEBUG",
     rotation: str = "1 day",
     retention: str = "10 days",
-    format_string: Optional[str] = None
+    format_string: Optional[str] = None,
+    static_filter: Optional[bool] = None,
+    async_mode: bool = False,
+    queue_capacity: int = 10000,
+    overflow: str = "drop_oldest",
+    batch_size: int = 256,
+    file_format: str = "text",
+    compression: Optional[str] = None,
+    log_to_file: bool = True
 ):
     """로거 초기 설정
 
@@ -32,9 +113,24 @@ def configure_logger(
         rotation: 로그 파일 로테이션 조건 (예: "500 MB", "1 day")
         retention: 로그 파일 보관 기간 (예: "10 days")
         format_string: 커스텀 포맷 문자열. None이면 기본 포맷 사용
+        static_filter: True면 이후 데코레이트되는 함수 중 레벨이 걸러지는 것은
+            래핑하지 않고 원본을 반환. None이면 현재 모드 유지.
+            이미 임포트된 모듈의 데코레이터에는 적용되지 않으므로 데코레이트된 모듈을 임포트하기 전에 호출해야 함
+        async_mode: True면 콘솔/파일 I/O를 큐 기반 백그라운드 스레드에서 수행
+        queue_capacity: 비동기 모드 큐 최대 크기
+        overflow: 큐가 가득 찼을 때 정책 ("drop_oldest" | "block" | "sample")
+        batch_size: 백그라운드 스레드가 한 번에 기록할 최대 메시지 수
+        file_format: 파일 출력 형식 ("text" | "json"). json은 레코드당 JSON 한 줄(.jsonl)
+        compression: 로테이션된 파일 압축 방식 ("gzip" | "zstd"). 압축과 retention 정리는 별도 스레드에서 수행
+        log_to_file: False면 파일 핸들러 없이 콘솔만 설정 (로그 디렉토리도 만들지 않음)
     """
-    # 기존 핸들러 제거
-    logger.remove()
+    global _min_level_no, _static_filter, _queue_sink, _file_writer, _compressor, _configured, _configured_pid
+
+    if file_format not in ("text", "json"):
+        raise ValueError(f"Unsupported file_format: {file_format}")
+
+    # 기존 핸들러 제거 (비동기 모드였다면 남은 메시지 기록 후 정리, 포크된 자식에서는 simple_logger 핸들러만 제거)
+    _release_handlers()
 
     # 기본 포맷
     if format_string is None:
@@ -45,43 +141,270 @@ def configure_logger(
             "<level>{message}</level>"
         )
 
-    # ContextVar에서 값을 읽어서 extra에 주입하는 필터
-    def context_filter(record):
-        record["extra"]["class_name"] = _context_class_name.get()
-        record["extra"]["func_id"] = _context_func_id.get()
-        return True
+    context_filter = _context_filter
+
+    console_sink = lambda msg: print(msg, end="")
+    if async_mode:
+        _queue_sink = QueueSink(capacity=queue_capacity, overflow=overflow, batch_size=batch_size)
+        console_sink = _queue_sink.writer(console_sink)
 
     # 콘솔 핸들러
-    logger.add(
-        sink=lambda msg: print(msg, end=""),
+    _handler_ids.append(logger.add(
+        sink=console_sink,
         format=format_string,
         level=console_level,
         colorize=True,
         filter=context_filter
+    ))
+
+    # 파일 핸들러 (워커 프로세스 등은 log_to_file=False로 콘솔만 사용)
+    if log_to_file:
+        if log_dir is None:
+            log_dir = "./logs"
+
+        log_path = Path(log_dir)
+        log_path.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now().strftime('%y%m%d_%H%M%S')
+        suffix = ".jsonl" if file_format == "json" else ".log"
+        log_file = log_path / f"log_{timestamp}{suffix}"
+
+        if compression is not None:
+            # 압축 중인 세그먼트와 겹치지 않도록 retention은 압축 스레드에서 적용
+            _compressor = BackgroundCompressor(compression, retention=retention, log_file=log_file)
+            retention = None
+
+        if file_format == "json":
+            # 레코드를 JSON 한 줄로 직렬화해 extra에 담고 그대로 출력
+            # (callable 포맷은 loguru가 예외 트레이스백을 덧붙이지 않음)
+            def file_filter(record):
+                context_filter(record)
+                record["extra"]["serialized"] = serialize_record(record)
+                return True
+
+            file_format_spec = lambda record: "{extra[serialized]}\n"
+        else:
+            file_filter = context_filter
+            file_format_spec = format_string
+
+        if async_mode:
+            # 로테이션은 독립 loguru 인스턴스가 담당, 포맷은 호출 스레드에서 완료된 상태로 전달
+            _file_writer = copy.deepcopy(logger)
+            _file_writer.remove()
+            _file_writer.add(
+                sink=str(log_file),
+                format="{message}",
+                level=0,
+                rotation=rotation,
+                retention=retention,
+                compression=_compressor,
+                encoding="utf-8"
+            )
+            writer = _file_writer
+            _handler_ids.append(logger.add(
+                sink=_queue_sink.writer(lambda text: writer.opt(raw=True).log("TRACE", text)),
+                format=file_format_spec,
+                level=file_level,
+                filter=file_filter
+            ))
+        else:
+            _handler_ids.append(logger.add(
+                sink=str(log_file),
+                format=file_format_spec,
+                level=file_level,
+                rotation=rotation,
+                retention=retention,
+                compression=_compressor,
+                encoding="utf-8",
+                filter=file_filter
+            ))
+
+    # 기본 컨텍스트 설정 (ContextVar로 대체되므로 불필요하지만 호환성 유지)
+    logger.configure(extra={"class_name": "-", "func_id": "-"})
+    _remove_bootstrap()
+
+    # 데코레이터가 참조하는 레벨 필터 상태 갱신
+    _min_level_no = _config_min_level_no(
+        {"console_level": console_level, "file_level": file_level, "log_to_file": log_to_file}
     )
+    if static_filter is not None:
+        _static_filter = static_filter
+    _configured = True
+    _configured_pid = os.getpid()
 
-    # 파일 핸들러
-    if log_dir is None:
-        log_dir = "./logs"
 
-    log_path = Path(log_dir)
-    log_path.mkdir(parents=True, exist_ok=True)
+def _context_filter(record) -> bool:
+    """ContextVar에서 값을 읽어서 extra에 주입하는 필터
 
-    timestamp = datetime.now().strftime('%y%m%d_%H%M%S')
-    log_file = log_path / f"log_{timestamp}.log"
+    데코레이터 컨텍스트 밖(기본값 "-")이면 레코드에 이미 있는 값(bind, 자식 프로세스 전달분)을 유지한다.
+    bind_context()로 바인딩된 상관관계 필드(request_id 등)도 함께 주입한다.
+    """
+    extra = record["extra"]
+    fields = _context_fields.get()
+    if fields:
+        extra.update(fields)
+    class_name = _context_class_name.get()
+    if class_name != "-" or "class_name" not in extra:
+        extra["class_name"] = class_name
+    func_id = _context_func_id.get()
+    if func_id != "-" or "func_id" not in extra:
+        extra["func_id"] = func_id
+    return True
+
+
+def configure_child_logger(queue, level: str = "DEBUG") -> None:
+    """자식 프로세스 설정: 모든 레코드를 부모 프로세스 리스너로 전달 (파일/콘솔 없음)
+
+    레코드에는 자식 프로세스 id가 extra["pid"]로 추가된다.
+    fork/spawn 모두 사용 가능하다. fork된 자식에서는 부모의 simple_logger 핸들러가 포크 직후 제거되고
+    압축/이름 변경도 일어나지 않으므로 부모가 쓰는 로그 파일은 건드리지 않는다.
 
-    logger.add(
-        sink=str(log_file),
-        format=format_string,
-        level=file_level,
-        rotation=rotation,
-        retention=retention,
-        encoding="utf-8",
-        filter=context_filter
-    )
+    사용법:
+        queue = start_log_listener()
+        ProcessPoolExecutor(initializer=configure_child_logger, initargs=(queue,))
 
-    # 기본 컨텍스트 설정 (ContextVar로 대체되므로 불필요하지만 호환성 유지)
+    Args:
+        queue: start_log_listener()가 반환한 큐
+        level: 전달할 최소 레벨
+    """
+    global _min_level_no, _configured, _configured_pid
+
+    _release_handlers()
+
+    _handler_ids.append(logger.add(
+        sink=QueueForwardSink(queue),
+        format="{message}",
+        level=level,
+        filter=_context_filter
+    ))
     logger.configure(extra={"class_name": "-", "func_id": "-"})
+    _remove_bootstrap()
+
+    _min_level_no = _level_no(level)
+    _configured = True
+    _configured_pid = os.getpid()
+
+
+def get_queue_stats() -> Optional[dict]:
+    """비동기 모드 큐 상태 조회 (depth, dropped 등). 비동기 모드가 아니면 None"""
+    if _queue_sink is None:
+        return None
+    return _queue_sink.stats()
+
+
+def flush_logger(timeout: Optional[float] = None) -> bool:
+    """비동기 모드 큐에 쌓인 메시지가 모두 기록될 때까지 대기"""
+    if _queue_sink is None:
+        return True
+    return _queue_sink.flush(timeout)
+
+
+def _release_handlers() -> None:
+    """재설정 전 기존 핸들러 정리
+
+    같은 프로세스에서 등록한 핸들러는 정상 종료(남은 메시지 기록, 파일 닫기)한다.
+    포크된 자식이 물려받은 simple_logger 핸들러는 포크 직후 _drop_inherited_handlers에서 이미 제거되었고,
+    사용자가 직접 추가한 핸들러는 stop이 부모의 자원을 건드릴 수 있으므로 그대로 둔다.
+    """
+    if _configured_pid is None or _configured_pid == os.getpid():
+        logger.remove()
+        _handler_ids.clear()
+        _shutdown_sinks()
+        return
+
+    _remove_tracked_handlers()
+
+
+def _remove_tracked_handlers() -> None:
+    """simple_logger가 등록한 핸들러만 공개 API(logger.remove)로 제거"""
+    for handler_id in _handler_ids:
+        try:
+            logger.remove(handler_id)
+        except ValueError:
+            # 사용자가 logger.remove()로 이미 제거한 핸들러
+            pass
+    _handler_ids.clear()
+
+
+def _drop_inherited_handlers() -> None:
+    """fork된 자식에서 부모가 등록한 핸들러 제거 (os.register_at_fork 훅)
+
+    자식에는 비동기 큐/압축 스레드가 없으므로 남은 메시지 기록이나 압축 없이 참조만 버린다.
+    파일 핸들러의 stop은 자식의 파일 객체만 닫으며, 압축기는 다른 프로세스의 호출을 무시한다.
+    이후 첫 로그 기록 시 spawn 자식과 같이 기본 설정이 적용된다 (configure_child_logger 등으로 미리 설정 가능).
+    """
+    global _queue_sink, _file_writer, _compressor, _configured, _bootstrap_lock
+
+    # 포크 시점에 다른 스레드가 잡고 있었을 수 있는 락 재생성
+    _bootstrap_lock = threading.Lock()
+    if not _configured:
+        # 설정 전이면 부트스트랩용 빈 핸들러만 있으므로 그대로 사용
+        return
+
+    _remove_tracked_handlers()
+    _queue_sink = None
+    _file_writer = None
+    _compressor = None
+    _configured = False
+    _install_bootstrap(remove_all=False)
+
+
+def _shutdown_sinks() -> None:
+    """비동기 모드 큐/파일 writer/압축 스레드 정리"""
+    global _queue_sink, _file_writer, _compressor
+    if _queue_sink is not None:
+        _queue_sink.close()
+        _queue_sink = None
+    if _file_writer is not None:
+        _file_writer.remove()
+        _file_writer = None
+    if _compressor is not None:
+        _compressor.close()
+        _compressor = None
+
+
+def flush_summaries() -> None:
+    """요약 모드 데코레이터에 누적된 호출을 즉시 요약 출력"""
+    for class_name, func_id, level, summary in _summaries:
+        message = summary.drain()
+        if message is None:
+            continue
+        token_class = _context_class_name.set(class_name)
+        token_func = _context_func_id.set(func_id)
+        try:
+            logger.log(level, message)
+        finally:
+            _context_class_name.reset(token_class)
+            _context_func_id.reset(token_func)
+
+
+def _is_filtered(level_no: int) -> bool:
+    """정적 필터 모드에서 해당 레벨이 어떤 sink에도 기록되지 않는지 여부
+
+    프로파일러가 켜져 있으면 호출 측정을 위해 래핑을 유지한다.
+    """
+    return _static_filter and not profiler.enabled and level_no < _min_level_no
+
+
+def _log_exception(class_name: str, func_id: str, message: str) -> None:
+    """필터 경로에서 발생한 예외를 데코레이터 컨텍스트로 기록 (예외가 날 때만 ContextVar 설정)"""
+    token_class = _context_class_name.set(class_name)
+    token_func = _context_func_id.set(func_id)
+    try:
+        logger.exception(message)
+    finally:
+        _context_class_name.reset(token_class)
+        _context_func_id.reset(token_func)
+
+
+def _format_params(args: tuple, kwargs: dict) -> Optional[dict]:
+    """파라미터 로깅용 dict 생성. 기록할 값이 없으면 None"""
+    params = {}
+    if args:
+        params['args'] = args
+    if kwargs:
+        params['kwargs'] = kwargs
+    return params or None
 
 
 def func_logging(
@@ -90,7 +413,11 @@ def func_logging(
     level: str = "DEBUG",
     log_params: bool = False,
     log_result: bool = False,
-    log_time: bool = False
+    log_time: bool = False,
+    max_length: Optional[int] = None,
+    sample_every: Optional[int] = None,
+    max_per_second: Optional[float] = None,
+    summary_interval: Optional[float] = None
 ) -> Callable:
     """함수/메서드 실행 자동 로깅 데코레이터 (동기/비동기 함수 모두 지원)
 
@@ -103,13 +430,35 @@ def func_logging(
         async def business_logic(user_id):
             ...
 
+    파라미터/반환값은 sink가 레코드를 받아들일 때만 렌더링되며, 등록된
+    요약기(register_summarizer)가 있는 타입은 요약 문자열로 기록된다.
+
+    프로파일러(profiler.enable())가 켜져 있으면 레벨/샘플링과 무관하게
+    모든 호출의 실행시간을 func_id별로 집계한다.
+
+    고빈도 호출 지점은 sample_every/max_per_second로 샘플링하거나
+    summary_interval로 주기적 요약만 남길 수 있다.
+
+    레벨이 활성 최소 레벨보다 낮고 프로파일러가 꺼져 있으면 컨텍스트 설정 없이
+    원본을 바로 호출한다 (예외 발생 시에만 컨텍스트와 함께 기록).
+    정적 필터 모드에서는 래핑 자체를 생략한다.
+
     Args:
         level: 로그 레벨 ("DEBUG" | "INFO" | "WARNING" | "ERROR")
         log_params: 함수 파라미터 로깅 여부
         log_result: 반환값 로깅 여부
         log_time: 실행 시간 측정 여부
+        max_length: 파라미터/반환값 문자열 최대 길이. None이면 제한 없음
+        sample_every: N번 호출마다 1번만 시작/종료 로깅
+        max_per_second: 초당 최대 로깅 횟수
+        summary_interval: 지정 시 호출별 로그 대신 이 주기(초)마다
+            호출 수/오류 수/실행시간 요약을 한 줄로 기록 (샘플링 옵션 무시)
     """
     def decorator(func: Callable) -> Callable:
+        level_no = _level_no(level)
+        if _is_filtered(level_no):
+            return func
+
         func_name = func.__name__
         qual_parts = func.__qualname__.split('.')
         is_method = len(qual_parts) > 1
@@ -117,32 +466,87 @@ def func_logging(
         func_id = f'{class_name}.{func_name}' if is_method else func_name
         is_async = inspect.iscoroutinefunction(func)
 
+        # 요약 모드가 켜지면 샘플링은 적용하지 않음 (모든 호출을 요약에 누적)
+        summary = CallSummary(summary_interval) if summary_interval is not None else None
+        sampler = None
+        if summary is None and (sample_every is not None or max_per_second is not None):
+            sampler = CallSampler(every=sample_every, max_per_second=max_per_second)
+        if summary is not None:
+            _summaries.append((class_name, func_id, level, summary))
+
+        def log_start(args: tuple, kwargs: dict) -> None:
+            if log_params:
+                param_args = args[1:] if is_method and args else args
+                params = _format_params(param_args, kwargs)
+                if params:
+                    # 렌더링은 sink가 레코드를 받아들일 때만 수행
+                    logger.opt(lazy=True).log(
+                        level, "시작 params={}", lambda: render(params, max_length)
+                    )
+                    return
+            logger.log(level, "시작")
+
+        def log_end(result: Any, start_time: Optional[float]) -> None:
+            # 지연 인자는 sink가 받아들일 때만 평가, 키워드 인자는 extra 필드로도 기록됨
+            end_msg = "종료"
+            args = ()
+            kwargs = {}
+            if log_result:
+                end_msg += " result={}"
+                args = (lambda: render(result, max_length, as_str=True),)
+            if log_time:
+                elapsed = time.time() - start_time
+                end_msg += " elapsed={elapsed:.3f}s"
+                kwargs["elapsed"] = lambda: elapsed
+
+            if args or kwargs:
+                logger.opt(lazy=True).log(level, end_msg, *args, **kwargs)
+            else:
+                logger.log(level, end_msg)
+
         if is_async:
             # Async 함수용 wrapper
             @wraps(func)
             async def async_wrapper(*args, **kwargs) -> Any:
+                # 레벨이 걸러지고 프로파일러도 꺼져 있으면 컨텍스트 설정 없이 바로 실행
+                # (걸러진 레벨에서는 샘플러/요약기를 거치지 않음)
+                if level_no < _min_level_no and not profiler.enabled:
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception:
+                        _log_exception(class_name, func_id, "오류 발생")
+                        raise
+
                 token_class = _context_class_name.set(class_name)
                 token_func = _context_func_id.set(func_id)
+                profile_start = time.perf_counter() if profiler.enabled else None
 
                 try:
-                    # 시작 로그
-                    start_msg = "시작"
-                    if log_params:
-                        params = {}
-                        if is_method and args:
-                            param_args = args[1:]
-                        else:
-                            param_args = args
+                    # 레벨이 걸러지거나 샘플링에서 제외되면 메시지 생성 없이 실행만
+                    if level_no < _min_level_no or (sampler is not None and not sampler.should_log()):
+                        try:
+                            return await func(*args, **kwargs)
+                        except Exception:
+                            logger.exception("오류 발생")
+                            raise
+
+                    # 요약 모드: 호출별 로그 대신 주기적으로 호출 수/실행시간 요약
+                    if summary is not None:
+                        error = False
+                        call_start = time.perf_counter()
+                        try:
+                            return await func(*args, **kwargs)
+                        except Exception:
+                            error = True
+                            logger.exception("오류 발생")
+                            raise
+                        finally:
+                            message = summary.record(time.perf_counter() - call_start, error)
+                            if message is not None:
+                                logger.log(level, message)
 
-                        if param_args:
-                            params['args'] = param_args
-                        if kwargs:
-                            params['kwargs'] = kwargs
-
-                        if params:
-                            start_msg += f" params={params}"
-
-                    logger.log(level, start_msg)
+                    # 시작 로그
+                    log_start(args, kwargs)
 
                     # 실행
                     start_time = time.time() if log_time else None
@@ -150,14 +554,7 @@ def func_logging(
                         result = await func(*args, **kwargs)
 
                         # 종료 로그
-                        end_msg = "종료"
-                        if log_result:
-                            end_msg += f" result={result}"
-                        if log_time:
-                            elapsed = time.time() - start_time
-                            end_msg += f" elapsed={elapsed:.3f}s"
-
-                        logger.log(level, end_msg)
+                        log_end(result, start_time)
                         return result
 
                     except Exception:
@@ -165,6 +562,8 @@ def func_logging(
                         raise
 
                 finally:
+                    if profile_start is not None:
+                        profiler.record(func_id, time.perf_counter() - profile_start)
                     _context_class_name.reset(token_class)
                     _context_func_id.reset(token_func)
 
@@ -173,28 +572,45 @@ def func_logging(
             # 동기 함수용 wrapper
             @wraps(func)
             def sync_wrapper(*args, **kwargs) -> Any:
+                # 레벨이 걸러지고 프로파일러도 꺼져 있으면 컨텍스트 설정 없이 바로 실행
+                # (걸러진 레벨에서는 샘플러/요약기를 거치지 않음)
+                if level_no < _min_level_no and not profiler.enabled:
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception:
+                        _log_exception(class_name, func_id, "오류 발생")
+                        raise
+
                 token_class = _context_class_name.set(class_name)
                 token_func = _context_func_id.set(func_id)
+                profile_start = time.perf_counter() if profiler.enabled else None
 
                 try:
-                    # 시작 로그
-                    start_msg = "시작"
-                    if log_params:
-                        params = {}
-                        if is_method and args:
-                            param_args = args[1:]
-                        else:
-                            param_args = args
-
-                        if param_args:
-                            params['args'] = param_args
-                        if kwargs:
-                            params['kwargs'] = kwargs
-
-                        if params:
-                            start_msg += f" params={params}"
+                    # 레벨이 걸러지거나 샘플링에서 제외되면 메시지 생성 없이 실행만
+                    if level_no < _min_level_no or (sampler is not None and not sampler.should_log()):
+                        try:
+                            return func(*args, **kwargs)
+                        except Exception:
+                            logger.exception("오류 발생")
+                            raise
+
+                    # 요약 모드: 호출별 로그 대신 주기적으로 호출 수/실행시간 요약
+                    if summary is not None:
+                        error = False
+                        call_start = time.perf_counter()
+                        try:
+                            return func(*args, **kwargs)
+                        except Exception:
+                            error = True
+                            logger.exception("오류 발생")
+                            raise
+                        finally:
+                            message = summary.record(time.perf_counter() - call_start, error)
+                            if message is not None:
+                                logger.log(level, message)
 
-                    logger.log(level, start_msg)
+                    # 시작 로그
+                    log_start(args, kwargs)
 
                     # 실행
                     start_time = time.time() if log_time else None
@@ -202,14 +618,7 @@ def func_logging(
                         result = func(*args, **kwargs)
 
                         # 종료 로그
-                        end_msg = "종료"
-                        if log_result:
-                            end_msg += f" result={result}"
-                        if log_time:
-                            elapsed = time.time() - start_time
-                            end_msg += f" elapsed={elapsed:.3f}s"
-
-                        logger.log(level, end_msg)
+                        log_end(result, start_time)
                         return result
 
                     except Exception:
@@ -217,6 +626,8 @@ def func_logging(
                         raise
 
                 finally:
+                    if profile_start is not None:
+                        profiler.record(func_id, time.perf_counter() - profile_start)
                     _context_class_name.reset(token_class)
                     _context_func_id.reset(token_func)
 
@@ -234,7 +645,8 @@ def init_logging(
     _func: Optional[Callable] = None,
     *,
     level: str = "DEBUG",
-    log_params: bool = False
+    log_params: bool = False,
+    max_length: Optional[int] = None
 ) -> Callable:
     """__init__ 메서드 전용 로깅 데코레이터
 
@@ -250,29 +662,49 @@ def init_logging(
     Args:
         level: 로그 레벨
         log_params: 파라미터 로깅 여부
+        max_length: 파라미터 문자열 최대 길이. None이면 제한 없음
     """
     def decorator(func: Callable) -> Callable:
+        level_no = _level_no(level)
+        if _is_filtered(level_no):
+            return func
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
+            # 레벨이 걸러지고 프로파일러도 꺼져 있으면 컨텍스트 설정 없이 바로 실행
+            if level_no < _min_level_no and not profiler.enabled:
+                try:
+                    return func(*args, **kwargs)
+                except Exception:
+                    cls = args[0].__class__.__name__ if args else "Unknown"
+                    _log_exception(cls, f'{cls}.__init__', "초기화 오류")
+                    raise
+
             cls = args[0].__class__.__name__ if args else "Unknown"
             func_id = f'{cls}.__init__'
 
             # ContextVar 설정 (토큰 저장으로 nested call 안전)
             token_class = _context_class_name.set(cls)
             token_func = _context_func_id.set(func_id)
+            profile_start = time.perf_counter() if profiler.enabled else None
 
             try:
-                # 시작 로그
-                start_msg = "초기화 시작"
-                if log_params and (args[1:] or kwargs):
-                    params = {}
-                    if len(args) > 1:
-                        params['args'] = args[1:]
-                    if kwargs:
-                        params['kwargs'] = kwargs
-                    start_msg += f" params={params}"
+                # 레벨이 걸러지면 메시지 생성 없이 실행만
+                if level_no < _min_level_no:
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception:
+                        logger.exception("초기화 오류")
+                        raise
 
-                logger.log(level, start_msg)
+                # 시작 로그
+                params = _format_params(args[1:], kwargs) if log_params else None
+                if params:
+                    logger.opt(lazy=True).log(
+                        level, "초기화 시작 params={}", lambda: render(params, max_length)
+                    )
+                else:
+                    logger.log(level, "초기화 시작")
 
                 try:
                     result = func(*args, **kwargs)
@@ -283,6 +715,8 @@ def init_logging(
                     raise
 
             finally:
+                if profile_start is not None:
+                    profiler.record(func_id, time.perf_counter() - profile_start)
                 # 원래 컨텍스트로 복원 (nested call 대응)
                 _context_class_name.reset(token_class)
                 _context_func_id.reset(token_func)
@@ -297,7 +731,76 @@ def init_logging(
     return decorator
 
 
-# 기본 로거 설정 (모듈 임포트 시 자동 실행)
-configure_logger()
+# 종료 시 남은 요약 출력 후 비동기 큐에 남은 메시지 기록 (atexit는 역순 실행)
+atexit.register(_shutdown_sinks)
+atexit.register(flush_summaries)
+
+def configure_worker_logger(console_level: str = "WARNING") -> None:
+    """워커 프로세스용 경량 설정 (콘솔만, 로그 파일 없음)
+
+    사용법:
+        ProcessPoolExecutor(initializer=configure_worker_logger)
+    """
+    configure_logger(console_level=console_level, log_to_file=False)
+
+
+def _bootstrap_patcher(record) -> None:
+    """첫 로그 기록 시점에 기본 설정을 적용하는 loguru patcher
+
+    patcher는 핸들러 순회 전에 호출되므로, 여기서 설정한 핸들러가 현재 레코드부터 받는다.
+    """
+    if _configured:
+        return
+    with _bootstrap_lock:
+        if _configured:
+            return
+        configure_logger(**_default_config())
+
+
+def _install_bootstrap(remove_all: bool = True) -> None:
+    """설정 전 상태 구성: loguru 기본 stderr 핸들러 대신 패처만 동작하는 빈 핸들러 등록
+
+    Args:
+        remove_all: True면 loguru 기본 핸들러를 포함해 모든 핸들러 제거 (임포트 시점)
+    """
+    if remove_all:
+        logger.remove()
+    global _bootstrap_installed
+    _handler_ids.append(logger.add(sink=lambda msg: None, level=0, filter=lambda record: False))
+    logger.configure(patcher=_bootstrap_patcher)
+    _bootstrap_installed = True
+
+
+class _NoPatcher:
+    """patcher 해제용 빈 patcher
+
+    loguru 0.7의 configure는 patcher=None을 "변경 없음"으로 처리하므로 None으로는 해제할 수 없다.
+    loguru는 레코드마다 `if core.patcher:`로 확인하므로 거짓으로 평가되는 객체를 넣으면 호출 자체가 생략된다.
+    """
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __call__(self, record) -> None:
+        pass
+
+
+def _remove_bootstrap() -> None:
+    """설정 완료 후 지연 설정용 patcher 해제
+
+    설정 전에 설치한 patcher만 해제하므로, 이후 사용자가 logger.configure(patcher=...)로 지정한 patcher는 유지된다.
+    """
+    global _bootstrap_installed
+    if _bootstrap_installed:
+        logger.configure(patcher=_NoPatcher())
+        _bootstrap_installed = False
+
 
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_drop_inherited_handlers)
 
+# 기본 로거 설정: 기본은 첫 로그 기록 시 지연 설정 (SIMPLE_LOGGER_CONFIG=eager면 임포트 시 설정)
+if _config_mode == "eager":
+    configure_logger(**_default_config())
+else:
+    _install_bootstrap()
@@ -0,0 +1,131 @@
+"""멀티프로세스 로그 집계 - 자식 프로세스 레코드를 부모 프로세스의 sink 하나로 모은다"""
+
+import os
+import threading
+import multiprocessing
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+class QueueForwardSink:
+    """자식 프로세스용 loguru sink. 레코드를 피클 가능한 dict로 바꿔 큐에 넣는다.
+
+    직렬화/전송은 multiprocessing.Queue의 feeder 스레드가 담당하므로
+    호출 스레드는 파일 핸들 없이 버퍼에 추가만 한다.
+    """
+
+    def __init__(self, queue):
+        self._queue = queue
+        self._pid = os.getpid()
+
+    def __call__(self, message) -> None:
+        record = message.record
+        extra = {
+            key: value if isinstance(value, _PRIMITIVES) else str(value)
+            for key, value in record["extra"].items()
+        }
+        extra["pid"] = self._pid
+
+        exception = None
+        if record["exception"] is not None and record["exception"].type is not None:
+            # 트레이스백 객체는 피클할 수 없으므로 포맷된 메시지에 포함된 문자열로 전달
+            exception = str(message)[len(record["message"]):].strip() or None
+
+        self._queue.put({
+            "time": record["time"],
+            "level": record["level"].name,
+            "message": record["message"],
+            "name": record["name"],
+            "function": record["function"],
+            "line": record["line"],
+            "extra": extra,
+            "exception": exception,
+        })
+
+
+class LogListener:
+    """부모 프로세스에서 큐를 비우며 레코드를 현재 설정된 sink로 다시 기록하는 스레드"""
+
+    def __init__(self, queue):
+        self._queue = queue
+        self._thread = threading.Thread(target=self._run, name="simple-logger-listener", daemon=True)
+        self._received = 0
+
+    @property
+    def received(self) -> int:
+        """지금까지 처리한 레코드 수"""
+        return self._received
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """종료 신호를 보내고 큐에 남은 레코드를 모두 기록한 뒤 종료"""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self._emit(item)
+            except Exception as e:
+                logger.warning(f"원격 로그 기록 실패: {e}")
+            self._received += 1
+
+    @staticmethod
+    def _emit(item: Dict[str, Any]) -> None:
+        def patch(record):
+            record["time"] = item["time"]
+            record["name"] = item["name"]
+            record["function"] = item["function"]
+            record["line"] = item["line"]
+            record["extra"].update(item["extra"])
+
+        message = item["message"]
+        if item["exception"]:
+            message = f"{message}\n{item['exception']}"
+        logger.patch(patch).log(item["level"], message)
+
+
+_listener: Optional[LogListener] = None
+
+
+def start_log_listener(context=None):
+    """부모 프로세스에서 집계 리스너 시작
+
+    사용법:
+        queue = start_log_listener()
+        with ProcessPoolExecutor(initializer=configure_child_logger, initargs=(queue,)) as pool:
+            ...
+        stop_log_listener()
+
+    Args:
+        context: multiprocessing 컨텍스트. None이면 기본 컨텍스트
+
+    Returns:
+        자식 프로세스에 전달할 큐
+    """
+    global _listener
+    if _listener is not None:
+        raise RuntimeError("Log listener is already running")
+
+    ctx = context or multiprocessing.get_context()
+    queue = ctx.Queue()
+    _listener = LogListener(queue)
+    _listener.start()
+    return queue
+
+
+def stop_log_listener(timeout: Optional[float] = 5.0) -> None:
+    """리스너 종료 (큐에 남은 레코드는 모두 기록)"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop(timeout)
+    _listener = None
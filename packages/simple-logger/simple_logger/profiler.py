@@ -0,0 +1,206 @@
+"""데코레이터 기반 핫패스 프로파일러 - func_id별 호출 수/지연시간 집계"""
+
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+from .context import _context_fields
+
+# 로그 스케일 히스토그램 해상도 (2배 구간을 나누는 버킷 수, 상대오차 약 9%)
+_BUCKETS_PER_OCTAVE = 8
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+class _Stat:
+    """func_id 하나의 누적 통계 (스레드별로 따로 보관)"""
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets: Dict[int, int] = {}
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        if elapsed < self.min:
+            self.min = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        bucket = math.floor(math.log2(elapsed) * _BUCKETS_PER_OCTAVE) if elapsed > 0 else -10**9
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def merge(self, other: "_Stat") -> None:
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for bucket, n in list(other.buckets.items()):
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + n
+
+    def quantile(self, q: float) -> float:
+        """히스토그램 기반 분위수 추정 (버킷 상한값, max로 절삭)"""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return min(2 ** ((bucket + 1) / _BUCKETS_PER_OCTAVE), self.max)
+        return self.max
+
+
+class Profiler:
+    """func_logging/init_logging이 감싼 모든 호출의 지연시간을 프로세스 내에서 집계한다.
+
+    기록은 스레드별 테이블에 락 없이 누적하고, snapshot 시점에 합친다.
+    활성화는 enable() 또는 환경변수 SIMPLE_LOGGER_PROFILE=1로 한다.
+    group_by를 지정하면 bind_context() 필드 값별로 통계를 나눈다.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._group_by: Tuple[str, ...] = ()
+        self._local = threading.local()
+        self._tables = []
+        self._tables_lock = threading.Lock()
+
+    def enable(self, group_by: Optional[Sequence[str]] = None) -> None:
+        """프로파일링 시작
+
+        Args:
+            group_by: 통계를 나눌 컨텍스트 필드 이름 (예: ("gateway_name",)).
+                None이면 기존 설정 유지. 변경 시 누적값과 키가 섞이지 않도록 reset() 권장
+        """
+        if group_by is not None:
+            self._group_by = tuple(group_by)
+        self.enabled = True
+
+    def disable(self) -> None:
+        """프로파일링 중지 (누적값은 유지)"""
+        self.enabled = False
+
+    def record(self, func_id: str, elapsed: float) -> None:
+        """호출 1건의 실행시간(초) 기록"""
+        table = getattr(self._local, "table", None)
+        if table is None:
+            table = self._local.table = {}
+            with self._tables_lock:
+                self._tables.append(table)
+
+        key = func_id
+        if self._group_by:
+            fields = _context_fields.get()
+            key = (func_id,) + tuple(str(fields.get(name, "-")) for name in self._group_by)
+
+        stat = table.get(key)
+        if stat is None:
+            stat = table[key] = _Stat()
+        stat.add(elapsed)
+
+    def reset(self) -> None:
+        """모든 스레드의 누적값 초기화"""
+        with self._tables_lock:
+            for table in self._tables:
+                table.clear()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """func_id별 통계 스냅샷
+
+        Returns:
+            {key: {"count", "total", "mean", "min", "max", "p50", "p90", "p99"}}
+            key는 func_id, group_by 사용 시 "func_id|필드=값|..." 형식이며
+            이 경우 행에 func_id와 그룹 필드 값이 함께 포함된다. 시간 단위는 초
+        """
+        merged: Dict[object, _Stat] = {}
+        with self._tables_lock:
+            tables = list(self._tables)
+        for table in tables:
+            for key, stat in list(table.items()):
+                merged.setdefault(key, _Stat()).merge(stat)
+
+        result = {}
+        for key, stat in sorted(merged.items(), key=lambda item: str(item[0])):
+            if stat.count == 0:
+                continue
+            row = {}
+            if isinstance(key, tuple):
+                labels = dict(zip(self._group_by, key[1:]))
+                row["func_id"] = key[0]
+                row.update(labels)
+                key = "|".join([key[0]] + [f"{name}={value}" for name, value in labels.items()])
+            row.update({
+                "count": stat.count,
+                "total": stat.total,
+                "mean": stat.total / stat.count,
+                "min": stat.min,
+                "max": stat.max,
+            })
+            for q in QUANTILES:
+                row[f"p{int(q * 100)}"] = stat.quantile(q)
+            result[key] = row
+        return result
+
+    def to_dataframe(self):
+        """스냅샷을 func_id 인덱스의 pandas DataFrame으로 반환 (total 내림차순)"""
+        import pandas as pd
+
+        df = pd.DataFrame.from_dict(self.snapshot(), orient="index")
+        df.index.name = "key" if self._group_by else "func_id"
+        if not df.empty:
+            df = df.sort_values("total", ascending=False)
+        return df
+
+    def to_prometheus(self, path: Optional[str] = None, prefix: str = "simple_logger") -> str:
+        """Prometheus 텍스트 포맷으로 변환. path가 주어지면 원자적으로 파일에 기록
+
+        Args:
+            path: 출력 파일 경로 (node_exporter textfile collector 등). None이면 문자열만 반환
+            prefix: 메트릭 이름 접두사
+        """
+        snapshot = self.snapshot()
+        name = f"{prefix}_call_duration_seconds"
+        lines = [
+            f"# HELP {name} Latency of functions decorated with func_logging/init_logging.",
+            f"# TYPE {name} summary",
+        ]
+        labels = {key: self._labels(key, row) for key, row in snapshot.items()}
+        for key, row in snapshot.items():
+            label = labels[key]
+            for q in QUANTILES:
+                lines.append(f'{name}{{{label},quantile="{q}"}} {row[f"p{int(q * 100)}"]:.9f}')
+            lines.append(f'{name}_sum{{{label}}} {row["total"]:.9f}')
+            lines.append(f'{name}_count{{{label}}} {row["count"]}')
+
+        for stat in ("min", "max"):
+            gauge = f"{prefix}_call_duration_{stat}_seconds"
+            lines.append(f"# TYPE {gauge} gauge")
+            for key, row in snapshot.items():
+                lines.append(f'{gauge}{{{labels[key]}}} {row[stat]:.9f}')
+
+        text = "\n".join(lines) + "\n"
+        if path is not None:
+            target = Path(path)
+            tmp = target.with_name(f".{target.name}.tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, target)
+        return text
+
+    def _labels(self, key: str, row: dict) -> str:
+        """스냅샷 행을 Prometheus 라벨 문자열로 변환"""
+        pairs = [("func_id", row.get("func_id", key))]
+        pairs += [(field, row[field]) for field in self._group_by if field in row]
+        return ",".join(f'{field}="{_escape_label(str(value))}"' for field, value in pairs)
+
+
+profiler = Profiler(enabled=os.getenv("SIMPLE_LOGGER_PROFILE", "").lower() in ("1", "true", "yes"))
@@ -0,0 +1,166 @@
+"""비동기 큐 기반 sink - 로그 I/O를 백그라운드 스레드로 분리"""
+
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+OVERFLOW_POLICIES = ("drop_oldest", "block", "sample")
+
+
+class QueueSink:
+    """포맷된 메시지를 제한된 메모리 큐에 넣고 백그라운드 스레드가 배치로 기록한다.
+
+    호출 스레드는 큐 삽입만 수행하므로 콘솔/디스크 I/O에 블로킹되지 않는다.
+    큐가 가득 찼을 때의 동작은 overflow 정책으로 결정한다.
+
+    - drop_oldest: 가장 오래된 메시지를 버리고 새 메시지를 넣음
+    - block: 공간이 생길 때까지 호출 스레드 대기
+    - sample: 넘친 메시지 중 sample_rate개마다 1개만 (가장 오래된 것을 밀어내고) 보관
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        overflow: str = "drop_oldest",
+        batch_size: int = 256,
+        flush_interval: float = 0.1,
+        sample_rate: int = 10
+    ):
+        """
+        Args:
+            capacity: 큐 최대 크기
+            overflow: 큐가 가득 찼을 때 정책 ("drop_oldest" | "block" | "sample")
+            batch_size: 한 번에 꺼내 기록할 최대 메시지 수
+            flush_interval: 큐가 비어 있을 때 대기 주기 (초)
+            sample_rate: sample 정책에서 넘친 메시지 중 보관할 비율 (N개 중 1개)
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported overflow policy: {overflow}")
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive: {capacity}")
+
+        self._capacity = capacity
+        self._overflow = overflow
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._sample_rate = max(1, sample_rate)
+
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._overflowed = 0
+        self._batches = 0
+        self._in_flight = 0
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="simple-logger-queue", daemon=True)
+        self._thread.start()
+
+    def writer(self, target: Callable[[str], None]) -> Callable[[str], None]:
+        """target으로 전달될 메시지를 큐에 넣는 loguru sink 생성"""
+        def sink(message: str) -> None:
+            self.put(target, str(message))
+        return sink
+
+    def put(self, target: Callable[[str], None], message: str) -> None:
+        """메시지를 큐에 삽입. 큐가 가득 차면 overflow 정책을 따른다."""
+        with self._lock:
+            if self._closed:
+                self._dropped += 1
+                return
+
+            if len(self._queue) >= self._capacity:
+                self._overflowed += 1
+                if self._overflow == "block":
+                    while len(self._queue) >= self._capacity and not self._closed:
+                        self._not_full.wait()
+                    if self._closed:
+                        self._dropped += 1
+                        return
+                elif self._overflow == "sample" and self._overflowed % self._sample_rate != 0:
+                    self._dropped += 1
+                    return
+                else:
+                    self._queue.popleft()
+                    self._dropped += 1
+
+            self._queue.append((target, message))
+            self._enqueued += 1
+            self._not_empty.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """큐가 모두 기록될 때까지 대기. 시간 내 완료되면 True"""
+        with self._lock:
+            return self._idle.wait_for(
+                lambda: not self._queue and self._in_flight == 0,
+                timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """남은 메시지를 기록하고 백그라운드 스레드 종료"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        """큐 깊이와 누적 카운터 조회"""
+        with self._lock:
+            return {
+                "depth": len(self._queue),
+                "capacity": self._capacity,
+                "overflow": self._overflow,
+                "enqueued": self._enqueued,
+                "written": self._written,
+                "dropped": self._dropped,
+                "batches": self._batches,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue and not self._closed:
+                    self._not_empty.wait(self._flush_interval)
+                if not self._queue and self._closed:
+                    self._idle.notify_all()
+                    return
+
+                count = min(self._batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._in_flight = count
+                self._not_full.notify_all()
+
+            self._write_batch(batch)
+
+            with self._lock:
+                self._in_flight = 0
+                self._written += count
+                self._batches += 1
+                if not self._queue:
+                    self._idle.notify_all()
+
+    @staticmethod
+    def _write_batch(batch: list) -> None:
+        """같은 target으로 가는 연속 메시지를 묶어 한 번에 기록"""
+        start = 0
+        while start < len(batch):
+            target = batch[start][0]
+            end = start
+            while end < len(batch) and batch[end][0] is target:
+                end += 1
+            chunk = "".join(message for _, message in batch[start:end])
+            try:
+                target(chunk)
+            except Exception:
+                # 로깅 실패가 백그라운드 스레드를 죽이지 않도록 무시
+                pass
+            start = end
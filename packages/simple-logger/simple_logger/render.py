@@ -0,0 +1,101 @@
+"""파라미터/반환값 렌더링 - 요약기 레지스트리와 길이 제한"""
+
+from typing import Any, Callable, Dict, Optional, Union
+
+# 타입 -> 요약 함수. 키는 타입 객체 또는 "모듈.클래스명" 문자열
+# (문자열 키는 pandas/numpy를 임포트하지 않고도 등록하기 위함)
+_summarizers: Dict[Union[type, str], Callable[[Any], str]] = {}
+
+
+def register_summarizer(type_or_name: Union[type, str], summarizer: Callable[[Any], str]) -> None:
+    """특정 타입을 전체 repr 대신 요약 문자열로 로깅하도록 등록
+
+    Args:
+        type_or_name: 대상 타입 또는 "모듈.클래스명" 문자열 (예: "pandas.DataFrame")
+        summarizer: 값을 받아 요약 문자열을 반환하는 함수
+    """
+    _summarizers[type_or_name] = summarizer
+
+
+def _find_summarizer(value: Any) -> Optional[Callable[[Any], str]]:
+    if not _summarizers:
+        return None
+    for klass in type(value).__mro__:
+        summarizer = _summarizers.get(klass)
+        if summarizer is None:
+            summarizer = _summarizers.get(f"{klass.__module__}.{klass.__qualname__}")
+        if summarizer is not None:
+            return summarizer
+    return None
+
+
+def _render(value: Any, as_str: bool, budget: Optional[int]) -> str:
+    summarizer = _find_summarizer(value)
+    if summarizer is not None:
+        return summarizer(value)
+
+    # 서브클래스(namedtuple 등)는 고유 repr을 유지하도록 정확한 타입만 순회
+    value_type = type(value)
+    if value_type is dict:
+        items = ((f"{k!r}: ", v) for k, v in value.items())
+        return _render_items(items, "{", "}", budget)
+    if value_type is list:
+        return _render_items((("", v) for v in value), "[", "]", budget)
+    if value_type is tuple:
+        close = ",)" if len(value) == 1 else ")"
+        return _render_items((("", v) for v in value), "(", close, budget)
+
+    return str(value) if as_str else repr(value)
+
+
+def _render_items(items, open_: str, close: str, budget: Optional[int]) -> str:
+    """컨테이너 원소를 렌더링. budget을 넘으면 나머지 원소는 렌더링하지 않는다."""
+    parts = []
+    length = 0
+    for prefix, item in items:
+        if budget is not None and length > budget:
+            parts.append("...")
+            break
+        text = prefix + _render(item, False, budget)
+        parts.append(text)
+        length += len(text) + 2
+    return open_ + ", ".join(parts) + close
+
+
+def render(value: Any, max_length: Optional[int] = None, as_str: bool = False) -> str:
+    """로깅용 문자열 생성
+
+    등록된 요약기를 컨테이너 원소까지 적용하고, max_length를 넘으면 잘라낸다.
+
+    Args:
+        value: 렌더링할 값
+        max_length: 최대 문자열 길이. None이면 제한 없음
+        as_str: True면 최상위 값에 str(), False면 repr() 사용 (f-string 포맷과 동일)
+    """
+    text = _render(value, as_str, max_length)
+    if max_length is not None and len(text) > max_length:
+        text = f"{text[:max_length]}...(+{len(text) - max_length} chars)"
+    return text
+
+
+def _summarize_dataframe(df) -> str:
+    head = df.head(3).to_dict(orient="list")
+    return f"DataFrame(shape={df.shape}, columns={list(df.columns)}, head={head})"
+
+
+def _summarize_series(series) -> str:
+    return f"Series(name={series.name!r}, length={len(series)}, dtype={series.dtype}, head={series.head(3).tolist()})"
+
+
+def _summarize_ndarray(array) -> str:
+    return f"ndarray(shape={array.shape}, dtype={array.dtype}, head={array.ravel()[:3].tolist()})"
+
+
+# 기본 요약기 (pandas/numpy는 선택 의존성이므로 문자열 키로 등록)
+# pandas 2.x는 공개 클래스의 __module__을 "pandas"로 노출하므로 두 경로 모두 등록
+for _name in ("pandas.DataFrame", "pandas.core.frame.DataFrame"):
+    register_summarizer(_name, _summarize_dataframe)
+for _name in ("pandas.Series", "pandas.core.series.Series"):
+    register_summarizer(_name, _summarize_series)
+register_summarizer("numpy.ndarray", _summarize_ndarray)
+del _name
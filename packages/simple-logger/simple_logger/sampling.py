@@ -0,0 +1,104 @@
+"""고빈도 호출 지점용 샘플링/속도 제한/요약"""
+
+import time
+import threading
+from itertools import count
+from typing import Optional
+
+
+class CallSampler:
+    """호출 단위 로그 샘플러. N번 중 1번, 초당 최대 K번 조건을 함께 적용할 수 있다."""
+
+    def __init__(self, every: Optional[int] = None, max_per_second: Optional[float] = None):
+        """
+        Args:
+            every: N번 호출마다 1번 로깅. None이면 미적용
+            max_per_second: 초당 최대 로깅 횟수. None이면 미적용
+        """
+        if every is not None and every < 1:
+            raise ValueError(f"every must be >= 1: {every}")
+        if max_per_second is not None and max_per_second <= 0:
+            raise ValueError(f"max_per_second must be positive: {max_per_second}")
+
+        self._every = every
+        self._counter = count()
+        self._max_per_second = max_per_second
+        self._lock = threading.Lock()
+        self._window_start = 0.0
+        self._window_count = 0
+
+    def should_log(self) -> bool:
+        """이번 호출을 로깅할지 여부"""
+        if self._every is not None and next(self._counter) % self._every != 0:
+            return False
+
+        if self._max_per_second is not None:
+            now = time.monotonic()
+            with self._lock:
+                if now - self._window_start >= 1.0:
+                    self._window_start = now
+                    self._window_count = 0
+                if self._window_count >= self._max_per_second:
+                    return False
+                self._window_count += 1
+
+        return True
+
+
+class CallSummary:
+    """호출 수/실행시간을 누적하다가 interval마다 요약 한 줄로 내보낸다."""
+
+    def __init__(self, interval: float):
+        """
+        Args:
+            interval: 요약 출력 주기 (초)
+        """
+        if interval <= 0:
+            raise ValueError(f"interval must be positive: {interval}")
+
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._reset(time.monotonic())
+
+    def _reset(self, now: float) -> None:
+        self._window_start = now
+        self._calls = 0
+        self._errors = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def record(self, elapsed: float, error: bool = False) -> Optional[str]:
+        """호출 1건 누적. 주기가 지났으면 요약 메시지를 반환하고 누적값을 초기화"""
+        now = time.monotonic()
+        with self._lock:
+            self._calls += 1
+            self._total += elapsed
+            if elapsed > self._max:
+                self._max = elapsed
+            if error:
+                self._errors += 1
+
+            if now - self._window_start < self._interval:
+                return None
+
+            message = self._format(now)
+            self._reset(now)
+            return message
+
+    def drain(self) -> Optional[str]:
+        """누적된 호출이 있으면 요약 메시지를 반환하고 초기화 (종료 시 사용)"""
+        now = time.monotonic()
+        with self._lock:
+            if self._calls == 0:
+                return None
+            message = self._format(now)
+            self._reset(now)
+            return message
+
+    def _format(self, now: float) -> str:
+        avg_ms = self._total / self._calls * 1000
+        return (
+            f"요약 calls={self._calls} errors={self._errors} "
+            f"window={now - self._window_start:.1f}s total={self._total:.3f}s "
+            f"avg={avg_ms:.3f}ms max={self._max * 1000:.3f}ms"
+        )
@@ -0,0 +1,22 @@
+"""Pytest fixtures for simple-logger tests."""
+
+import pytest
+from simple_logger import configure_logger, profiler
+
+
+def _baseline() -> None:
+    """테스트 기본 설정: 파일 없이 콘솔 WARNING (첫 로그의 지연 설정이 ./logs를 만들지 않도록)"""
+    configure_logger(console_level="WARNING", log_to_file=False)
+
+
+_baseline()
+
+
+@pytest.fixture(autouse=True)
+def reset_logger():
+    """테스트가 바꾼 로거/프로파일러 전역 상태 복원"""
+    yield
+    _baseline()
+    profiler.enable(group_by=())
+    profiler.disable()
+    profiler.reset()
@@ -0,0 +1,52 @@
+"""요청 단위 상관관계 컨텍스트 테스트"""
+
+import asyncio
+from simple_logger import bind_context, get_context, configure_logger, logger
+
+
+class TestBindContext:
+    """bind_context 병합/복원/전파"""
+
+    def test_nested_merge_and_restore(self):
+        assert dict(get_context()) == {}
+
+        with bind_context(request_id="r1", symbol="BTC/USDT"):
+            with bind_context(symbol="ETH/USDT"):
+                assert dict(get_context()) == {"request_id": "r1", "symbol": "ETH/USDT"}
+            assert dict(get_context()) == {"request_id": "r1", "symbol": "BTC/USDT"}
+
+        assert dict(get_context()) == {}
+
+    def test_restored_on_exception(self):
+        try:
+            with bind_context(request_id="r1"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert dict(get_context()) == {}
+
+    def test_propagates_to_gathered_tasks(self):
+        """asyncio 하위 작업은 생성 시점 컨텍스트를 물려받고 서로 섞이지 않음"""
+        async def child():
+            await asyncio.sleep(0)
+            return get_context().get("request_id")
+
+        async def request(request_id):
+            with bind_context(request_id=request_id):
+                return await asyncio.gather(child(), child())
+
+        async def main():
+            return await asyncio.gather(request("a"), request("b"))
+
+        assert asyncio.run(main()) == [["a", "a"], ["b", "b"]]
+
+    def test_fields_added_to_records(self, capsys):
+        """블록 안 레코드의 extra에 필드 추가"""
+        configure_logger(console_level="INFO", log_to_file=False,
+                         format_string="{extra[request_id]} {message}")
+
+        with bind_context(request_id="r1"):
+            logger.info("inside")
+
+        assert capsys.readouterr().out == "r1 inside\n"
@@ -0,0 +1,149 @@
+"""JSON Lines 로그 기록/압축/읽기 테스트"""
+
+import gzip
+import os
+import threading
+from datetime import datetime, timedelta
+import pytest
+from simple_logger import configure_logger, func_logging, read_json_logs, logger
+from simple_logger import json_log
+from simple_logger.json_log import BackgroundCompressor
+
+
+@func_logging(level="INFO", log_time=True)
+def timed(x):
+    return x
+
+
+class TestJsonRoundTrip:
+    """file_format="json" 기록 → read_json_logs 읽기"""
+
+    def test_rotated_gzip_segments(self, tmp_path):
+        """로테이션되어 gzip 압축된 세그먼트까지 순서대로 읽음"""
+        configure_logger(log_dir=str(tmp_path), console_level="CRITICAL", file_level="DEBUG",
+                         file_format="json", rotation="2 KB", compression="gzip")
+        for i in range(100):
+            logger.bind(request_id=f"r{i % 2}").log("WARNING" if i % 10 == 0 else "INFO", f"message {i:03d}")
+
+        # 재설정 시 압축 작업을 기다린 뒤 파일 핸들러 정리
+        configure_logger(log_dir=str(tmp_path / "next"), console_level="WARNING")
+
+        names = sorted(path.name for path in tmp_path.iterdir())
+        assert any(name.endswith(".jsonl.gz") for name in names)
+        assert not any(name.endswith(".tmp") for name in names)
+        with gzip.open(tmp_path / next(name for name in names if name.endswith(".gz")), "rt") as f:
+            assert f.readline().startswith("{")
+
+        entries = list(read_json_logs(tmp_path))
+        assert [entry['message'] for entry in entries] == [f"message {i:03d}" for i in range(100)]
+        assert entries[1]['request_id'] == "r1"
+        assert entries[1]['level'] == "INFO"
+
+        assert len(list(read_json_logs(tmp_path, request_id="r0"))) == 50
+        assert [e['message'] for e in read_json_logs(tmp_path, level="WARNING")] == \
+            [f"message {i:03d}" for i in range(0, 100, 10)]
+
+    def test_time_window_and_extra_fields(self, tmp_path):
+        """since/until 필터와 데코레이터 extra(elapsed, func_id) 기록"""
+        configure_logger(log_dir=str(tmp_path), console_level="CRITICAL", file_format="json")
+        timed(1)
+        configure_logger(log_dir=str(tmp_path / "next"), console_level="WARNING")
+
+        entries = list(read_json_logs(tmp_path, func_id="timed"))
+        assert [entry['message'].split()[0] for entry in entries] == ["시작", "종료"]
+        assert isinstance(entries[1]['elapsed'], float)
+
+        now = datetime.now()
+        assert len(list(read_json_logs(tmp_path, since=now - timedelta(minutes=1)))) == 2
+        assert list(read_json_logs(tmp_path, until=(now - timedelta(minutes=1)).isoformat())) == []
+
+    def test_exception_recorded(self, tmp_path):
+        configure_logger(log_dir=str(tmp_path), console_level="CRITICAL", file_format="json")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        configure_logger(log_dir=str(tmp_path / "next"), console_level="WARNING")
+
+        entry = next(read_json_logs(tmp_path))
+        assert entry['level'] == "ERROR"
+        assert "ValueError: boom" in entry['exception']
+
+
+class TestBackgroundCompressor:
+
+    def test_compress_replaces_segment(self, tmp_path):
+        segment = tmp_path / "log.jsonl"
+        segment.write_text('{"message": "a"}\n', encoding="utf-8")
+
+        compressor = BackgroundCompressor("gzip")
+        compressor(str(segment))
+        compressor.close()
+
+        assert not segment.exists()
+        with gzip.open(tmp_path / "log.jsonl.gz", "rt", encoding="utf-8") as f:
+            assert f.read() == '{"message": "a"}\n'
+
+    def test_invalid_method(self):
+        with pytest.raises(ValueError):
+            BackgroundCompressor("bz2")
+
+    def test_retention_waits_for_compression(self, tmp_path, monkeypatch, capfd):
+        """압축이 멈춘 동안 로테이션이 반복돼도 임시 파일과 압축 중인 원본은 정리되지 않음"""
+        started = threading.Event()
+        release = threading.Event()
+        copy = json_log.shutil.copyfileobj
+
+        def blocking_copy(src, dst):
+            # 임시 파일에 다 쓴 뒤 닫기 전에 멈춤
+            copy(src, dst)
+            started.set()
+            release.wait(5)
+
+        monkeypatch.setattr(json_log.shutil, "copyfileobj", blocking_copy)
+        configure_logger(log_dir=str(tmp_path), console_level="CRITICAL", file_level="DEBUG",
+                         file_format="json", rotation="2 KB", retention=1, compression="gzip")
+        for i in range(30):
+            logger.info(f"message {i:03d}")
+        assert started.wait(5)
+
+        # 첫 세그먼트 압축 중에 로테이션 반복 (loguru retention이 켜져 있었다면 여기서 정리됨)
+        for i in range(30, 100):
+            logger.info(f"message {i:03d}")
+        in_flight = [name for name in os.listdir(tmp_path) if name.endswith(".gz.tmp")]
+        assert len(in_flight) == 1
+        assert (tmp_path / in_flight[0][:-len(".gz.tmp")]).exists()
+        assert len([name for name in os.listdir(tmp_path) if name.endswith(".jsonl")]) > 2
+
+        release.set()
+        configure_logger(log_dir=str(tmp_path / "next"), console_level="WARNING")
+
+        names = os.listdir(tmp_path)
+        assert not any(name.endswith(".tmp") for name in names)
+        assert len([name for name in names if name.endswith(".jsonl.gz")]) == 1
+        assert len([name for name in names if name.endswith(".jsonl")]) == 1
+        assert "Logging error" not in capfd.readouterr().err
+
+    def test_retention_duration(self, tmp_path):
+        """기간 retention은 압축 후 오래된 세그먼트만 삭제, 현재 파일은 제외"""
+        live = tmp_path / "log_a.jsonl"
+        old = tmp_path / "log_a.2024-01-01_00-00-00_000000.jsonl.gz"
+        segment = tmp_path / "log_a.2024-01-02_00-00-00_000000.jsonl"
+        for path in (live, old, segment):
+            path.write_text("{}\n", encoding="utf-8")
+        os.utime(live, (0, 0))
+        os.utime(old, (0, 0))
+
+        compressor = BackgroundCompressor("gzip", retention="1 week, 2 days", log_file=live)
+        compressor(str(segment))
+        compressor.close()
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "log_a.2024-01-02_00-00-00_000000.jsonl.gz", "log_a.jsonl"
+        ]
+
+    def test_invalid_retention(self, tmp_path):
+        with pytest.raises(ValueError):
+            BackgroundCompressor("gzip", retention="10 fortnights", log_file=tmp_path / "log.jsonl")
+        with pytest.raises(ValueError):
+            BackgroundCompressor("gzip", retention=3)
@@ -0,0 +1,234 @@
+"""로거 설정/데코레이터 테스트"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+import pytest
+from simple_logger import configure_logger, configure_worker_logger, func_logging, init_logging, logger
+
+
+def _run_fresh(code: str, cwd, **env) -> subprocess.CompletedProcess:
+    """새 인터프리터에서 코드 실행 (임포트 시점 동작 확인용)"""
+    environ = {key: value for key, value in os.environ.items() if not key.startswith("SIMPLE_LOGGER_")}
+    environ.update(env)
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        cwd=cwd, env=environ, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+@func_logging
+def debug_task(x):
+    return x
+
+
+@func_logging
+def debug_failure():
+    raise ValueError("boom")
+
+
+@func_logging
+async def async_failure():
+    raise ValueError("boom")
+
+
+@func_logging(level="INFO", log_params=True, log_result=True)
+def info_task(x, name=None):
+    return x + 1
+
+
+@func_logging(level="INFO")
+async def async_task(x):
+    return x
+
+
+class Service:
+
+    @init_logging(log_params=True)
+    def __init__(self, value):
+        self.value = value
+
+    @func_logging(level="INFO")
+    def run(self):
+        return self.value
+
+
+class BrokenService:
+
+    @init_logging
+    def __init__(self):
+        raise ValueError("boom")
+
+
+@pytest.fixture
+def console(capsys, tmp_path):
+    """콘솔 DEBUG 출력을 "func_id message" 형식으로 캡처"""
+    configure_logger(log_dir=str(tmp_path), console_level="DEBUG", format_string="{extra[func_id]} {message}")
+    capsys.readouterr()
+    return lambda: capsys.readouterr().out.splitlines()
+
+
+class TestBootstrap:
+    """지연 기본 설정 (첫 로그 기록 시 적용)"""
+
+    def test_lazy_until_first_record(self, tmp_path):
+        """임포트만으로는 로그 디렉토리를 만들지 않고, 첫 레코드부터 기본 설정으로 기록"""
+        result = _run_fresh("""
+            import os
+            import sys
+            from simple_logger import logger
+            module = sys.modules["simple_logger.logger"]
+            assert not module._configured
+            assert not os.path.exists("logs")
+            logger.info("first record")
+            assert module._configured
+            assert os.listdir("logs")
+        """, tmp_path)
+
+        assert "first record" in result.stdout
+
+    def test_patcher_removed_after_configure(self, tmp_path):
+        """첫 설정 후 지연 설정용 patcher는 해제되고, 사용자 patcher는 재설정 후에도 유지"""
+        result = _run_fresh("""
+            import sys
+            from simple_logger import configure_logger, logger
+            module = sys.modules["simple_logger.logger"]
+            logger.info("first record")
+            assert not module._bootstrap_installed
+
+            # patcher가 남아 있었다면 다음 레코드에서 기본 설정을 다시 적용함
+            module._configured = False
+            configure_calls = []
+            module.configure_logger = lambda **kwargs: configure_calls.append(kwargs)
+            logger.info("second record")
+            assert configure_calls == []
+
+            module.configure_logger = configure_logger
+            logger.configure(patcher=lambda record: record["extra"].update(tag="patched"))
+            configure_logger(log_to_file=False, format_string="{extra[tag]} {message}")
+            logger.info("third record")
+        """, tmp_path, SIMPLE_LOGGER_FILE="0")
+
+        assert "second record" in result.stdout
+        assert "patched third record" in result.stdout
+
+    def test_eager_mode(self, tmp_path):
+        _run_fresh("""
+            import sys
+            import simple_logger
+            assert sys.modules["simple_logger.logger"]._configured
+        """, tmp_path, SIMPLE_LOGGER_CONFIG="eager", SIMPLE_LOGGER_FILE="0")
+
+    def test_env_levels(self, tmp_path):
+        """SIMPLE_LOGGER_FILE=0이면 파일 없이, SIMPLE_LOGGER_CONSOLE_LEVEL로 콘솔 레벨 지정"""
+        result = _run_fresh("""
+            import os
+            from simple_logger import logger
+            logger.info("hidden")
+            logger.warning("shown")
+            assert not os.path.exists("logs")
+        """, tmp_path, SIMPLE_LOGGER_FILE="0", SIMPLE_LOGGER_CONSOLE_LEVEL="WARNING")
+
+        assert "hidden" not in result.stdout
+        assert "shown" in result.stdout
+
+
+class TestStaticFilter:
+    """SIMPLE_LOGGER_STATIC_FILTER: 걸러지는 레벨의 데코레이터는 원본 반환"""
+
+    CODE = """
+        from simple_logger import func_logging
+        def task():
+            pass
+        print(func_logging(task) is task)
+    """
+
+    def test_strips_when_no_sink_accepts_level(self, tmp_path):
+        result = _run_fresh(self.CODE, tmp_path, SIMPLE_LOGGER_STATIC_FILTER="1", SIMPLE_LOGGER_FILE="0")
+
+        assert result.stdout.strip() == "True"
+
+    def test_keeps_wrapper_for_default_debug_file_sink(self, tmp_path):
+        """기본 설정은 파일 sink가 DEBUG를 받으므로 래핑 유지"""
+        result = _run_fresh(self.CODE, tmp_path, SIMPLE_LOGGER_STATIC_FILTER="1")
+
+        assert result.stdout.strip() == "False"
+
+    def test_configure_before_decoration(self, tmp_path):
+        configure_logger(log_dir=str(tmp_path), console_level="INFO", file_level="INFO", static_filter=True)
+        try:
+            def task():
+                pass
+            assert func_logging(task) is task
+            assert func_logging(level="INFO")(task) is not task
+        finally:
+            configure_logger(log_dir=str(tmp_path), console_level="WARNING", static_filter=False)
+
+
+class TestFuncLogging:
+    """데코레이터 로깅"""
+
+    def test_start_and_end(self, console):
+        assert debug_task(3) == 3
+        assert console() == ["debug_task 시작", "debug_task 종료"]
+
+    def test_params_and_result(self, console):
+        assert info_task(1, name="a") == 2
+        assert console() == ["info_task 시작 params={'args': (1,), 'kwargs': {'name': 'a'}}",
+                             "info_task 종료 result=2"]
+
+    def test_method_and_init(self, console):
+        assert Service(5).run() == 5
+        assert console() == ["Service.__init__ 초기화 시작 params={'args': (5,)}", "Service.__init__ 초기화 완료",
+                             "Service.run 시작", "Service.run 종료"]
+
+    def test_async(self, console):
+        assert asyncio.run(async_task(7)) == 7
+        assert console() == ["async_task 시작", "async_task 종료"]
+
+    def test_filtered_level_skips_logging(self, capsys, tmp_path):
+        """레벨이 걸러지면 메시지 없이 원본 결과만 반환"""
+        configure_logger(log_dir=str(tmp_path), console_level="INFO", file_level="INFO",
+                         format_string="{extra[func_id]} {message}")
+
+        assert debug_task(3) == 3
+        assert capsys.readouterr().out == ""
+
+    def test_filtered_level_still_logs_exception(self, capsys, tmp_path):
+        """걸러진 레벨에서도 예외는 데코레이터 컨텍스트와 함께 기록 후 다시 발생"""
+        configure_logger(log_dir=str(tmp_path), console_level="INFO", file_level="INFO",
+                         format_string="{extra[func_id]} {message}")
+
+        with pytest.raises(ValueError):
+            debug_failure()
+
+        assert capsys.readouterr().out.splitlines()[0] == "debug_failure 오류 발생"
+
+    def test_filtered_async_and_init_exceptions(self, capsys):
+        """빠른 경로(async/init)도 예외 시에만 컨텍스트를 설정해 기록"""
+        configure_logger(console_level="INFO", log_to_file=False, format_string="{extra[func_id]} {message}")
+
+        with pytest.raises(ValueError):
+            asyncio.run(async_failure())
+        with pytest.raises(ValueError):
+            BrokenService()
+
+        lines = [line for line in capsys.readouterr().out.splitlines() if " 오류" in line]
+        assert lines == ["async_failure 오류 발생", "BrokenService.__init__ 초기화 오류"]
+
+    def test_worker_logger(self, capsys):
+        configure_worker_logger()
+        logger.info("hidden")
+        logger.warning("shown")
+
+        out = capsys.readouterr().out
+        assert "hidden" not in out
+        assert "shown" in out
+
+    def test_unsupported_file_format(self):
+        with pytest.raises(ValueError):
+            configure_logger(log_to_file=False, file_format="xml")
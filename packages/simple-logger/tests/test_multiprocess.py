@@ -0,0 +1,145 @@
+"""자식 프로세스 → 부모 리스너 로그 집계 테스트"""
+
+import multiprocessing
+import os
+import sys
+import pytest
+from simple_logger import (
+    configure_logger, configure_child_logger, start_log_listener, stop_log_listener,
+    bind_context, func_logging, read_json_logs, logger,
+)
+
+# 패키지가 logger를 재노출하므로 모듈은 sys.modules로 참조
+logger_module = sys.modules["simple_logger.logger"]
+
+
+@func_logging(level="INFO")
+def child_task(x):
+    return x * 2
+
+
+def _child(queue):
+    configure_child_logger(queue, "INFO")
+    with bind_context(request_id="child-req"):
+        logger.info("child hello")
+        child_task(21)
+    logger.debug("child debug")
+    try:
+        raise ValueError("child boom")
+    except ValueError:
+        logger.exception("child failed")
+
+
+class StopRecorder:
+    """stop()이 호출된 프로세스 id를 파일에 남기는 stream sink (loguru는 remove 시 stream의 stop을 호출)"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, message):
+        pass
+
+    def stop(self):
+        with open(self.path, "a") as f:
+            f.write(f"{os.getpid()}\n")
+
+
+def _forked_child(queue):
+    configure_child_logger(queue, "INFO")
+    logger.info("forked child")
+
+
+def _report_inherited(handler_ids, path):
+    # 부모가 등록한 핸들러 중 자식에 남아 있는 id 기록
+    remaining = []
+    for handler_id in handler_ids:
+        try:
+            logger.remove(handler_id)
+            remaining.append(handler_id)
+        except ValueError:
+            pass
+    with open(path, "w") as f:
+        f.write(f"{remaining} {logger_module._configured}")
+
+
+@pytest.fixture
+def json_parent(tmp_path):
+    """부모 프로세스: JSON 파일 sink + 집계 리스너"""
+    configure_logger(log_dir=str(tmp_path), console_level="CRITICAL", file_level="DEBUG", file_format="json")
+    yield tmp_path
+    stop_log_listener()
+
+
+class TestLogForwarding:
+
+    @pytest.mark.parametrize("method", ["fork", "spawn"])
+    def test_child_records_reach_parent_file(self, json_parent, method):
+        """자식 레코드가 pid/컨텍스트/데코레이터 필드와 함께 부모 파일에 기록"""
+        ctx = multiprocessing.get_context(method)
+        queue = start_log_listener(ctx)
+        process = ctx.Process(target=_child, args=(queue,))
+        process.start()
+        process.join(30)
+        assert process.exitcode == 0
+        stop_log_listener()
+
+        entries = list(read_json_logs(json_parent))
+        messages = [entry['message'] for entry in entries]
+        assert messages[:3] == ["child hello", "시작", "종료"]
+        assert "child debug" not in messages
+
+        hello = entries[0]
+        assert hello['pid'] == process.pid != os.getpid()
+        assert hello['request_id'] == "child-req"
+        assert entries[1]['func_id'] == "child_task"
+        assert entries[1]['request_id'] == "child-req"
+
+        failed = next(entry for entry in entries if entry['message'].startswith("child failed"))
+        assert failed['level'] == "ERROR"
+        assert "ValueError: child boom" in failed['message']
+
+    def test_listener_already_running(self, json_parent):
+        start_log_listener()
+        with pytest.raises(RuntimeError):
+            start_log_listener()
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork unavailable")
+    def test_fork_child_does_not_stop_inherited_handlers(self, tmp_path):
+        """fork로 물려받은 핸들러는 자식에서 stop 없이 떼어냄 (부모 파일 닫기/압축 방지)"""
+        stops = tmp_path / "stops"
+        configure_logger(console_level="CRITICAL", log_to_file=False)
+        logger.add(StopRecorder(stops))
+
+        ctx = multiprocessing.get_context("fork")
+        queue = start_log_listener(ctx)
+        process = ctx.Process(target=_forked_child, args=(queue,))
+        process.start()
+        process.join(30)
+        stop_log_listener()
+
+        assert process.exitcode == 0
+        assert not stops.exists()
+
+        # 부모에서 재설정하면 정상적으로 stop
+        configure_logger(console_level="CRITICAL", log_to_file=False)
+        assert stops.read_text().split() == [str(os.getpid())]
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork unavailable")
+    def test_fork_drops_tracked_handlers(self, tmp_path):
+        """fork 직후 자식에서 simple_logger 핸들러가 제거되고 부모 파일은 압축되지 않음"""
+        configure_logger(log_dir=str(tmp_path), console_level="CRITICAL", rotation=None, compression="gzip")
+        handler_ids = list(logger_module._handler_ids)
+        logger.info("before fork")
+
+        report = tmp_path / "report"
+        process = multiprocessing.get_context("fork").Process(target=_report_inherited, args=(handler_ids, report))
+        process.start()
+        process.join(30)
+
+        assert process.exitcode == 0
+        assert report.read_text() == "[] False"
+        logger.info("after fork")
+        [log_file] = tmp_path.glob("log_*.log")
+        assert "after fork" in log_file.read_text(encoding="utf-8")
+        assert not list(tmp_path.glob("*.gz"))
+        configure_logger(console_level="CRITICAL", log_to_file=False)
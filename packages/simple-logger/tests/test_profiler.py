@@ -0,0 +1,122 @@
+"""프로파일러 집계/분위수/Prometheus 출력 테스트"""
+
+import threading
+import pytest
+from simple_logger import Profiler, profiler, bind_context, func_logging
+
+
+# 1ms ~ 1000ms 균등 분포 1000건: p50=0.5, p90=0.9, p99=0.99
+DURATIONS = [(i + 1) / 1000 for i in range(1000)]
+
+
+@func_logging
+def profiled(x):
+    return x
+
+
+def _filled() -> Profiler:
+    stats = Profiler(enabled=True)
+    for elapsed in DURATIONS:
+        stats.record("job", elapsed)
+    return stats
+
+
+class TestSnapshot:
+    """snapshot 집계"""
+
+    def test_counts_and_extremes(self):
+        """호출 수/합계/평균/최소/최대"""
+        row = _filled().snapshot()["job"]
+
+        assert row['count'] == 1000
+        assert row['total'] == pytest.approx(sum(DURATIONS))
+        assert row['mean'] == pytest.approx(sum(DURATIONS) / 1000)
+        assert row['min'] == pytest.approx(0.001)
+        assert row['max'] == pytest.approx(1.0)
+
+    def test_quantiles_against_known_distribution(self):
+        """히스토그램 분위수는 실제 값 이상, 버킷 해상도(약 9%) 이내"""
+        row = _filled().snapshot()["job"]
+
+        for key, expected in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+            assert expected <= row[key] <= expected * 2 ** (1 / 8) + 1e-12
+
+    def test_merges_thread_tables(self):
+        """스레드별 테이블을 snapshot 시점에 합침"""
+        stats = Profiler(enabled=True)
+        threads = [threading.Thread(target=lambda: [stats.record("job", 0.01) for _ in range(100)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert stats.snapshot()["job"]['count'] == 400
+
+    def test_reset(self):
+        stats = _filled()
+        stats.reset()
+
+        assert stats.snapshot() == {}
+
+    def test_group_by_context(self):
+        """group_by 필드 값별로 통계 분리"""
+        stats = Profiler(enabled=True)
+        stats.enable(group_by=("gateway_name",))
+        with bind_context(gateway_name="binance_spot"):
+            stats.record("job", 0.01)
+            stats.record("job", 0.02)
+        stats.record("job", 0.03)
+
+        snapshot = stats.snapshot()
+
+        assert snapshot["job|gateway_name=binance_spot"]['count'] == 2
+        assert snapshot["job|gateway_name=binance_spot"]['func_id'] == "job"
+        assert snapshot["job|gateway_name=-"]['count'] == 1
+
+
+class TestPrometheus:
+    """Prometheus 텍스트 포맷"""
+
+    def test_summary_lines(self):
+        text = _filled().to_prometheus()
+        lines = text.splitlines()
+
+        assert "# TYPE simple_logger_call_duration_seconds summary" in lines
+        assert any(line.startswith('simple_logger_call_duration_seconds{func_id="job",quantile="0.5"} ') for line in lines)
+        assert 'simple_logger_call_duration_seconds_count{func_id="job"} 1000' in lines
+        assert 'simple_logger_call_duration_max_seconds{func_id="job"} 1.000000000' in lines
+
+    def test_group_labels_and_escaping(self):
+        stats = Profiler(enabled=True)
+        stats.enable(group_by=("symbol",))
+        with bind_context(symbol='BTC"USDT'):
+            stats.record("job", 0.01)
+
+        assert 'simple_logger_call_duration_seconds_count{func_id="job",symbol="BTC\\"USDT"} 1' in stats.to_prometheus()
+
+    def test_write_file(self, tmp_path):
+        """path를 주면 같은 내용을 파일로 기록"""
+        stats = _filled()
+        path = tmp_path / "simple_logger.prom"
+
+        text = stats.to_prometheus(str(path), prefix="bench")
+
+        assert path.read_text(encoding="utf-8") == text
+        assert "bench_call_duration_seconds_sum" in text
+
+
+class TestDecoratorProfiling:
+    """func_logging 래퍼의 프로파일러 기록"""
+
+    def test_records_filtered_calls(self):
+        """프로파일러가 켜져 있으면 레벨로 걸러진 호출도 기록"""
+        profiler.enable()
+        for i in range(3):
+            profiled(i)
+
+        assert profiler.snapshot()["profiled"]['count'] == 3
+
+    def test_disabled_records_nothing(self):
+        profiled(1)
+
+        assert "profiled" not in profiler.snapshot()
@@ -0,0 +1,121 @@
+"""QueueSink 오버플로 정책 및 비동기 모드 테스트"""
+
+import threading
+import pytest
+from simple_logger import QueueSink, configure_logger, get_queue_stats, flush_logger, logger
+
+
+class BlockingTarget:
+    """첫 기록에서 release() 전까지 멈추는 target (백그라운드 스레드를 붙잡아 큐를 가득 채우기 위함)"""
+
+    def __init__(self):
+        self.lines = []
+        self.started = threading.Event()
+        self._released = threading.Event()
+
+    def __call__(self, chunk: str) -> None:
+        self.started.set()
+        self._released.wait(5)
+        self.lines.extend(chunk.splitlines())
+
+    def release(self) -> None:
+        self._released.set()
+
+
+def _stalled_sink(capacity: int, overflow: str, **kwargs):
+    """백그라운드 스레드가 m0 기록 중에 멈춰 있고 큐는 비어 있는 QueueSink"""
+    sink = QueueSink(capacity=capacity, overflow=overflow, batch_size=1, **kwargs)
+    target = BlockingTarget()
+    sink.put(target, "m0\n")
+    assert target.started.wait(5)
+    return sink, target
+
+
+class TestOverflowPolicies:
+    """큐가 가득 찼을 때 정책별 동작과 카운터"""
+
+    def test_drop_oldest(self):
+        """가장 오래된 메시지를 버리고 새 메시지 보관"""
+        sink, target = _stalled_sink(2, "drop_oldest")
+        for i in range(1, 5):
+            sink.put(target, f"m{i}\n")
+
+        assert sink.stats()['depth'] == 2
+        assert sink.stats()['dropped'] == 2
+
+        target.release()
+        assert sink.flush(5)
+        sink.close()
+
+        assert target.lines == ["m0", "m3", "m4"]
+        stats = sink.stats()
+        assert (stats['enqueued'], stats['written'], stats['dropped']) == (5, 3, 2)
+
+    def test_sample(self):
+        """넘친 메시지 중 sample_rate개마다 1개만 (가장 오래된 것을 밀어내고) 보관"""
+        sink, target = _stalled_sink(2, "sample", sample_rate=2)
+        for i in range(1, 6):
+            sink.put(target, f"m{i}\n")
+
+        target.release()
+        assert sink.flush(5)
+        sink.close()
+
+        # m3: 넘침 1번째 → 버림, m4: 2번째 → m1을 밀어내고 보관, m5: 3번째 → 버림
+        assert target.lines == ["m0", "m2", "m4"]
+        assert sink.stats()['dropped'] == 3
+
+    def test_block(self):
+        """공간이 생길 때까지 호출 스레드 대기, 버리는 메시지 없음"""
+        sink, target = _stalled_sink(1, "block")
+        sink.put(target, "m1\n")
+
+        producer = threading.Thread(target=sink.put, args=(target, "m2\n"))
+        producer.start()
+        producer.join(0.2)
+        assert producer.is_alive()
+
+        target.release()
+        producer.join(5)
+        assert not producer.is_alive()
+        assert sink.flush(5)
+        sink.close()
+
+        assert target.lines == ["m0", "m1", "m2"]
+        assert sink.stats()['dropped'] == 0
+
+    def test_put_after_close_is_dropped(self):
+        """종료 후 들어온 메시지는 버리고 카운트"""
+        sink = QueueSink(capacity=4)
+        sink.close()
+        sink.put(lambda chunk: None, "late\n")
+
+        assert sink.stats()['dropped'] == 1
+
+    def test_invalid_arguments(self):
+        """지원하지 않는 정책/용량은 ValueError"""
+        with pytest.raises(ValueError):
+            QueueSink(overflow="unknown")
+        with pytest.raises(ValueError):
+            QueueSink(capacity=0)
+
+
+class TestAsyncMode:
+    """configure_logger(async_mode=True) 큐 상태 조회"""
+
+    def test_get_queue_stats(self, capsys, tmp_path):
+        """비동기 모드에서만 큐 상태를 반환하고 flush 후 기록 수 반영"""
+        assert get_queue_stats() is None
+
+        configure_logger(log_dir=str(tmp_path), console_level="INFO", file_level="WARNING", async_mode=True,
+                         queue_capacity=100, format_string="{message}")
+        for i in range(10):
+            logger.info(f"async {i}")
+        assert flush_logger(timeout=5)
+
+        stats = get_queue_stats()
+        assert stats['capacity'] == 100
+        assert stats['overflow'] == "drop_oldest"
+        assert stats['depth'] == 0
+        assert stats['written'] == 10
+        assert capsys.readouterr().out.splitlines() == [f"async {i}" for i in range(10)]
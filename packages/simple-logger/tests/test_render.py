@@ -0,0 +1,58 @@
+"""파라미터/반환값 렌더링 테스트"""
+
+import pytest
+from simple_logger import configure_logger, func_logging, register_summarizer
+from simple_logger.render import render
+
+
+class Token:
+    pass
+
+
+register_summarizer(Token, lambda value: "Token(...)")
+
+
+@func_logging(level="INFO", log_params=True, log_result=True, max_length=20)
+def capped(values):
+    return values
+
+
+class TestRender:
+    """render 요약기/길이 제한"""
+
+    def test_matches_repr_without_summarizer(self):
+        value = {'args': (1, "a"), 'kwargs': {'name': [1.5, None]}}
+
+        assert render(value) == repr(value)
+        assert render((1,)) == "(1,)"
+        assert render("text", as_str=True) == "text"
+
+    def test_summarizer_applies_inside_containers(self):
+        assert render({'token': Token(), 'items': [Token()]}) == "{'token': Token(...), 'items': [Token(...)]}"
+
+    def test_max_length_truncates(self):
+        text = render(list(range(100)), max_length=10)
+
+        assert text.startswith("[0, 1, 2, ")
+        assert text.endswith(" chars)")
+        assert len(text) < 40
+
+    def test_dataframe_summary(self):
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({'close': range(1000)})
+
+        assert render(df) == "DataFrame(shape=(1000, 1), columns=['close'], head={'close': [0, 1, 2]})"
+
+
+class TestDecoratorRender:
+
+    def test_params_and_result_capped(self, capsys, tmp_path):
+        configure_logger(log_dir=str(tmp_path), console_level="INFO", format_string="{message}")
+
+        capped(list(range(100)))
+
+        start, end = capsys.readouterr().out.splitlines()
+        assert start.startswith("시작 params={'args': ([0, 1, ")
+        assert start.endswith(" chars)")
+        assert end.startswith("종료 result=[0, 1, ")
+        assert end.endswith(" chars)")
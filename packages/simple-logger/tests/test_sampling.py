@@ -0,0 +1,108 @@
+"""호출 샘플링/요약 테스트"""
+
+import time
+import pytest
+from simple_logger import configure_logger, func_logging, flush_summaries
+from simple_logger.sampling import CallSampler, CallSummary
+
+
+@func_logging(sample_every=5)
+def sampled(x):
+    return x
+
+
+@func_logging(summary_interval=60)
+def summarized():
+    return None
+
+
+class TestCallSampler:
+    """N번 중 1번, 초당 최대 K번 샘플링"""
+
+    def test_every(self):
+        """every=N이면 첫 호출부터 N번마다 1번"""
+        sampler = CallSampler(every=10)
+        decisions = [sampler.should_log() for _ in range(100)]
+
+        assert sum(decisions) == 10
+        assert [i for i, logged in enumerate(decisions) if logged] == list(range(0, 100, 10))
+
+    def test_max_per_second(self):
+        """1초 창 안에서는 max_per_second번까지만"""
+        sampler = CallSampler(max_per_second=5)
+
+        assert sum(sampler.should_log() for _ in range(100)) == 5
+
+    def test_every_and_max_per_second(self):
+        """두 조건을 함께 적용"""
+        sampler = CallSampler(every=2, max_per_second=3)
+
+        assert sum(sampler.should_log() for _ in range(100)) == 3
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            CallSampler(every=0)
+        with pytest.raises(ValueError):
+            CallSampler(max_per_second=0)
+
+
+class TestCallSummary:
+    """주기적 호출 요약"""
+
+    def test_record_within_interval_returns_none(self):
+        """주기 안에서는 누적만"""
+        summary = CallSummary(interval=60)
+
+        assert summary.record(0.01) is None
+        assert summary.record(0.03, error=True) is None
+
+    def test_record_after_interval_emits_and_resets(self):
+        """주기가 지나면 요약을 반환하고 누적값 초기화"""
+        summary = CallSummary(interval=0.05)
+        summary.record(0.002)
+        time.sleep(0.06)
+
+        message = summary.record(0.004, error=True)
+
+        assert "calls=2" in message
+        assert "errors=1" in message
+        assert "avg=3.000ms" in message
+        assert "max=4.000ms" in message
+        assert summary.drain() is None
+
+    def test_drain(self):
+        """누적된 호출이 있을 때만 요약 반환"""
+        summary = CallSummary(interval=60)
+        assert summary.drain() is None
+
+        summary.record(0.001)
+        assert "calls=1" in summary.drain()
+        assert summary.drain() is None
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            CallSummary(interval=0)
+
+
+class TestDecoratorSampling:
+    """func_logging 샘플링/요약 옵션"""
+
+    def test_sample_every(self, capsys, tmp_path):
+        """sample_every=N이면 N번 중 1번만 시작/종료 로깅"""
+        configure_logger(log_dir=str(tmp_path), console_level="DEBUG", format_string="{extra[func_id]} {message}")
+
+        assert [sampled(i) for i in range(10)] == list(range(10))
+        assert capsys.readouterr().out.splitlines() == ["sampled 시작", "sampled 종료"] * 2
+
+    def test_summary_interval(self, capsys, tmp_path):
+        """summary_interval이면 호출별 로그 대신 flush_summaries에서 요약 한 줄"""
+        configure_logger(log_dir=str(tmp_path), console_level="DEBUG", format_string="{extra[func_id]} {message}")
+
+        for _ in range(7):
+            summarized()
+        assert capsys.readouterr().out == ""
+
+        flush_summaries()
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 1
+        assert lines[0].startswith("summarized 요약 calls=7 errors=0")
@@ -238,3 +238,30 @@ class TestBaseThrottlerMultiConstraint:
         await throttler._check_and_wait(10)
         assert p1.window.remaining == 90   # 리셋
         assert p2.window.remaining == 90   # 만료 회복
+
+
+class TestBaseThrottlerProfiling:
+    """대기 시간 프로파일러 기록 테스트"""
+
+    @pytest.fixture
+    def enabled_profiler(self):
+        from simple_logger import profiler
+        profiler.reset()
+        profiler.enable()
+        yield profiler
+        profiler.disable()
+        profiler.reset()
+
+    async def test_records_wait_only_when_waited(self, enabled_profiler):
+        """대기 없이 통과하면 기록 없음, 대기하면 rate_limit_wait에 대기 시간 기록"""
+        p1 = Pipeline("1s", FixedWindow(100, 1))
+        throttler = BaseThrottler(pipelines=[p1])
+
+        await throttler._check_and_wait(100)
+        assert "BaseThrottler.rate_limit_wait" not in enabled_profiler.snapshot()
+
+        await throttler._check_and_wait(50)
+
+        row = enabled_profiler.snapshot()["BaseThrottler.rate_limit_wait"]
+        assert row['count'] == 1
+        assert row['total'] > 0
@@ -0,0 +1,39 @@
+"""
+BinanceSpotThrottler tests
+"""
+import pytest
+from unittest.mock import Mock
+from simple_logger import profiler
+from throttled_api.core.Pipeline import Pipeline
+from throttled_api.core.window.FixedWindow import FixedWindow
+from throttled_api.providers.binance.BinanceSpotThrottler import BinanceSpotThrottler
+
+pytestmark = pytest.mark.anyio(backends=["asyncio"])
+
+
+@pytest.fixture
+def enabled_profiler():
+    profiler.reset()
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+
+
+class TestBinanceSpotThrottlerOrders:
+    """_check_orders 테스트"""
+
+    async def test_records_order_limit_wait(self, enabled_profiler):
+        """주문 제한으로 대기하면 order_limit_wait에 대기 시간 기록"""
+        throttler = BinanceSpotThrottler(client=Mock())
+        throttler.order_pipelines = [Pipeline("ORDERS_1S", FixedWindow(2, 1))]
+
+        await throttler._check_orders(2)
+        assert "BinanceSpotThrottler.order_limit_wait" not in enabled_profiler.snapshot()
+
+        await throttler._check_orders(1)
+
+        row = enabled_profiler.snapshot()["BinanceSpotThrottler.order_limit_wait"]
+        assert row['count'] == 1
+        assert row['total'] > 0
+        assert throttler.order_pipelines[0].window.remaining == 1
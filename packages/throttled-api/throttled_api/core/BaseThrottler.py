@@ -3,7 +3,7 @@ BaseThrottler implementation
 """
 import asyncio
 from typing import List, Callable
-from simple_logger import logger, func_logging
+from simple_logger import logger, profiler
 from .Pipeline import Pipeline
 from .events import ThrottleEvent
 
@@ -37,9 +37,13 @@ class BaseThrottler:
         Soft rate limiting: 50% 이상 소진 시 점진적 딜레이
         Hard rate limiting: 용량 부족 시 리셋/만료까지 대기
 
+        요청마다 호출되는 경로라 데코레이터 로깅은 붙이지 않고,
+        실제로 대기한 경우에만 대기 시간을 프로파일러에 기록한다 (profiler가 켜져 있을 때).
+
         Args:
             cost: 요청 소모량
         """
+        waited = 0.0
         while True:
             # 모든 Pipeline의 대기 시간 계산 (soft + hard limit 모두 포함)
             wait_times = [p.wait_time(cost) for p in self.pipelines]
@@ -49,6 +53,7 @@ class BaseThrottler:
             if max_wait > 0:
                 logger.debug(f"Rate limit 대기: {max_wait:.3f}초 (cost={cost})")
                 await asyncio.sleep(max_wait)
+                waited += max_wait
                 continue
 
             # 대기 불필요 → consume 시도
@@ -60,6 +65,8 @@ class BaseThrottler:
                     # 모두 통과 → 모든 Pipeline에 차감
                     for pipeline in self.pipelines:
                         pipeline.consume(cost)
+                    if waited and profiler.enabled:
+                        profiler.record(f"{type(self).__name__}.rate_limit_wait", waited)
                     return
                 # can_send 실패 시 다음 루프에서 재계산
 
@@ -4,7 +4,7 @@ Binance Spot API Throttler
 BaseThrottler를 상속하여 Binance Spot API의 rate limit 관리
 """
 from typing import Any, Dict, Optional, Callable
-from simple_logger import init_logging, func_logging, logger
+from simple_logger import init_logging, logger, profiler
 from ...core.BaseThrottler import BaseThrottler
 from ...core.Pipeline import Pipeline
 from ...core.window.FixedWindow import FixedWindow
@@ -105,11 +105,13 @@ class BinanceSpotThrottler(
         주문 제한 체크 및 대기
 
         ORDERS 제한만 체크 (REQUEST_WEIGHT는 별도로 체크)
+        주문마다 호출되는 경로라 실제로 대기한 경우에만 대기 시간을 프로파일러에 기록한다.
 
         Args:
             order_count: 주문 개수 (기본 1)
         """
         import asyncio
+        waited = 0.0
         while True:
             # 모든 ORDERS Pipeline의 대기 시간 계산
             wait_times = [p.wait_time(order_count) for p in self.order_pipelines]
@@ -119,6 +121,7 @@ class BinanceSpotThrottler(
             if max_wait > 0:
                 logger.debug(f"Order rate limit 대기: {max_wait:.3f}초 (count={order_count})")
                 await asyncio.sleep(max_wait)
+                waited += max_wait
                 continue
 
             # 대기 불필요 → consume 시도
@@ -130,5 +133,7 @@ class BinanceSpotThrottler(
                     # 모두 통과 → 모든 Pipeline에 차감
                     for pipeline in self.order_pipelines:
                         pipeline.consume(order_count)
+                    if waited and profiler.enabled:
+                        profiler.record(f"{type(self).__name__}.order_limit_wait", waited)
                     return
                 # can_send 실패 시 다음 루프에서 재계산